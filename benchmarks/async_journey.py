@@ -0,0 +1,109 @@
+"""
+Async Journey Benchmark - Login to checkout in many concurrent sessions from one process
+
+Runs the checkout journey with the async page objects (pages/async_*.py) in N browser
+sessions at once. All sessions share one chromedriver process and a pool of keep-alive
+HTTP connections (utils/async_webdriver.py), and the event loop interleaves their waits.
+
+Usage:
+    python -m benchmarks.async_journey [--sessions 10] [--pool-size 32] [--headed]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from config.config import USERS, CHECKOUT_INFO, ASYNC_POOL_SIZE, ASYNC_SESSIONS
+from pages.async_login_page import AsyncLoginPage
+from pages.async_products_page import AsyncProductsPage
+from pages.async_cart_page import AsyncCartPage
+from pages.async_checkout_page import AsyncCheckoutPage
+from utils.async_webdriver import AsyncDriverFactory
+
+PRODUCT = "Sauce Labs Backpack"
+
+
+async def journey(driver):
+    """
+    Log in, add a product, check out
+
+    Args:
+        driver: AsyncWebDriver instance
+
+    Returns:
+        float: Journey seconds (without session start)
+    """
+    start = time.perf_counter()
+    user = USERS["standard"]
+
+    login_page = AsyncLoginPage(driver)
+    await login_page.open()
+    await login_page.login(user["username"], user["password"])
+
+    products_page = AsyncProductsPage(driver)
+    assert await products_page.is_page_loaded(), "Products page not loaded after login"
+    await products_page.add_product_to_cart_by_name(PRODUCT)
+    await products_page.click_cart_icon()
+
+    cart_page = AsyncCartPage(driver)
+    assert [item.name for item in await cart_page.get_cart_items()] == [PRODUCT]
+    await cart_page.click_checkout()
+
+    checkout_page = AsyncCheckoutPage(driver)
+    await checkout_page.fill_checkout_information(
+        CHECKOUT_INFO["first_name"], CHECKOUT_INFO["last_name"], CHECKOUT_INFO["postal_code"]
+    )
+    await checkout_page.click_continue()
+    await checkout_page.get_total()
+    await checkout_page.click_finish()
+    assert await checkout_page.is_checkout_complete(), "Checkout not completed"
+    return time.perf_counter() - start
+
+
+async def run(factory, sessions):
+    """
+    Start the sessions, run the journey in all of them and quit them
+
+    Returns:
+        list: Journey seconds or the exception of each session
+    """
+    drivers = await asyncio.gather(*(factory.new_session() for _ in range(sessions)), return_exceptions=True)
+    started = [driver for driver in drivers if not isinstance(driver, BaseException)]
+    try:
+        results = await asyncio.gather(*(journey(driver) for driver in started), return_exceptions=True)
+    finally:
+        await asyncio.gather(*(driver.quit() for driver in started), return_exceptions=True)
+        await factory.close()
+    return results + [driver for driver in drivers if isinstance(driver, BaseException)]
+
+
+def main():
+    """Run benchmark and print a summary"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=ASYNC_SESSIONS, help="Concurrent browser sessions")
+    parser.add_argument("--pool-size", type=int, default=ASYNC_POOL_SIZE,
+                        help="Keep-alive HTTP connections to chromedriver")
+    parser.add_argument("--headed", action="store_true", help="Show the browsers")
+    args = parser.parse_args()
+
+    factory = AsyncDriverFactory(headless=not args.headed, pool_size=args.pool_size)
+    factory.start()
+    start = time.perf_counter()
+    results = asyncio.run(run(factory, args.sessions))
+    wall = time.perf_counter() - start
+
+    durations = sorted(result for result in results if isinstance(result, float))
+    errors = [result for result in results if not isinstance(result, float)]
+    print(f"sessions: {args.sessions}  completed: {len(durations)}  failed: {len(errors)}  wall: {wall:.1f}s")
+    if durations:
+        print(f"journey seconds  min {durations[0]:.2f}  median {durations[len(durations) // 2]:.2f}  "
+              f"max {durations[-1]:.2f}")
+        print(f"journeys per minute: {len(durations) / wall * 60:.1f}")
+    if factory.pool:
+        print(f"HTTP requests: {factory.pool.requests} over {factory.pool.opened} connections")
+    for error in errors:
+        print(f"failed: {type(error).__name__}: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
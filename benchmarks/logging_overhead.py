@@ -0,0 +1,144 @@
+"""
+Logging Overhead Benchmark - Per-step cost of page object logging on the test thread
+
+Compares the previous setup (eager f-strings, synchronous console + file handlers, log_cli
+on) with queue-based logging and lazy arguments (utils/logger.py). Every scenario runs with
+the handlers pytest attaches to the root logger during a test (two capture handlers, its
+log file handler and, with log_cli, the live handler), configured from pytest.ini, as they
+format records on the test thread too. Each step also waits for a simulated WebDriver
+command, as real steps do; the reported overhead is the time above a run without logging.
+
+Usage:
+    python -m benchmarks.logging_overhead [--steps 2000] [--command-ms 1]
+"""
+import argparse
+import configparser
+import logging
+import os
+import sys
+import tempfile
+import time
+from _pytest.logging import DEFAULT_LOG_DATE_FORMAT, DEFAULT_LOG_FORMAT, LogCaptureHandler
+from config.config import PROJECT_ROOT
+from utils.logger import _formatter, start_queue_logging, stop_queue_logging
+
+LOCATOR = ("css selector", ".inventory_item_name")
+NAMES = [f"Sauce Labs Product {index}" for index in range(6)]
+
+
+def eager_step(logger):
+    """One page object step as logged before: f-strings built even when the level is disabled"""
+    logger.info(f"Clicked on element: {LOCATOR}")
+    logger.debug(f"Element found: {LOCATOR}")
+    logger.info(f"Product names: {NAMES}")
+
+
+def lazy_step(logger):
+    """The same step with lazy arguments (list demoted to DEBUG, as in ProductsPage)"""
+    logger.info("Clicked on element: %s", LOCATOR)
+    logger.debug("Element found: %s", LOCATOR)
+    logger.debug("Product names: %s", NAMES)
+
+
+def no_logging(logger):
+    """Baseline step without logging"""
+
+
+def measure(step, logger, steps, command_seconds):
+    """Microseconds per step on the calling thread, including the simulated command"""
+    start = time.perf_counter()
+    for _ in range(steps):
+        step(logger)
+        time.sleep(command_seconds)
+    return (time.perf_counter() - start) / steps * 1e6
+
+
+def pytest_log_levels():
+    """log_level and log_cli_level from pytest.ini (None = not set)"""
+    ini = configparser.ConfigParser(interpolation=None)
+    ini.read(PROJECT_ROOT / "pytest.ini")
+    return ini.get("pytest", "log_level", fallback=None), ini.get("pytest", "log_cli_level", fallback=None)
+
+
+def attach_pytest_handlers(log_level, log_cli_level):
+    """
+    Attach handlers equivalent to the ones pytest adds to the root logger while a test runs
+
+    Args:
+        log_level: Level of the capture and log file handlers (None = all records)
+        log_cli_level: Level of the live console handler (None = log_cli off)
+    """
+    root = logging.getLogger()
+    formatter = logging.Formatter(DEFAULT_LOG_FORMAT, DEFAULT_LOG_DATE_FORMAT)
+    # caplog and report section handlers, and the log_file handler (os.devnull unless set)
+    handlers = [LogCaptureHandler(), LogCaptureHandler(), logging.FileHandler(os.devnull)]
+    for handler in handlers:
+        handler.setLevel(log_level or logging.NOTSET)
+    if log_cli_level:
+        live = logging.StreamHandler(open(os.devnull, "w"))
+        live.setLevel(log_cli_level)
+        handlers.append(live)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+
+def synchronous_logger(log_file, level):
+    """Root logger with blocking console and file handlers (previous setup_logger / log_file)"""
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in (logging.StreamHandler(open(os.devnull, "w")), logging.FileHandler(log_file)):
+        handler.setFormatter(_formatter())
+        root.addHandler(handler)
+    return root
+
+
+def reset_root():
+    """Remove all handlers from the root logger"""
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    root.setLevel(logging.WARNING)
+
+
+def main():
+    """Run benchmark and print a comparison table"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=2000, help="Logged steps per scenario")
+    parser.add_argument("--command-ms", type=float, default=1.0,
+                        help="Simulated WebDriver command time per step (0 = tight loop)")
+    args = parser.parse_args()
+    command_seconds = args.command_ms / 1000
+    log_level, log_cli_level = pytest_log_levels()
+
+    logger = logging.getLogger("benchmark.page")
+    baseline = measure(no_logging, logger, args.steps, command_seconds)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for level in ("DEBUG", "INFO"):
+            # Previous pytest.ini: no log_level, log_cli on at INFO
+            synchronous_logger(os.path.join(directory, "sync.log"), level)
+            attach_pytest_handlers(None, "INFO")
+            results.append((f"sync handlers, eager f-strings, log_cli ({level})",
+                            measure(eager_step, logger, args.steps, command_seconds)))
+            reset_root()
+
+            for log_cli, name in ((None, "queue listener, lazy args"),
+                                  (log_cli_level, "queue listener, lazy args, -o log_cli=true")):
+                start_queue_logging(os.path.join(directory, f"queue_{level}.log"), level)
+                attach_pytest_handlers(log_level, log_cli)
+                results.append((f"{name} ({level})", measure(lazy_step, logger, args.steps, command_seconds)))
+                stop_queue_logging()
+                reset_root()
+
+    width = max(len(name) for name, _ in results)
+    print(f"pytest.ini: log_level={log_level} log_cli_level={log_cli_level}")
+    print(f"{'scenario':<{width}}  overhead us/step")
+    for name, micros in results:
+        print(f"{name:<{width}}  {micros - baseline:16.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,3 +33,28 @@ EDGE_OPTIONS = {
 
 # Supported browsers
 SUPPORTED_BROWSERS = ["chrome", "firefox", "edge"]
+
+# Lean page load profile (--lean-page-load) - resources blocked through DevTools
+LEAN_PROFILE = {
+    "blocked_url_patterns": [
+        # Images
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+        # Fonts
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        # Media
+        "*.mp4", "*.webm", "*.mp3", "*.ogg", "*.wav",
+        # Analytics and error reporting
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*backtrace.io*", "*optimizely.com*", "*segment.io*", "*hotjar.com*"
+    ],
+    "arguments": [
+        "--disable-remote-fonts",
+        "--autoplay-policy=user-gesture-required",
+        "--disable-background-networking"
+    ],
+    "prefs": {
+        "profile.default_content_setting_values.automatic_downloads": 2,
+        "profile.default_content_setting_values.media_stream": 2,
+        "profile.default_content_setting_values.geolocation": 2
+    }
+}
@@ -8,13 +8,41 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 SCREENSHOTS_DIR = PROJECT_ROOT / "screenshots"
 REPORTS_DIR = PROJECT_ROOT / "reports"
+DRIVER_CACHE_DIR = PROJECT_ROOT / ".driver_cache"  # Downloaded drivers, shared by all workers
 
-# Create directories if they don't exist
-SCREENSHOTS_DIR.mkdir(exist_ok=True)
-REPORTS_DIR.mkdir(exist_ok=True)
+# Directories are created when first written to, importing the config has no side effects
+
+# Local stand-in app (utils/local_app.py) - set SAUCEDEMO_LOCAL_APP=1 to test against it
+USE_LOCAL_APP = os.getenv("SAUCEDEMO_LOCAL_APP", "0") == "1"
+LOCAL_APP_HOST = "127.0.0.1"
+LOCAL_APP_PORT = int(os.getenv("SAUCEDEMO_LOCAL_APP_PORT", "8008"))
+LOCAL_APP_LATENCY_MS = {}  # Per-route response delay, e.g. {"/inventory.html": 200, "*": 20}
+LOCAL_APP_GLITCH_DELAY_MS = 5000  # Login delay of performance_glitch_user
 
 # Application URL
-BASE_URL = "https://www.saucedemo.com"
+if USE_LOCAL_APP:
+    BASE_URL = f"http://{LOCAL_APP_HOST}:{LOCAL_APP_PORT}"
+else:
+    BASE_URL = os.getenv("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com")
+
+# Cookie SauceDemo sets after a successful login (used for fast login)
+SESSION_COOKIE_NAME = "session-username"
+INVENTORY_URL = f"{BASE_URL}/inventory.html"
+CART_URL = f"{BASE_URL}/cart.html"
+CHECKOUT_STEP_ONE_URL = f"{BASE_URL}/checkout-step-one.html"
+
+# Client-side cart storage (localStorage key holding a JSON list of product ids)
+CART_STORAGE_KEY = "cart-contents"
+
+# Product ids, in the default "Name (A to Z)" display order
+PRODUCTS = {
+    "Sauce Labs Backpack": 4,
+    "Sauce Labs Bike Light": 0,
+    "Sauce Labs Bolt T-Shirt": 1,
+    "Sauce Labs Fleece Jacket": 5,
+    "Sauce Labs Onesie": 2,
+    "Test.allTheThings() T-Shirt (Red)": 3
+}
 
 # Test Users (Available on SauceDemo)
 USERS = {
@@ -41,6 +69,76 @@ IMPLICIT_WAIT = 10
 EXPLICIT_WAIT = 15
 PAGE_LOAD_TIMEOUT = 30
 
+# Test execution log (written by a background thread, one file per xdist worker merged at the end)
+LOG_FILE = REPORTS_DIR / "test_execution.log"
+LOG_FILE_LEVEL = "DEBUG"
+LOG_FORMAT = "%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Screenshots (written by a background thread, see utils/screenshots.py)
+SCREENSHOT_FORMAT = "png"  # "png" or "webp" (webp and downscaling need Pillow)
+SCREENSHOT_MAX_WIDTH = None  # Downscale wider screenshots to this width (None = full size)
+SCREENSHOT_QUALITY = 80  # WebP quality
+SCREENSHOT_QUEUE_SIZE = 16  # Screenshots waiting to be written before capturing blocks
+
+# Step timeline (per-test durations of page object actions, see utils/timeline.py)
+TIMELINE_FILE = REPORTS_DIR / "timeline.json"
+TIMELINE_SUMMARY_SIZE = 10  # Rows in the slowest steps / locators terminal summary
+
+# Fill login / checkout forms with one script call instead of keystrokes (--fast-fill)
+FAST_FILL = False
+
+# Browser metrics at page transitions (--browser-metrics, see utils/browser_metrics.py)
+BROWSER_METRICS_WAIT = 10  # Seconds to wait for a transition to land before capturing
+
+# What exceeding a @pytest.mark.budget does by default: "fail", "warn" or "off" (--budget-mode)
+BUDGET_MODE = "fail"
+
+# Journey benchmark (--benchmark, tests/test_benchmark.py)
+BENCHMARK_DIR = REPORTS_DIR / "benchmarks"  # Saved results, usable as --benchmark-baseline
+BENCHMARK_RUNS = 5  # Journey repetitions per user
+BENCHMARK_THRESHOLD_PCT = 20  # Allowed step p50 regression against the baseline
+BENCHMARK_USERS = ["standard", "performance"]  # USERS keys that can complete the journey
+
+# Timing history of every run (see utils/timing_db.py, python -m utils.timing_db --help)
+TIMING_DB = REPORTS_DIR / "timings.db"
+TIMING_DB_RUNS = 10  # Runs compared by "slower" and shown by "trend"
+TIMING_DB_SLOWDOWN_PCT = 20  # "slower" flags tests this much slower than their median
+
+# WebDriver command profiler (--profile-commands, see utils/command_profiler.py)
+COMMAND_PROFILE_SIZE = 15  # Rows per table in the summary
+COMMAND_LOOP_THRESHOLD = 5  # Same command on this many elements within one page object call is flagged
+
+# One Chrome shared by all workers, one window and browser context per test (--shared-browser)
+SHARED_BROWSER_PORT = 0  # Remote debugging port (0 = any free port)
+SHARED_BROWSER_SAMPLE_INTERVAL = 0.5  # Seconds between memory samples of the shared browser
+
+# Memory watchdog (utils/memory_watchdog.py): browser memory per test, recycling of pooled browsers
+MEMORY_SAMPLE_INTERVAL = 0.5  # Seconds between samples while a test runs
+MEMORY_LIMIT_MB = 1500  # Recycle a pooled browser using more than this after a test (0 = no limit, --memory-limit)
+MEMORY_LEAK_WINDOW = 5  # Tests the growth heuristic looks at
+MEMORY_LEAK_MB_PER_TEST = 25  # Recycle a pooled browser growing faster than this per test
+
+# Async WebDriver client and page objects (utils/async_webdriver.py, pages/async_*.py)
+ASYNC_POOL_SIZE = 32  # Keep-alive HTTP connections to chromedriver shared by all async sessions
+ASYNC_COMMAND_TIMEOUT = 120  # Seconds to wait for a chromedriver response (above PAGE_LOAD_TIMEOUT)
+ASYNC_POLL_INTERVAL = 0.1  # Seconds between checks of an async wait
+ASYNC_SESSIONS = 10  # Concurrent sessions of python -m benchmarks.async_journey
+
+# Rows per table in the --startup-profile summary
+STARTUP_PROFILE_SIZE = 15
+
+# Wait strategy for page objects: "polling" (WebDriverWait) or "observer" (in-page MutationObserver)
+WAIT_STRATEGY = "polling"
+
+# Driver pool - browsers kept alive between tests (--reuse-driver)
+DRIVER_POOL_MAX_USES = 25  # Recycle a browser after this many tests
+
+# Driver pre-provisioning - browsers launched in the background (--preprovision)
+DRIVER_PREPROVISION_DEPTH = 1  # Ready browsers kept queued per worker
+DRIVER_PREPROVISION_TIMEOUT = 60  # Max seconds to wait for the background launcher
+DRIVER_PREPROVISION_MAX_FAILURES = 3  # Consecutive failed launches before the launcher gives up
+
 # Checkout Test Data
 CHECKOUT_INFO = {
     "first_name": "John",
@@ -0,0 +1,277 @@
+"""
+Async Base Page - Common methods of the asyncio page objects (see utils/async_webdriver.py)
+
+Mirrors BasePage for drivers of AsyncWebDriver, so one process can run the same journeys in
+many sessions concurrently. Waits poll with asyncio.sleep and yield to the other sessions.
+"""
+import asyncio
+import time
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from config.config import EXPLICIT_WAIT, ASYNC_POLL_INTERVAL, BASE_URL, CART_STORAGE_KEY
+from pages.base_page import (SET_LOCAL_STORAGE_SCRIPT, is_app_url, count_script_args, fill_script_args,
+                             check_fill_result, cart_storage_value)
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBasePage:
+    """Base class for all async page objects"""
+
+    def __init__(self, driver):
+        """
+        Initialize base page
+
+        Args:
+            driver: AsyncWebDriver instance
+        """
+        self.driver = driver
+
+    async def wait_for(self, locator, condition, timeout=EXPLICIT_WAIT):
+        """
+        Wait for a condition on a locator
+
+        Args:
+            locator: Tuple of (By, value)
+            condition (str): visible, clickable, present_all, shown (any visible) or absent
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            AsyncWebElement for visible/clickable, list of AsyncWebElements for present_all, True otherwise
+
+        Raises:
+            TimeoutException: If the condition is not met in time
+        """
+        check = {
+            "visible": self._visible,
+            "clickable": self._clickable,
+            "present_all": self._present_all,
+            "shown": lambda locator: self._counted(locator, lambda count: count > 0),
+            "absent": lambda locator: self._counted(locator, lambda count: count == 0)
+        }[condition]
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                result = await check(locator)
+                if result:
+                    return result
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Timed out waiting for {condition}: {locator}")
+            await asyncio.sleep(ASYNC_POLL_INTERVAL)
+
+    async def _visible(self, locator):
+        """Element if displayed"""
+        element = await self.driver.find_element(*locator)
+        return element if await element.is_displayed() else None
+
+    async def _clickable(self, locator):
+        """Element if displayed and enabled"""
+        element = await self._visible(locator)
+        return element if element and await element.is_enabled() else None
+
+    async def _present_all(self, locator):
+        """All matching elements, if any"""
+        return await self.driver.find_elements(*locator)
+
+    async def _counted(self, locator, predicate):
+        """True if the number of visible matches satisfies predicate"""
+        return predicate(await self.count_now(locator, visible_only=True))
+
+    async def find_element(self, locator):
+        """
+        Find element with wait
+
+        Args:
+            locator: Tuple of (By, value)
+
+        Returns:
+            AsyncWebElement: Found element
+        """
+        try:
+            element = await self.wait_for(locator, "visible")
+            logger.debug("Element found: %s", locator)
+            return element
+        except TimeoutException:
+            logger.error("Element not found: %s", locator)
+            raise
+
+    async def find_elements(self, locator):
+        """
+        Find multiple elements
+
+        Args:
+            locator: Tuple of (By, value)
+
+        Returns:
+            list: Found AsyncWebElements, empty if none appeared in time
+        """
+        try:
+            elements = await self.wait_for(locator, "present_all")
+            logger.debug("Elements found: %s for %s", len(elements), locator)
+            return elements
+        except TimeoutException:
+            logger.error("Elements not found: %s", locator)
+            return []
+
+    async def read_all(self, script, *args):
+        """
+        Read a whole listing with a single script call, waiting until it is rendered
+
+        Args:
+            script: JavaScript returning a list (one entry per element)
+            *args: Script arguments
+
+        Returns:
+            list: Script result, or empty list if nothing rendered before the timeout
+        """
+        deadline = time.monotonic() + EXPLICIT_WAIT
+        while True:
+            rows = await self.driver.execute_script(script, *args)
+            if rows:
+                logger.debug("Read %s rows in one script call", len(rows))
+                return rows
+            if time.monotonic() >= deadline:
+                logger.error("Listing not found")
+                return []
+            await asyncio.sleep(ASYNC_POLL_INTERVAL)
+
+    async def click(self, locator):
+        """
+        Click on element
+
+        Args:
+            locator: Tuple of (By, value)
+        """
+        element = await self.wait_for(locator, "clickable")
+        await element.click()
+        logger.info("Clicked on element: %s", locator)
+
+    async def send_keys(self, locator, text):
+        """
+        Send keys to element
+
+        Args:
+            locator: Tuple of (By, value)
+            text: Text to send
+        """
+        element = await self.find_element(locator)
+        await element.clear()
+        await element.send_keys(text)
+        logger.info("Entered text in element: %s", locator)
+
+    async def fill_form(self, fields, verify=False):
+        """
+        Fill several inputs with one script call (as BasePage.fill_form with fast fill)
+
+        Args:
+            fields (dict): Text by locator, filled in order
+            verify (bool): Check that every field holds its text afterwards
+
+        Raises:
+            NoSuchElementException: If a field is missing (all fields are left untouched then)
+            InvalidElementStateException: If verification finds a field that did not take its text
+        """
+        await self.find_element(next(iter(fields)))
+        check_fill_result(fields, await self.driver.execute_script(*fill_script_args(fields)), verify)
+
+    async def get_text(self, locator):
+        """
+        Get text from element
+
+        Args:
+            locator: Tuple of (By, value)
+
+        Returns:
+            str: Element text
+        """
+        element = await self.find_element(locator)
+        text = await element.text()
+        logger.debug("Got text from element: %s = '%s'", locator, text)
+        return text
+
+    async def is_element_visible(self, locator, timeout=5):
+        """
+        Check if element is visible
+
+        Args:
+            locator: Tuple of (By, value)
+            timeout: Wait timeout in seconds
+
+        Returns:
+            bool: True if visible, False otherwise
+        """
+        try:
+            await self.wait_for(locator, "shown", timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    async def is_element_absent(self, locator, timeout=0):
+        """
+        Check that no visible element matches the locator
+
+        Args:
+            locator: Tuple of (By, value)
+            timeout: Seconds to wait for the element to go away (0 = check once)
+
+        Returns:
+            bool: True if absent, False otherwise
+        """
+        if not timeout:
+            return await self.count_now(locator, visible_only=True) == 0
+        try:
+            await self.wait_for(locator, "absent", timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    async def count_now(self, locator, visible_only=False):
+        """
+        Count matching elements with a single DOM query (no waiting)
+
+        Args:
+            locator: Tuple of (By, value)
+            visible_only: Only count visible elements
+
+        Returns:
+            int: Number of matching elements
+        """
+        count = await self.driver.execute_script(*count_script_args(locator, visible_only))
+        logger.debug("Counted %s elements for %s", count, locator)
+        return count
+
+    async def get_current_url(self):
+        """
+        Get current page URL
+
+        Returns:
+            str: Current URL
+        """
+        return await self.driver.current_url()
+
+    async def set_local_storage_item(self, key, value):
+        """
+        Write an item to the app's localStorage (navigates to the app first if needed)
+
+        Args:
+            key (str): Storage key
+            value (str): Storage value
+        """
+        if not is_app_url(await self.get_current_url()):
+            await self.driver.get(BASE_URL)
+        await self.driver.execute_script(SET_LOCAL_STORAGE_SCRIPT, key, value)
+        logger.debug("Set localStorage '%s' = '%s'", key, value)
+
+    async def set_cart_contents(self, product_names):
+        """
+        Replace the client-side cart with the given products (no UI interaction).
+        The page has to be (re)loaded for the app to pick up the new cart.
+
+        Args:
+            product_names (list): Product names as listed in PRODUCTS
+        """
+        await self.set_local_storage_item(CART_STORAGE_KEY, cart_storage_value(product_names))
+        logger.info("Seeded cart with: %s", product_names)
@@ -0,0 +1,43 @@
+"""
+Async Cart Page Object - CartPage for AsyncWebDriver sessions
+"""
+from pages.async_base_page import AsyncBasePage
+from pages.cart_page import CartPage, CartItem, READ_CART_SCRIPT
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCartPage(AsyncBasePage):
+    """Async Cart Page Object Class"""
+
+    # Locators (shared with CartPage)
+    PAGE_TITLE = CartPage.PAGE_TITLE
+    CHECKOUT_BUTTON = CartPage.CHECKOUT_BUTTON
+
+    async def is_page_loaded(self):
+        """
+        Check if cart page is loaded
+
+        Returns:
+            bool: True if page is loaded
+        """
+        return await self.is_element_visible(self.PAGE_TITLE)
+
+    async def get_cart_items(self):
+        """
+        Get all cart line items with a single script call
+
+        Returns:
+            list: List of CartItem records in display order
+        """
+        rows = await self.read_all(READ_CART_SCRIPT)
+        items = [CartItem(int(quantity), name, description, float(price.replace('$', '')), button_id)
+                 for quantity, name, description, price, button_id in rows]
+        logger.info("Read %s cart items", len(items))
+        return items
+
+    async def click_checkout(self):
+        """Click checkout button"""
+        await self.click(self.CHECKOUT_BUTTON)
+        logger.info("Clicked checkout button")
@@ -0,0 +1,71 @@
+"""
+Async Checkout Page Object - CheckoutPage for AsyncWebDriver sessions
+"""
+from pages.async_base_page import AsyncBasePage
+from pages.checkout_page import CheckoutPage
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCheckoutPage(AsyncBasePage):
+    """Async Checkout Page Object Class"""
+
+    # Locators (shared with CheckoutPage)
+    FIRST_NAME_INPUT = CheckoutPage.FIRST_NAME_INPUT
+    LAST_NAME_INPUT = CheckoutPage.LAST_NAME_INPUT
+    POSTAL_CODE_INPUT = CheckoutPage.POSTAL_CODE_INPUT
+    CONTINUE_BUTTON = CheckoutPage.CONTINUE_BUTTON
+    TOTAL = CheckoutPage.TOTAL
+    FINISH_BUTTON = CheckoutPage.FINISH_BUTTON
+    COMPLETE_HEADER = CheckoutPage.COMPLETE_HEADER
+
+    async def fill_checkout_information(self, first_name, last_name, postal_code):
+        """
+        Fill complete checkout information form
+
+        Args:
+            first_name (str): First name
+            last_name (str): Last name
+            postal_code (str): Postal code
+        """
+        logger.info("Filling checkout information")
+        await self.fill_form({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.POSTAL_CODE_INPUT: postal_code
+        })
+
+    async def click_continue(self):
+        """Click continue button"""
+        await self.click(self.CONTINUE_BUTTON)
+        logger.info("Clicked continue button")
+
+    async def get_total(self):
+        """
+        Get total amount
+
+        Returns:
+            float: Total amount
+        """
+        total_text = await self.get_text(self.TOTAL)
+        # Extract number from "Total: $32.39"
+        total = float(total_text.split('$')[1])
+        logger.info("Total: $%s", total)
+        return total
+
+    async def click_finish(self):
+        """Click finish button"""
+        await self.click(self.FINISH_BUTTON)
+        logger.info("Clicked finish button")
+
+    async def is_checkout_complete(self):
+        """
+        Check if checkout is complete
+
+        Returns:
+            bool: True if checkout is complete
+        """
+        is_complete = await self.is_element_visible(self.COMPLETE_HEADER)
+        logger.info("Checkout complete: %s", is_complete)
+        return is_complete
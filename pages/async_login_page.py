@@ -0,0 +1,93 @@
+"""
+Async Login Page Object - LoginPage for AsyncWebDriver sessions
+"""
+from pages.async_base_page import AsyncBasePage
+from pages.base_page import is_app_url
+from pages.login_page import LoginPage, session_cookie, is_inventory_url
+from config.config import BASE_URL, INVENTORY_URL
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """Async Login Page Object Class"""
+
+    # Locators (shared with LoginPage)
+    USERNAME_INPUT = LoginPage.USERNAME_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    ERROR_MESSAGE = LoginPage.ERROR_MESSAGE
+    INVENTORY_LIST = LoginPage.INVENTORY_LIST
+
+    async def open(self):
+        """Open the login page"""
+        await self.driver.get(BASE_URL)
+        logger.info("Opened login page")
+
+    async def login(self, username, password):
+        """
+        Perform login action
+
+        Args:
+            username (str): Username
+            password (str): Password
+        """
+        logger.info("Attempting login with username: %s", username)
+        await self.fill_form({self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password})
+        await self.click(self.LOGIN_BUTTON)
+        logger.info("Clicked login button")
+
+    async def fast_login(self, username, password):
+        """
+        Log in by setting the session cookie directly and opening the inventory page.
+        Falls back to UI login if the app does not accept the session.
+
+        Args:
+            username (str): Username
+            password (str): Password (only used by the UI fallback)
+
+        Returns:
+            bool: True if the user ended up logged in
+        """
+        logger.info("Fast login with username: %s", username)
+
+        # Cookies can only be set for the domain currently loaded
+        if not is_app_url(await self.get_current_url()):
+            await self.driver.get(BASE_URL)
+
+        await self.driver.add_cookie(session_cookie(username))
+        await self.driver.get(INVENTORY_URL)
+
+        if await self.is_logged_in():
+            logger.info("Fast login succeeded")
+            return True
+
+        logger.warning("Fast login not accepted for '%s', falling back to UI login", username)
+        await self.driver.delete_all_cookies()
+        await self.driver.get(BASE_URL)
+        await self.login(username, password)
+        return await self.is_logged_in()
+
+    async def is_logged_in(self):
+        """
+        Check if an authenticated session is active (inventory page is shown)
+
+        Returns:
+            bool: True if logged in
+        """
+        is_logged_in = is_inventory_url(await self.get_current_url()) and \
+            await self.is_element_visible(self.INVENTORY_LIST)
+        logger.info("Logged in: %s", is_logged_in)
+        return is_logged_in
+
+    async def get_error_message(self):
+        """
+        Get error message text
+
+        Returns:
+            str: Error message
+        """
+        error_text = await self.get_text(self.ERROR_MESSAGE)
+        logger.info("Error message: %s", error_text)
+        return error_text
@@ -0,0 +1,86 @@
+"""
+Async Products Page Object - ProductsPage for AsyncWebDriver sessions
+"""
+from selenium.webdriver.common.by import By
+from pages.async_base_page import AsyncBasePage
+from pages.products_page import ProductsPage, ProductItem, READ_PRODUCTS_SCRIPT
+from config.config import INVENTORY_URL
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncProductsPage(AsyncBasePage):
+    """Async Products Page Object Class"""
+
+    # Locators (shared with ProductsPage)
+    PAGE_TITLE = ProductsPage.PAGE_TITLE
+    CART_BADGE = ProductsPage.CART_BADGE
+    CART_ICON = ProductsPage.CART_ICON
+
+    async def is_page_loaded(self):
+        """
+        Check if products page is loaded
+
+        Returns:
+            bool: True if page is loaded
+        """
+        is_loaded = await self.is_element_visible(self.PAGE_TITLE)
+        logger.info("Products page loaded: %s", is_loaded)
+        return is_loaded
+
+    async def get_all_products(self):
+        """
+        Get all product cards with a single script call
+
+        Returns:
+            list: List of ProductItem records in display order
+        """
+        rows = await self.read_all(READ_PRODUCTS_SCRIPT)
+        products = [ProductItem(name, description, float(price.replace('$', '')), button_id, image_src)
+                    for name, description, price, button_id, image_src in rows]
+        logger.info("Read %s products", len(products))
+        return products
+
+    async def add_product_to_cart_by_name(self, product_name):
+        """
+        Add product to cart by name
+
+        Args:
+            product_name (str): Product name
+        """
+        button_id = f"add-to-cart-{product_name.lower().replace(' ', '-')}"
+        await self.click((By.ID, button_id))
+        logger.info("Added '%s' to cart", product_name)
+
+    async def get_cart_badge_count(self):
+        """
+        Get cart badge count
+
+        Returns:
+            int: Cart items count
+        """
+        # The badge is rendered with the cart link, see ProductsPage.get_cart_badge_count
+        if await self.is_element_visible(self.CART_ICON) and await self.count_now(self.CART_BADGE, visible_only=True):
+            count = int(await self.get_text(self.CART_BADGE))
+            logger.info("Cart badge count: %s", count)
+            return count
+        logger.info("Cart badge not visible (cart is empty)")
+        return 0
+
+    async def seed_cart(self, product_names):
+        """
+        Put products in the cart through browser storage and reload the products page
+
+        Args:
+            product_names (list): Product names as listed in PRODUCTS
+        """
+        await self.set_cart_contents(product_names)
+        await self.driver.get(INVENTORY_URL)
+        # The app renders the cart from storage after load, wait until it shows the seeded cart
+        await self.wait_for(self.CART_BADGE if product_names else ProductsPage.PRODUCT_ITEMS, "shown")
+
+    async def click_cart_icon(self):
+        """Click shopping cart icon"""
+        await self.click(self.CART_ICON)
+        logger.info("Clicked cart icon")
@@ -1,18 +1,115 @@
 """
 Base Page - Contains common methods for all page objects
+
+The module functions build commands and check their results for both BasePage and
+AsyncBasePage (pages/async_base_page.py), so the two only differ in how commands are sent.
 """
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from config.config import EXPLICIT_WAIT
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, InvalidElementStateException
+from config.config import EXPLICIT_WAIT, BASE_URL, CART_STORAGE_KEY, PRODUCTS, WAIT_STRATEGY, FAST_FILL
 from utils.helpers import take_screenshot
+from utils.dom import COUNT_SCRIPT, FILL_SCRIPT
+from utils.waits import ObserverWait
+from utils.timeline import Timeline, instrument
+import json
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+SET_LOCAL_STORAGE_SCRIPT = "window.localStorage.setItem(arguments[0], arguments[1]);"
+
+
+def is_app_url(url):
+    """
+    Check if a URL belongs to the app (cookies and localStorage can only be set there)
+
+    Args:
+        url (str): Current URL
+
+    Returns:
+        bool: True if the URL is a page of the app
+    """
+    return url.startswith(BASE_URL)
+
+
+def count_script_args(locator, visible_only):
+    """
+    execute_script arguments counting the matches of a locator
+
+    Args:
+        locator: Tuple of (By, value)
+        visible_only: Only count visible elements
+
+    Returns:
+        tuple: COUNT_SCRIPT and its arguments
+    """
+    by, value = locator
+    return COUNT_SCRIPT, by, value, visible_only
+
+
+def fill_script_args(fields):
+    """
+    execute_script arguments filling several inputs
+
+    Args:
+        fields (dict): Text by locator, filled in order
+
+    Returns:
+        tuple: FILL_SCRIPT and its argument
+    """
+    return FILL_SCRIPT, [[by, value, text] for (by, value), text in fields.items()]
+
+
+def check_fill_result(fields, result, verify):
+    """
+    Check the result of FILL_SCRIPT
+
+    Args:
+        fields (dict): Text by locator, as passed to fill_script_args
+        result (dict): Script result with the missing field indexes and the values afterwards
+        verify (bool): Check that every field holds its text
+
+    Raises:
+        NoSuchElementException: If a field is missing (all fields are left untouched then)
+        InvalidElementStateException: If verification finds a field that did not take its text
+    """
+    locators = list(fields)
+    if result["missing"]:
+        missing = [locators[index] for index in result["missing"]]
+        logger.error("Form fields not found: %s", missing)
+        raise NoSuchElementException(f"Form fields not found: {missing}")
+
+    if verify:
+        wrong = [locator for locator, value in zip(locators, result["values"]) if value != fields[locator]]
+        if wrong:
+            logger.error("Form fields did not take their value: %s", wrong)
+            raise InvalidElementStateException(f"Form fields did not take their value: {wrong}")
+    logger.info("Filled %s form fields in one script call", len(fields))
+
+
+def cart_storage_value(product_names):
+    """
+    localStorage value of a cart holding the given products
+
+    Args:
+        product_names (list): Product names as listed in PRODUCTS
+
+    Returns:
+        str: Value for CART_STORAGE_KEY
+    """
+    return json.dumps([PRODUCTS[name] for name in product_names])
+
 
 class BasePage:
-    """Base class for all page objects"""
+    """Base class for all page objects (public methods of all page objects are timed, see utils/timeline.py)"""
+
+    # "polling" (WebDriverWait) or "observer" (in-page MutationObserver, see utils/waits.py)
+    wait_strategy = WAIT_STRATEGY
+
+    # Fill forms with one script call instead of typing into each field (see fill_form)
+    fast_fill = FAST_FILL
 
     def __init__(self, driver):
         """
@@ -24,6 +121,46 @@ class BasePage:
         self.driver = driver
         self.wait = WebDriverWait(driver, EXPLICIT_WAIT)
 
+    def __init_subclass__(cls, **kwargs):
+        """Record public methods of every page object in the step timeline"""
+        super().__init_subclass__(**kwargs)
+        instrument(cls)
+
+    def wait_for(self, locator, condition, timeout=EXPLICIT_WAIT):
+        """
+        Wait for a condition on a locator using the configured wait strategy
+
+        Args:
+            locator: Tuple of (By, value)
+            condition (str): visible, clickable, present_all, shown (any visible) or absent
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            WebElement for visible/clickable, list of WebElements for present_all, True otherwise
+
+        Raises:
+            TimeoutException: If the condition is not met in time
+        """
+        start = time.perf_counter()
+        try:
+            if self.wait_strategy == "observer" and condition in ObserverWait.CONDITIONS:
+                return ObserverWait(self.driver, timeout).until(locator, condition)
+            return WebDriverWait(self.driver, timeout).until(self._polling_condition(locator, condition))
+        finally:
+            Timeline.add_wait(time.perf_counter() - start)
+
+    def _polling_condition(self, locator, condition):
+        """Expected condition for WebDriverWait matching a wait_for condition name"""
+        polling_conditions = {
+            "visible": EC.visibility_of_element_located,
+            "clickable": EC.element_to_be_clickable,
+            "present_all": EC.presence_of_all_elements_located,
+            # Queried by script so a missing element doesn't block on the implicit wait
+            "shown": lambda locator: lambda driver: self.count_now(locator, visible_only=True) > 0,
+            "absent": lambda locator: lambda driver: self.count_now(locator, visible_only=True) == 0
+        }
+        return polling_conditions[condition](locator)
+
     def find_element(self, locator):
         """
         Find element with wait
@@ -35,11 +172,11 @@ class BasePage:
             WebElement: Found element
         """
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
-            logger.debug(f"Element found: {locator}")
+            element = self.wait_for(locator, "visible")
+            logger.debug("Element found: %s", locator)
             return element
         except TimeoutException:
-            logger.error(f"Element not found: {locator}")
+            logger.error("Element not found: %s", locator)
             take_screenshot(self.driver, "element_not_found")
             raise
 
@@ -54,12 +191,34 @@ class BasePage:
             List[WebElement]: List of found elements
         """
         try:
-            elements = self.wait.until(EC.presence_of_all_elements_located(locator))
-            logger.debug(f"Elements found: {len(elements)} for {locator}")
+            elements = self.wait_for(locator, "present_all")
+            logger.debug("Elements found: %s for %s", len(elements), locator)
             return elements
         except TimeoutException:
-            logger.error(f"Elements not found: {locator}")
+            logger.error("Elements not found: %s", locator)
+            return []
+
+    def read_all(self, script, *args):
+        """
+        Read a whole listing with a single script call, waiting until it is rendered
+
+        Args:
+            script: JavaScript returning a list (one entry per element)
+            *args: Script arguments
+
+        Returns:
+            list: Script result, or empty list if nothing rendered before the timeout
+        """
+        start = time.perf_counter()
+        try:
+            rows = self.wait.until(lambda driver: driver.execute_script(script, *args) or False)
+            logger.debug("Read %s rows in one script call", len(rows))
+            return rows
+        except TimeoutException:
+            logger.error("Listing not found")
             return []
+        finally:
+            Timeline.add_wait(time.perf_counter() - start)
 
     def click(self, locator):
         """
@@ -68,9 +227,9 @@ class BasePage:
         Args:
             locator: Tuple of (By, value)
         """
-        element = self.wait.until(EC.element_to_be_clickable(locator))
+        element = self.wait_for(locator, "clickable")
         element.click()
-        logger.info(f"Clicked on element: {locator}")
+        logger.info("Clicked on element: %s", locator)
 
     def send_keys(self, locator, text):
         """
@@ -83,7 +242,29 @@ class BasePage:
         element = self.find_element(locator)
         element.clear()
         element.send_keys(text)
-        logger.info(f"Entered text in element: {locator}")
+        logger.info("Entered text in element: %s", locator)
+
+    def fill_form(self, fields, fast=None, verify=False):
+        """
+        Fill several inputs, either with one script call (fast) or by typing into each field
+
+        Args:
+            fields (dict): Text by locator, filled in order
+            fast (bool): Fill with one script call (None = use the fast_fill setting)
+            verify (bool): Check that every field holds its text afterwards (fast fill only)
+
+        Raises:
+            NoSuchElementException: If a field is missing (fast fill leaves all fields untouched then)
+            InvalidElementStateException: If verification finds a field that did not take its text
+        """
+        if not (self.fast_fill if fast is None else fast):
+            for locator, text in fields.items():
+                self.send_keys(locator, text)
+            return
+
+        # Wait for the form to render, then set all values in one round trip
+        self.find_element(next(iter(fields)))
+        check_fill_result(fields, self.driver.execute_script(*fill_script_args(fields)), verify)
 
     def get_text(self, locator):
         """
@@ -97,7 +278,7 @@ class BasePage:
         """
         element = self.find_element(locator)
         text = element.text
-        logger.debug(f"Got text from element: {locator} = '{text}'")
+        logger.debug("Got text from element: %s = '%s'", locator, text)
         return text
 
     def is_element_visible(self, locator, timeout=5):
@@ -112,13 +293,45 @@ class BasePage:
             bool: True if visible, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
-            )
+            self.wait_for(locator, "shown", timeout)
             return True
         except TimeoutException:
             return False
 
+    def is_element_absent(self, locator, timeout=0):
+        """
+        Check that no visible element matches the locator
+
+        Args:
+            locator: Tuple of (By, value)
+            timeout: Seconds to wait for the element to go away (0 = check once)
+
+        Returns:
+            bool: True if absent, False otherwise
+        """
+        if not timeout:
+            return self.count_now(locator, visible_only=True) == 0
+        try:
+            self.wait_for(locator, "absent", timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    def count_now(self, locator, visible_only=False):
+        """
+        Count matching elements with a single DOM query (no waiting)
+
+        Args:
+            locator: Tuple of (By, value)
+            visible_only: Only count visible elements
+
+        Returns:
+            int: Number of matching elements
+        """
+        count = self.driver.execute_script(*count_script_args(locator, visible_only))
+        logger.debug("Counted %s elements for %s", count, locator)
+        return count
+
     def get_current_url(self):
         """
         Get current page URL
@@ -146,7 +359,7 @@ class BasePage:
         """
         element = self.find_element(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        logger.debug(f"Scrolled to element: {locator}")
+        logger.debug("Scrolled to element: %s", locator)
 
     def select_from_dropdown_by_text(self, locator, text):
         """
@@ -160,7 +373,7 @@ class BasePage:
         element = self.find_element(locator)
         select = Select(element)
         select.select_by_visible_text(text)
-        logger.info(f"Selected '{text}' from dropdown: {locator}")
+        logger.info("Selected '%s' from dropdown: %s", text, locator)
 
     def get_attribute(self, locator, attribute):
         """
@@ -175,5 +388,32 @@ class BasePage:
         """
         element = self.find_element(locator)
         value = element.get_attribute(attribute)
-        logger.debug(f"Got attribute '{attribute}' = '{value}' from {locator}")
+        logger.debug("Got attribute '%s' = '%s' from %s", attribute, value, locator)
         return value
+
+    def set_local_storage_item(self, key, value):
+        """
+        Write an item to the app's localStorage (navigates to the app first if needed)
+
+        Args:
+            key (str): Storage key
+            value (str): Storage value
+        """
+        if not is_app_url(self.get_current_url()):
+            self.driver.get(BASE_URL)
+        self.driver.execute_script(SET_LOCAL_STORAGE_SCRIPT, key, value)
+        logger.debug("Set localStorage '%s' = '%s'", key, value)
+
+    def set_cart_contents(self, product_names):
+        """
+        Replace the client-side cart with the given products (no UI interaction).
+        The page has to be (re)loaded for the app to pick up the new cart.
+
+        Args:
+            product_names (list): Product names as listed in PRODUCTS
+        """
+        self.set_local_storage_item(CART_STORAGE_KEY, cart_storage_value(product_names))
+        logger.info("Seeded cart with: %s", product_names)
+
+
+instrument(BasePage)
@@ -1,13 +1,40 @@
 """
 Cart Page Object - Contains elements and methods for cart page
 """
+from typing import NamedTuple
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from pages.checkout_page import CheckoutPage
+from utils.browser_metrics import page_transition
+from config.config import CART_URL, CHECKOUT_STEP_ONE_URL
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class CartItem(NamedTuple):
+    """One line item on the cart page"""
+    quantity: int
+    name: str
+    description: str
+    price: float
+    button_id: str
+
+
+# Reads every cart line in one round trip: [quantity, name, description, price, button id]
+READ_CART_SCRIPT = """
+return Array.from(document.querySelectorAll('.cart_item'), function (item) {
+    var text = function (selector) {
+        var element = item.querySelector(selector);
+        return element ? element.innerText.trim() : '';
+    };
+    var button = item.querySelector('button');
+    return [text('.cart_quantity'), text('.inventory_item_name'), text('.inventory_item_desc'),
+            text('.inventory_item_price'), button ? button.id : ''];
+});
+"""
+
+
 class CartPage(BasePage):
     """Cart Page Object Class"""
 
@@ -34,7 +61,7 @@ class CartPage(BasePage):
             str: Page title
         """
         title = self.get_text(self.PAGE_TITLE)
-        logger.info(f"Cart page title: {title}")
+        logger.info("Cart page title: %s", title)
         return title
 
     def is_page_loaded(self):
@@ -55,9 +82,22 @@ class CartPage(BasePage):
         """
         items = self.find_elements(self.CART_ITEMS)
         count = len(items)
-        logger.info(f"Cart items count: {count}")
+        logger.info("Cart items count: %s", count)
         return count
 
+    def get_cart_items(self):
+        """
+        Get all cart line items with a single script call
+
+        Returns:
+            list: List of CartItem records in display order
+        """
+        rows = self.read_all(READ_CART_SCRIPT)
+        items = [CartItem(int(quantity), name, description, float(price.replace('$', '')), button_id)
+                 for quantity, name, description, price, button_id in rows]
+        logger.info("Read %s cart items", len(items))
+        return items
+
     def get_cart_item_names(self):
         """
         Get all cart item names
@@ -65,9 +105,8 @@ class CartPage(BasePage):
         Returns:
             list: List of product names in cart
         """
-        elements = self.find_elements(self.CART_ITEM_NAMES)
-        names = [element.text for element in elements]
-        logger.info(f"Cart item names: {names}")
+        names = [item.name for item in self.get_cart_items()]
+        logger.debug("Cart item names: %s", names)
         return names
 
     def get_cart_item_prices(self):
@@ -77,11 +116,32 @@ class CartPage(BasePage):
         Returns:
             list: List of prices
         """
-        elements = self.find_elements(self.CART_ITEM_PRICES)
-        prices = [float(element.text.replace('$', '')) for element in elements]
-        logger.info(f"Cart item prices: {prices}")
+        prices = [item.price for item in self.get_cart_items()]
+        logger.debug("Cart item prices: %s", prices)
         return prices
 
+    def seed_cart(self, product_names, start_checkout=False):
+        """
+        Put products in the cart through browser storage and open the cart page
+        (or the first checkout page) in a single navigation
+
+        Args:
+            product_names (list): Product names as listed in PRODUCTS
+            start_checkout (bool): Open checkout step one instead of the cart
+
+        Raises:
+            TimeoutException: If the opened page is not rendered in time
+        """
+        self.set_cart_contents(product_names)
+        url = CHECKOUT_STEP_ONE_URL if start_checkout else CART_URL
+        self.driver.get(url)
+        # The app renders the page and cart from storage after load, wait until it shows them
+        if start_checkout:
+            self.wait_for(CheckoutPage.FIRST_NAME_INPUT, "shown")
+        else:
+            self.wait_for(self.CART_ITEMS if product_names else self.CHECKOUT_BUTTON, "shown")
+        logger.info("Navigated to: %s", url)
+
     def remove_item_by_index(self, index):
         """
         Remove item from cart by index
@@ -92,9 +152,9 @@ class CartPage(BasePage):
         buttons = self.find_elements(self.REMOVE_BUTTONS)
         if index < len(buttons):
             buttons[index].click()
-            logger.info(f"Removed item {index} from cart")
+            logger.info("Removed item %s from cart", index)
         else:
-            logger.error(f"Item index {index} out of range")
+            logger.error("Item index %s out of range", index)
 
     def remove_item_by_name(self, product_name):
         """
@@ -106,13 +166,14 @@ class CartPage(BasePage):
         button_id = f"remove-{product_name.lower().replace(' ', '-')}"
         button_locator = (By.ID, button_id)
         self.click(button_locator)
-        logger.info(f"Removed '{product_name}' from cart")
+        logger.info("Removed '%s' from cart", product_name)
 
     def click_continue_shopping(self):
         """Click continue shopping button"""
         self.click(self.CONTINUE_SHOPPING_BUTTON)
         logger.info("Clicked continue shopping")
 
+    @page_transition("checkout")
     def click_checkout(self):
         """Click checkout button"""
         self.click(self.CHECKOUT_BUTTON)
@@ -125,7 +186,6 @@ class CartPage(BasePage):
         Returns:
             bool: True if cart is empty
         """
-        count = self.get_cart_items_count()
-        is_empty = count == 0
-        logger.info(f"Cart empty: {is_empty}")
+        is_empty = self.is_element_absent(self.CART_ITEMS)
+        logger.info("Cart empty: %s", is_empty)
         return is_empty
@@ -3,6 +3,7 @@ Checkout Page Object - Contains elements and methods for checkout pages
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.browser_metrics import page_transition
 import logging
 
 logger = logging.getLogger(__name__)
@@ -44,9 +45,20 @@ class CheckoutPage(BasePage):
             str: Page title
         """
         title = self.get_text(self.PAGE_TITLE)
-        logger.info(f"Checkout page title: {title}")
+        logger.info("Checkout page title: %s", title)
         return title
 
+    def is_page_loaded(self):
+        """
+        Check if checkout information page is loaded
+
+        Returns:
+            bool: True if page is loaded
+        """
+        is_loaded = self.is_element_visible(self.FIRST_NAME_INPUT)
+        logger.info("Checkout information page loaded: %s", is_loaded)
+        return is_loaded
+
     # Checkout Information Methods
     def enter_first_name(self, first_name):
         """
@@ -56,7 +68,7 @@ class CheckoutPage(BasePage):
             first_name (str): First name
         """
         self.send_keys(self.FIRST_NAME_INPUT, first_name)
-        logger.info(f"Entered first name: {first_name}")
+        logger.info("Entered first name: %s", first_name)
 
     def enter_last_name(self, last_name):
         """
@@ -66,7 +78,7 @@ class CheckoutPage(BasePage):
             last_name (str): Last name
         """
         self.send_keys(self.LAST_NAME_INPUT, last_name)
-        logger.info(f"Entered last name: {last_name}")
+        logger.info("Entered last name: %s", last_name)
 
     def enter_postal_code(self, postal_code):
         """
@@ -76,7 +88,7 @@ class CheckoutPage(BasePage):
             postal_code (str): Postal code
         """
         self.send_keys(self.POSTAL_CODE_INPUT, postal_code)
-        logger.info(f"Entered postal code: {postal_code}")
+        logger.info("Entered postal code: %s", postal_code)
 
     def fill_checkout_information(self, first_name, last_name, postal_code):
         """
@@ -88,10 +100,13 @@ class CheckoutPage(BasePage):
             postal_code (str): Postal code
         """
         logger.info("Filling checkout information")
-        self.enter_first_name(first_name)
-        self.enter_last_name(last_name)
-        self.enter_postal_code(postal_code)
+        self.fill_form({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.POSTAL_CODE_INPUT: postal_code
+        })
 
+    @page_transition("checkout_continue")
     def click_continue(self):
         """Click continue button"""
         self.click(self.CONTINUE_BUTTON)
@@ -110,7 +125,7 @@ class CheckoutPage(BasePage):
             str: Error message
         """
         error_text = self.get_text(self.ERROR_MESSAGE)
-        logger.info(f"Checkout error message: {error_text}")
+        logger.info("Checkout error message: %s", error_text)
         return error_text
 
     def is_error_displayed(self):
@@ -133,7 +148,7 @@ class CheckoutPage(BasePage):
         total_text = self.get_text(self.ITEM_TOTAL)
         # Extract number from "Item total: $29.99"
         total = float(total_text.split('$')[1])
-        logger.info(f"Item total: ${total}")
+        logger.info("Item total: $%s", total)
         return total
 
     def get_tax(self):
@@ -146,7 +161,7 @@ class CheckoutPage(BasePage):
         tax_text = self.get_text(self.TAX)
         # Extract number from "Tax: $2.40"
         tax = float(tax_text.split('$')[1])
-        logger.info(f"Tax: ${tax}")
+        logger.info("Tax: $%s", tax)
         return tax
 
     def get_total(self):
@@ -159,9 +174,10 @@ class CheckoutPage(BasePage):
         total_text = self.get_text(self.TOTAL)
         # Extract number from "Total: $32.39"
         total = float(total_text.split('$')[1])
-        logger.info(f"Total: ${total}")
+        logger.info("Total: $%s", total)
         return total
 
+    @page_transition("checkout_finish")
     def click_finish(self):
         """Click finish button"""
         self.click(self.FINISH_BUTTON)
@@ -176,7 +192,7 @@ class CheckoutPage(BasePage):
             str: Complete header text
         """
         header = self.get_text(self.COMPLETE_HEADER)
-        logger.info(f"Complete header: {header}")
+        logger.info("Complete header: %s", header)
         return header
 
     def get_complete_text(self):
@@ -187,7 +203,7 @@ class CheckoutPage(BasePage):
             str: Complete message text
         """
         text = self.get_text(self.COMPLETE_TEXT)
-        logger.info(f"Complete text: {text}")
+        logger.info("Complete text: %s", text)
         return text
 
     def is_checkout_complete(self):
@@ -198,7 +214,7 @@ class CheckoutPage(BasePage):
             bool: True if checkout is complete
         """
         is_complete = self.is_element_visible(self.COMPLETE_HEADER)
-        logger.info(f"Checkout complete: {is_complete}")
+        logger.info("Checkout complete: %s", is_complete)
         return is_complete
 
     def click_back_home(self):
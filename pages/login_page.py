@@ -2,12 +2,40 @@
 Login Page Object - Contains elements and methods for login page
 """
 from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from pages.base_page import BasePage, is_app_url
+from utils.browser_metrics import page_transition
+from config.config import BASE_URL, INVENTORY_URL, SESSION_COOKIE_NAME
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def session_cookie(username):
+    """
+    Session cookie the app sets after a login (shared with AsyncLoginPage)
+
+    Args:
+        username (str): Username
+
+    Returns:
+        dict: Cookie for add_cookie
+    """
+    return {"name": SESSION_COOKIE_NAME, "value": username, "path": "/"}
+
+
+def is_inventory_url(url):
+    """
+    Check if a URL is the inventory page, where logged in users land
+
+    Args:
+        url (str): Current URL
+
+    Returns:
+        bool: True on the inventory page
+    """
+    return INVENTORY_URL in url
+
+
 class LoginPage(BasePage):
     """Login Page Object Class"""
 
@@ -17,6 +45,7 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
     ERROR_CLOSE_BUTTON = (By.CSS_SELECTOR, ".error-button")
+    INVENTORY_LIST = (By.CLASS_NAME, "inventory_list")
 
     def __init__(self, driver):
         """Initialize Login Page"""
@@ -31,7 +60,7 @@ class LoginPage(BasePage):
             username (str): Username to enter
         """
         self.send_keys(self.USERNAME_INPUT, username)
-        logger.info(f"Entered username: {username}")
+        logger.info("Entered username: %s", username)
 
     def enter_password(self, password):
         """
@@ -43,6 +72,7 @@ class LoginPage(BasePage):
         self.send_keys(self.PASSWORD_INPUT, password)
         logger.info("Entered password")
 
+    @page_transition("login")
     def click_login_button(self):
         """Click login button"""
         self.click(self.LOGIN_BUTTON)
@@ -56,11 +86,52 @@ class LoginPage(BasePage):
             username (str): Username
             password (str): Password
         """
-        logger.info(f"Attempting login with username: {username}")
-        self.enter_username(username)
-        self.enter_password(password)
+        logger.info("Attempting login with username: %s", username)
+        self.fill_form({self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password})
         self.click_login_button()
 
+    def fast_login(self, username, password):
+        """
+        Log in by setting the session cookie directly and opening the inventory page.
+        Falls back to UI login if the app does not accept the session.
+
+        Args:
+            username (str): Username
+            password (str): Password (only used by the UI fallback)
+
+        Returns:
+            bool: True if the user ended up logged in
+        """
+        logger.info("Fast login with username: %s", username)
+
+        # Cookies can only be set for the domain currently loaded
+        if not is_app_url(self.get_current_url()):
+            self.driver.get(BASE_URL)
+
+        self.driver.add_cookie(session_cookie(username))
+        self.driver.get(INVENTORY_URL)
+
+        if self.is_logged_in():
+            logger.info("Fast login succeeded")
+            return True
+
+        logger.warning("Fast login not accepted for '%s', falling back to UI login", username)
+        self.driver.delete_all_cookies()
+        self.driver.get(BASE_URL)
+        self.login(username, password)
+        return self.is_logged_in()
+
+    def is_logged_in(self):
+        """
+        Check if an authenticated session is active (inventory page is shown)
+
+        Returns:
+            bool: True if logged in
+        """
+        is_logged_in = is_inventory_url(self.get_current_url()) and self.is_element_visible(self.INVENTORY_LIST)
+        logger.info("Logged in: %s", is_logged_in)
+        return is_logged_in
+
     def get_error_message(self):
         """
         Get error message text
@@ -69,7 +140,7 @@ class LoginPage(BasePage):
             str: Error message
         """
         error_text = self.get_text(self.ERROR_MESSAGE)
-        logger.info(f"Error message: {error_text}")
+        logger.info("Error message: %s", error_text)
         return error_text
 
     def is_error_displayed(self):
@@ -83,6 +154,6 @@ class LoginPage(BasePage):
 
     def close_error_message(self):
         """Close error message"""
-        if self.is_error_displayed():
+        if self.count_now(self.ERROR_CLOSE_BUTTON, visible_only=True):
             self.click(self.ERROR_CLOSE_BUTTON)
             logger.info("Closed error message")
@@ -1,13 +1,40 @@
 """
 Products Page Object - Contains elements and methods for products page
 """
+from typing import NamedTuple
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.browser_metrics import page_transition
+from config.config import INVENTORY_URL
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class ProductItem(NamedTuple):
+    """One product card on the products page"""
+    name: str
+    description: str
+    price: float
+    button_id: str
+    image_src: str
+
+
+# Reads every product card in one round trip: [name, description, price, button id, image src]
+READ_PRODUCTS_SCRIPT = """
+return Array.from(document.querySelectorAll('.inventory_item'), function (item) {
+    var text = function (selector) {
+        var element = item.querySelector(selector);
+        return element ? element.innerText.trim() : '';
+    };
+    var button = item.querySelector('button');
+    var image = item.querySelector('img');
+    return [text('.inventory_item_name'), text('.inventory_item_desc'), text('.inventory_item_price'),
+            button ? button.id : '', image ? image.src : ''];
+});
+"""
+
+
 class ProductsPage(BasePage):
     """Products Page Object Class"""
 
@@ -37,7 +64,7 @@ class ProductsPage(BasePage):
             str: Page title
         """
         title = self.get_text(self.PAGE_TITLE)
-        logger.info(f"Page title: {title}")
+        logger.info("Page title: %s", title)
         return title
 
     def is_page_loaded(self):
@@ -48,7 +75,7 @@ class ProductsPage(BasePage):
             bool: True if page is loaded
         """
         is_loaded = self.is_element_visible(self.PAGE_TITLE)
-        logger.info(f"Products page loaded: {is_loaded}")
+        logger.info("Products page loaded: %s", is_loaded)
         return is_loaded
 
     def sort_products(self, sort_option):
@@ -59,7 +86,7 @@ class ProductsPage(BasePage):
             sort_option (str): Sort option text
         """
         self.select_from_dropdown_by_text(self.PRODUCT_SORT_DROPDOWN, sort_option)
-        logger.info(f"Sorted products by: {sort_option}")
+        logger.info("Sorted products by: %s", sort_option)
 
     def get_product_count(self):
         """
@@ -70,9 +97,23 @@ class ProductsPage(BasePage):
         """
         products = self.find_elements(self.PRODUCT_ITEMS)
         count = len(products)
-        logger.info(f"Total products: {count}")
+        logger.info("Total products: %s", count)
         return count
 
+    def get_all_products(self):
+        """
+        Get all product cards with a single script call
+
+        Returns:
+            list: List of ProductItem records in display order
+        """
+        rows = self.read_all(READ_PRODUCTS_SCRIPT)
+        # Remove $ sign and convert to float
+        products = [ProductItem(name, description, float(price.replace('$', '')), button_id, image_src)
+                    for name, description, price, button_id, image_src in rows]
+        logger.info("Read %s products", len(products))
+        return products
+
     def get_all_product_names(self):
         """
         Get all product names
@@ -80,9 +121,8 @@ class ProductsPage(BasePage):
         Returns:
             list: List of product names
         """
-        elements = self.find_elements(self.PRODUCT_NAMES)
-        names = [element.text for element in elements]
-        logger.info(f"Product names: {names}")
+        names = [product.name for product in self.get_all_products()]
+        logger.debug("Product names: %s", names)
         return names
 
     def get_all_product_prices(self):
@@ -92,10 +132,8 @@ class ProductsPage(BasePage):
         Returns:
             list: List of prices as floats
         """
-        elements = self.find_elements(self.PRODUCT_PRICES)
-        # Remove $ sign and convert to float
-        prices = [float(element.text.replace('$', '')) for element in elements]
-        logger.info(f"Product prices: {prices}")
+        prices = [product.price for product in self.get_all_products()]
+        logger.debug("Product prices: %s", prices)
         return prices
 
     def add_product_to_cart_by_index(self, index):
@@ -108,9 +146,9 @@ class ProductsPage(BasePage):
         buttons = self.find_elements(self.ADD_TO_CART_BUTTONS)
         if index < len(buttons):
             buttons[index].click()
-            logger.info(f"Added product {index} to cart")
+            logger.info("Added product %s to cart", index)
         else:
-            logger.error(f"Product index {index} out of range")
+            logger.error("Product index %s out of range", index)
 
     def add_product_to_cart_by_name(self, product_name):
         """
@@ -123,7 +161,7 @@ class ProductsPage(BasePage):
         button_id = f"add-to-cart-{product_name.lower().replace(' ', '-')}"
         button_locator = (By.ID, button_id)
         self.click(button_locator)
-        logger.info(f"Added '{product_name}' to cart")
+        logger.info("Added '%s' to cart", product_name)
 
     def get_cart_badge_count(self):
         """
@@ -132,15 +170,34 @@ class ProductsPage(BasePage):
         Returns:
             int: Cart items count
         """
-        if self.is_element_visible(self.CART_BADGE, timeout=2):
+        # The badge is rendered with the cart link and updates synchronously on click, so once
+        # the link is shown (also right after a navigation) a single check is enough
+        if self.is_element_visible(self.CART_ICON) and self.count_now(self.CART_BADGE, visible_only=True):
             count_text = self.get_text(self.CART_BADGE)
             count = int(count_text)
-            logger.info(f"Cart badge count: {count}")
+            logger.info("Cart badge count: %s", count)
             return count
         else:
             logger.info("Cart badge not visible (cart is empty)")
             return 0
 
+    def seed_cart(self, product_names):
+        """
+        Put products in the cart through browser storage and reload the products page
+
+        Args:
+            product_names (list): Product names as listed in PRODUCTS
+
+        Raises:
+            TimeoutException: If the reloaded page does not show the cart in time
+        """
+        self.set_cart_contents(product_names)
+        self.driver.get(INVENTORY_URL)
+        # The app renders the cart from storage after load, wait until it shows the seeded cart
+        self.wait_for(self.CART_BADGE if product_names else self.PRODUCT_ITEMS, "shown")
+        logger.info("Navigated to: %s", INVENTORY_URL)
+
+    @page_transition("cart")
     def click_cart_icon(self):
         """Click shopping cart icon"""
         self.click(self.CART_ICON)
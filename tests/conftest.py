@@ -1,14 +1,43 @@
 """
 Pytest configuration and fixtures
+
+Driver, pool and local app modules are imported by the fixtures / hooks that need them,
+so collection and runs that don't start a browser don't pay for them.
 """
+from utils.import_profiler import ImportProfiler
+ImportProfiler.start_if_requested()  # Before the other imports, so --startup-profile measures them
+
 import pytest
-from utils.driver_factory import DriverFactory
-from config.config import BASE_URL
-from utils.helpers import take_screenshot
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from utils.timeline import Timeline, summarize
+from utils.browser_metrics import BrowserMetrics
+from utils.browser_state import BrowserSnapshot
+from config.config import (BASE_URL, DRIVER_POOL_MAX_USES, DRIVER_PREPROVISION_DEPTH, USERS, USE_LOCAL_APP,
+                           IMPLICIT_WAIT, WAIT_STRATEGY, TIMELINE_FILE, TIMELINE_SUMMARY_SIZE, SCREENSHOT_FORMAT,
+                           SCREENSHOT_MAX_WIDTH, LOG_FILE, FAST_FILL, MEMORY_LIMIT_MB)
+from utils.helpers import take_screenshot, attach_json
+from utils.screenshots import screenshot_writer
+from utils.logger import (start_queue_logging, stop_queue_logging, worker_log_file, merge_worker_logs,
+                          remove_worker_logs)
+import json
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+pytest_plugins = ["utils.duration_scheduler", "utils.startup_profile", "utils.benchmark", "utils.budget",
+                  "utils.timing_db", "utils.command_profiler"]
+
+provisioner_stats_key = pytest.StashKey[list]()
+local_app_key = pytest.StashKey["LocalApp"]()
+shared_browser_key = pytest.StashKey["SharedBrowser"]()
+# Set on a test item whose setup or call failed
+test_failed_key = pytest.StashKey[bool]()
+
+# User properties attached to the HTML report as JSON
+REPORT_EXTRAS = ("browser_metrics", "budget", "memory")
+
 
 def pytest_addoption(parser):
     """Add custom command line options"""
@@ -18,36 +47,501 @@ def pytest_addoption(parser):
         default=False,
         help="Run browser in headless mode"
     )
+    parser.addoption(
+        "--reuse-driver",
+        action="store_true",
+        default=False,
+        help="Keep browsers alive between tests and reset their state instead of relaunching"
+    )
+    parser.addoption(
+        "--driver-max-uses",
+        action="store",
+        type=int,
+        default=DRIVER_POOL_MAX_USES,
+        help="With --reuse-driver, recycle a browser after this many tests (0 = never)"
+    )
+    parser.addoption(
+        "--preprovision",
+        action="store",
+        type=int,
+        nargs="?",
+        const=DRIVER_PREPROVISION_DEPTH,
+        default=0,
+        help="Launch browsers in the background, keeping this many ready per worker (0 = off)"
+    )
+    parser.addoption(
+        "--app-latency",
+        action="store",
+        default="",
+        metavar="ROUTE=MS,...",
+        help='Per-route latency for the local app (SAUCEDEMO_LOCAL_APP=1), e.g. "/inventory.html=200,*=20"'
+    )
+    parser.addoption(
+        "--lean-page-load",
+        action="store_true",
+        default=False,
+        help="Block images, fonts, media and analytics (opt out per test with @pytest.mark.full_page_load)"
+    )
+    parser.addoption(
+        "--no-implicit-wait",
+        action="store_true",
+        default=False,
+        help="Disable the driver's implicit wait so lookups of absent elements return immediately"
+    )
+    parser.addoption(
+        "--wait-strategy",
+        action="store",
+        choices=["polling", "observer"],
+        default=WAIT_STRATEGY,
+        help="Page object waits: WebDriverWait polling, or an in-page MutationObserver"
+    )
+    parser.addoption(
+        "--fast-fill",
+        action="store_true",
+        default=FAST_FILL,
+        help="Fill login and checkout forms with one script call instead of typing (enter_* methods still type)"
+    )
+    parser.addoption(
+        "--browser-metrics",
+        action="store_true",
+        default=False,
+        help="Capture Navigation/Paint/Resource timings and Chrome metrics at page transitions"
+    )
+    parser.addoption(
+        "--shared-browser",
+        action="store_true",
+        default=False,
+        help="Run all workers' tests in one Chrome, each test in its own window and browser context"
+    )
+    parser.addoption(
+        "--memory-limit",
+        action="store",
+        type=float,
+        default=MEMORY_LIMIT_MB,
+        metavar="MB",
+        help="Recycle a pooled browser using more memory than this after a test (0 = no limit)"
+    )
+    parser.addoption(
+        "--no-memory-watchdog",
+        action="store_true",
+        default=False,
+        help="Do not sample browser memory per test or recycle browsers by memory"
+    )
+    parser.addoption(
+        "--no-checkpoints",
+        action="store_true",
+        default=False,
+        help="Build browser_checkpoint states through the app for every test instead of restoring snapshots"
+    )
+    parser.addoption(
+        "--screenshot-format",
+        action="store",
+        choices=["png", "webp"],
+        default=SCREENSHOT_FORMAT,
+        help="Screenshot file format (webp needs Pillow)"
+    )
+    parser.addoption(
+        "--screenshot-max-width",
+        action="store",
+        type=int,
+        default=SCREENSHOT_MAX_WIDTH,
+        help="Downscale screenshots wider than this many pixels (needs Pillow)"
+    )
 
 
-@pytest.fixture(scope="function")
-def driver(request):
+def pytest_configure(config):
+    """Start the log writer, prepare storage for per-worker statistics and start the local app if enabled"""
+    if config.getoption("--shared-browser") and config.getoption("--lean-page-load"):
+        # Windows opened through CDP get neither the URL blocking nor the performance log of the session
+        raise pytest.UsageError("--lean-page-load cannot be combined with --shared-browser")
+    if not hasattr(config, "workerinput"):
+        remove_worker_logs(LOG_FILE)
+    start_queue_logging(worker_log_file(LOG_FILE, os.environ.get("PYTEST_XDIST_WORKER", "main")))
+    config.stash[provisioner_stats_key] = []
+    BasePage.wait_strategy = config.getoption("--wait-strategy")
+    BasePage.fast_fill = config.getoption("--fast-fill")
+    screenshot_writer.image_format = config.getoption("--screenshot-format")
+    screenshot_writer.max_width = config.getoption("--screenshot-max-width")
+
+    # xdist workers use the app started by the controller
+    if USE_LOCAL_APP and not hasattr(config, "workerinput"):
+        from utils.local_app import LocalApp, parse_latency
+        app = LocalApp(latency=parse_latency(config.getoption("--app-latency")))
+        try:
+            app.start()
+            config.stash[local_app_key] = app
+        except OSError as e:
+            logger.warning("Could not start local app on %s (%s), assuming it is already running", BASE_URL, e)
+
+    # Started before the xdist workers, which find it through the environment
+    if config.getoption("--shared-browser") and not hasattr(config, "workerinput") \
+            and not config.getoption("--collect-only"):
+        from utils.shared_browser import SharedBrowser
+        browser = SharedBrowser(_driver_options(config))
+        browser.start()
+        config.stash[shared_browser_key] = browser
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_unconfigure(config):
+    """Write pending screenshots, quit the shared browser, stop the local app and write out the logs"""
+    screenshot_writer.close()
+    browser = config.stash.get(shared_browser_key, None)
+    if browser:
+        browser.stop()
+    app = config.stash.get(local_app_key, None)
+    if app:
+        app.stop()
+
+    # After session fixture teardown, so their log lines are kept. Workers have exited by now
+    # (xdist waits for them at the end of the session), the controller then merges their files
+    stop_queue_logging()
+    if not hasattr(config, "workerinput"):
+        merge_worker_logs(LOG_FILE)
+
+
+def _driver_options(config):
+    """Options for drivers launched in this session, from the command line"""
+    return {
+        "browser": "chrome",
+        "headless": config.getoption("--headless"),
+        "lean": config.getoption("--lean-page-load"),
+        "implicit_wait": 0 if config.getoption("--no-implicit-wait") else IMPLICIT_WAIT
+    }
+
+
+@pytest.fixture(scope="session")
+def driver_options(request):
     """
-    WebDriver fixture - creates and quits driver for each test
-    
+    Options used for every driver launched in this session
+
     Args:
         request: Pytest request object
-        
+
+    Returns:
+        dict: Keyword arguments for DriverFactory.get_driver
+    """
+    return _driver_options(request.config)
+
+
+@pytest.fixture(scope="session")
+def lean_profile(request):
+    """
+    Lean page load profile shared by all tests of a worker
+
+    Args:
+        request: Pytest request object
+
+    Returns:
+        LeanProfile: Profile, or None if --lean-page-load is off
+    """
+    if not request.config.getoption("--lean-page-load"):
+        return None
+    from utils.lean_profile import LeanProfile
+    return LeanProfile()
+
+
+@pytest.fixture(scope="session")
+def driver_provisioner(request, driver_options):
+    """
+    Session-scoped background driver launcher - one per worker process
+
+    Args:
+        request: Pytest request object
+        driver_options: Options for launched drivers
+
     Yields:
-        WebDriver: Browser driver instance
+        DriverProvisioner: Provisioner, or None if --preprovision is off
+    """
+    depth = request.config.getoption("--preprovision")
+    if not depth:
+        yield None
+        return
+
+    from utils.driver_pool import DriverProvisioner
+    provisioner = DriverProvisioner(driver_options=driver_options, depth=depth)
+    yield provisioner
+    provisioner.close()
+    stats = dict(provisioner.stats, worker=os.environ.get("PYTEST_XDIST_WORKER", "main"))
+    request.config.stash[provisioner_stats_key].append(stats)
+
+
+@pytest.fixture(scope="session")
+def memory_watchdog(request):
+    """
+    Session-scoped browser memory watchdog - one per worker process
+
+    Args:
+        request: Pytest request object
+
+    Yields:
+        MemoryWatchdog: Watchdog, or None if disabled (or with --shared-browser,
+        where the browser is not owned by the worker)
+    """
+    if request.config.getoption("--no-memory-watchdog") or request.config.getoption("--shared-browser"):
+        yield None
+        return
+
+    from utils.memory_watchdog import MemoryWatchdog
+    watchdog = MemoryWatchdog(limit_mb=request.config.getoption("--memory-limit"))
+    yield watchdog
+    watchdog.close()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_options, driver_provisioner, memory_watchdog):
+    """
+    Session-scoped driver pool - one per worker process
+
+    Args:
+        request: Pytest request object
+        driver_options: Options for launched drivers
+        driver_provisioner: Background launcher (None if disabled)
+        memory_watchdog: Memory watchdog (None if disabled)
+
+    Yields:
+        DriverPool: Pool of reusable browser drivers
+    """
+    from utils.driver_pool import DriverPool
+    pool = DriverPool(
+        driver_options=driver_options,
+        max_uses=request.config.getoption("--driver-max-uses"),
+        provisioner=driver_provisioner,
+        watchdog=memory_watchdog
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def shared_browser_client(request, driver_options):
     """
-    # Get headless option
-    headless = request.config.getoption("--headless")
+    This worker's session in the shared browser (--shared-browser)
+
+    Args:
+        request: Pytest request object
+        driver_options: Options for launched drivers
+
+    Yields:
+        SharedBrowserClient: Client handing out per-test windows, or None if the mode is off
+        or the browser cannot isolate tests (tests then get their own browser)
+    """
+    from selenium.common.exceptions import WebDriverException
+    from utils.shared_browser import SharedBrowserClient, SHARED_BROWSER_ENV
+    address = os.environ.get(SHARED_BROWSER_ENV)
+    if not request.config.getoption("--shared-browser") or not address:
+        yield None
+        return
+
+    client = SharedBrowserClient(address, driver_options)
+    try:
+        client.close_window(client.open_window())
+    except WebDriverException as e:
+        logger.warning("Shared browser cannot open isolated windows (%s), using a browser per test", e)
+        client.quit()
+        yield None
+        return
+
+    yield client
+    client.quit()
+
+
+def _acquire_driver(request):
+    """
+    Get a driver according to the selected driver mode
+
+    Args:
+        request: Pytest request object
+
+    Returns:
+        tuple: (driver, release) where release(driver) gives the driver back after the test
+    """
+    client = request.getfixturevalue("shared_browser_client")
+    if client:
+        return client.open_window(), client.close_window
+
+    if request.config.getoption("--reuse-driver"):
+        pool = request.getfixturevalue("driver_pool")
+
+        def release_to_pool(driver):
+            # A failed test may have left the browser in a state reset() cannot undo
+            if request.node.stash.get(test_failed_key, False):
+                logger.info("Test failed, discarding its pooled driver")
+                pool.discard(driver)
+            else:
+                pool.release(driver)
+
+        return pool.acquire(), release_to_pool
+
+    provisioner = request.getfixturevalue("driver_provisioner")
+    if provisioner:
+        return provisioner.take(), provisioner.retire
 
     # Create driver (Chrome only)
-    logger.info(f"Setting up chrome driver (headless: {headless})")
-    driver = DriverFactory.get_driver(browser="chrome", headless=headless)
+    driver_options = request.getfixturevalue("driver_options")
+    logger.info("Setting up chrome driver (headless: %s)", driver_options["headless"])
+    from utils.driver_factory import DriverFactory
+    driver = DriverFactory.get_driver(**driver_options)
 
     # Navigate to base URL
     driver.get(BASE_URL)
-    logger.info(f"Navigated to: {BASE_URL}")
+    logger.info("Navigated to: %s", BASE_URL)
+
+    def quit_driver(driver):
+        logger.info("Tearing down driver")
+        driver.quit()
+
+    return driver, quit_driver
+
+
+@pytest.fixture(scope="function")
+def driver(request, lean_profile, memory_watchdog):
+    """
+    WebDriver fixture - creates and quits driver for each test,
+    borrows a reset driver from the pool with --reuse-driver,
+    or takes a ready one from the background launcher with --preprovision
+    
+    Args:
+        request: Pytest request object
+        lean_profile: Lean page load profile (None if disabled)
+        memory_watchdog: Browser memory watchdog (None if disabled)
+        
+    Yields:
+        WebDriver: Browser driver instance
+    """
+    driver, release = _acquire_driver(request)
+    if memory_watchdog:
+        memory_watchdog.start_test(driver)
+
+    if lean_profile:
+        lean_profile.set_blocking(driver, request.node.get_closest_marker("full_page_load") is None)
+        # Start counting from the test itself
+        lean_profile.collect(driver)
 
     # Yield driver to test
     yield driver
 
-    # Teardown
-    logger.info("Tearing down driver")
-    driver.quit()
+    if lean_profile:
+        stats = lean_profile.collect(driver)
+        if stats:
+            request.node.user_properties.append(("lean_page_load", stats))
+
+    # Before release, so the pool sees whether the browser needs recycling
+    memory = memory_watchdog.stop_test() if memory_watchdog else None
+    if memory:
+        request.node.user_properties.append(("memory", memory))
+        attach_json("memory", memory)
+
+    release(driver)
+    # Only the pool keeps browsers for further tests (it drops their history when it quits them)
+    if memory_watchdog and not request.config.getoption("--reuse-driver"):
+        memory_watchdog.forget(driver)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def step_timeline(request):
+    """
+    Record a timeline of page object steps for each test (setup fixtures included)
+
+    Args:
+        request: Pytest request object
+
+    Yields:
+        Timeline: Timeline of the running test
+    """
+    yield Timeline.start()
+    steps = Timeline.stop()
+    if steps:
+        request.node.user_properties.append(("timeline", steps))
+
+
+@pytest.fixture(scope="function", autouse=True)
+def browser_metrics(request):
+    """
+    Capture browser metrics at the page transitions of each test (with --browser-metrics,
+    or for tests with step budgets)
+
+    Args:
+        request: Pytest request object
+
+    Yields:
+        BrowserMetrics: Collector of the running test, or None if disabled
+    """
+    budget = request.node.get_closest_marker("budget")
+    if not (request.config.getoption("--browser-metrics") or (budget and budget.kwargs.get("step"))):
+        yield None
+        return
+
+    yield BrowserMetrics.start()
+    transitions = BrowserMetrics.stop()
+    if transitions:
+        request.node.user_properties.append(("browser_metrics", transitions))
+        attach_json("browser_metrics", transitions)
+
+
+@pytest.fixture(scope="function")
+def login_as(driver):
+    """
+    Fast login fixture - returns a function that logs in a USERS entry
+    through the session cookie instead of the login form
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        callable: login(user_key="standard") -> LoginPage
+    """
+    def login(user_key="standard"):
+        user = USERS[user_key]
+        login_page = LoginPage(driver)
+        assert login_page.fast_login(user["username"], user["password"]), \
+            f"Could not establish session for user '{user_key}'"
+        return login_page
+
+    return login
+
+
+@pytest.fixture(scope="class")
+def browser_checkpoints():
+    """
+    Browser state snapshots shared by the tests of one class (per xdist worker)
+
+    Returns:
+        dict: BrowserSnapshot by checkpoint name
+    """
+    return {}
+
+
+@pytest.fixture(scope="function")
+def browser_checkpoint(request, driver, browser_checkpoints):
+    """
+    Checkpoint fixture - returns a function that builds a browser state through the app
+    on first use in a class and restores the captured snapshot for the following tests
+
+    Args:
+        request: Pytest request object
+        driver: WebDriver instance
+        browser_checkpoints: Snapshots of the current class
+
+    Returns:
+        callable: checkpoint(name, build, page_class) -> page_class instance
+    """
+    def checkpoint(name, build, page_class):
+        snapshot = browser_checkpoints.get(name)
+        if snapshot and not request.config.getoption("--no-checkpoints"):
+            snapshot.restore(driver)
+            if snapshot.matches(driver, page_class):
+                return page_class(driver)
+            logger.warning("Restored checkpoint '%s' is not on %s, rebuilding it", name, page_class.__name__)
+            from utils.driver_pool import DriverPool
+            DriverPool.reset(driver)
+
+        build()
+        assert page_class(driver).is_page_loaded(), f"Checkpoint '{name}' did not reach {page_class.__name__}"
+        browser_checkpoints[name] = BrowserSnapshot.capture(driver)
+        return page_class(driver)
+
+    return checkpoint
 
 
 @pytest.fixture(scope="function")
@@ -69,7 +563,7 @@ def setup_teardown(driver):
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Pytest hook to capture screenshot on test failure
+    Pytest hook to capture screenshot on test failure and attach structured data to the HTML report
     
     Args:
         item: Test item
@@ -78,15 +572,35 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
 
+    if report.failed and report.when in ("setup", "call"):
+        item.stash[test_failed_key] = True
+
+    # Properties are complete once fixtures are torn down
+    if report.when == "teardown":
+        _add_report_extras(item.config, report)
+
     # Capture screenshot on failure
     if report.when == "call" and report.failed:
         driver = item.funcargs.get('driver')
         if driver:
             test_name = item.name
-            logger.error(f"Test failed: {test_name}")
+            logger.error("Test failed: %s", test_name)
             take_screenshot(driver, f"FAILED_{test_name}")
 
 
+def _add_report_extras(config, report):
+    """Add REPORT_EXTRAS user properties to the pytest-html report as JSON"""
+    if not config.pluginmanager.hasplugin("html"):
+        return
+    import pytest_html
+
+    extras = getattr(report, "extras", [])
+    for key, value in report.user_properties:
+        if key in REPORT_EXTRAS:
+            extras.append(pytest_html.extras.json(value, name=key))
+    report.extras = extras
+
+
 @pytest.fixture(scope="session", autouse=True)
 def session_setup():
     """
@@ -99,3 +613,139 @@ def session_setup():
     logger.info("=" * 80)
     logger.info("TEST EXECUTION COMPLETED")
     logger.info("=" * 80)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """Hand worker statistics to the xdist controller"""
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["provisioner_stats"] = session.config.stash[provisioner_stats_key]
+
+
+def pytest_testnodedown(node, error):
+    """Collect statistics sent by an xdist worker"""
+    stats = getattr(node, "workeroutput", {}).get("provisioner_stats", [])
+    node.config.stash[provisioner_stats_key].extend(stats)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report driver pre-provisioning, browser memory, lean page load and step timeline statistics"""
+    _report_provisioner_stats(terminalreporter, config.stash[provisioner_stats_key])
+    _report_shared_browser(terminalreporter, config.stash.get(shared_browser_key, None))
+    _report_memory(terminalreporter)
+    _report_lean_page_load(terminalreporter)
+    _report_timeline(terminalreporter)
+
+
+def _collected_properties(terminalreporter, name):
+    """
+    Get a user property recorded during test teardown, for every test
+
+    Args:
+        terminalreporter: Terminal reporter (holds reports from all xdist workers)
+        name (str): Property name
+
+    Returns:
+        dict: Property value by test node id
+    """
+    values = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) == "teardown":
+                for key, value in report.user_properties:
+                    if key == name:
+                        values[report.nodeid] = value
+    return values
+
+
+def _report_timeline(terminalreporter):
+    """Save all step timelines as JSON and print the slowest steps and locators"""
+    timelines = _collected_properties(terminalreporter, "timeline")
+    if not timelines:
+        return
+
+    TIMELINE_FILE.parent.mkdir(exist_ok=True)
+    with open(TIMELINE_FILE, "w") as f:
+        json.dump(timelines, f, indent=2)
+
+    steps, locators = summarize(timelines, TIMELINE_SUMMARY_SIZE)
+    terminalreporter.write_sep("=", "slowest steps")
+    for title, rows in (("step", steps), ("locator", locators)):
+        terminalreporter.write_line(f"{'total':>9} {'wait':>9} {'max':>9} {'calls':>6}  {title}")
+        for row in rows:
+            terminalreporter.write_line(
+                f"{row['total']:8.3f}s {row['wait']:8.3f}s {row['max']:8.3f}s {row['calls']:6d}  {row['name']}"
+            )
+    terminalreporter.write_line(f"timeline of {len(timelines)} tests saved to {TIMELINE_FILE}")
+
+
+def _report_lean_page_load(terminalreporter):
+    """Print requests and bytes saved by the lean page load profile"""
+    results = _collected_properties(terminalreporter, "lean_page_load")
+    if not results:
+        return
+
+    terminalreporter.write_sep("=", "lean page load")
+    for nodeid, stats in results.items():
+        terminalreporter.write_line(
+            f"{nodeid}: blocked={stats['blocked_requests']} saved~{stats['bytes_saved'] / 1024:.1f}KB "
+            f"(unknown size: {stats['unknown_sizes']}) loaded={stats['loaded_requests']} "
+            f"{stats['loaded_bytes'] / 1024:.1f}KB"
+        )
+    blocked = sum(stats["blocked_requests"] for stats in results.values())
+    saved = sum(stats["bytes_saved"] for stats in results.values())
+    unknown = sum(stats["unknown_sizes"] for stats in results.values())
+    terminalreporter.write_line(f"total: {blocked} requests blocked, ~{saved / 1024:.1f}KB saved "
+                                f"(unknown size: {unknown})")
+
+
+def _report_memory(terminalreporter):
+    """Print peak and average browser memory per test and the browsers recycled for memory"""
+    memory = _collected_properties(terminalreporter, "memory")
+    if not memory:
+        return
+
+    terminalreporter.write_sep("=", "browser memory")
+    recycled = sum(1 for stats in memory.values() if stats["recycle"])
+    terminalreporter.write_line(
+        f"{len(memory)} tests: average {sum(s['average_mb'] for s in memory.values()) / len(memory):.0f} MB, "
+        f"peak {max(s['peak_mb'] for s in memory.values()):.0f} MB, "
+        f"{recycled} browsers over the limit or leaking after a test"
+    )
+    terminalreporter.write_line(f"{'peak':>8} {'average':>8} {'growth':>8}  test")
+    for nodeid, stats in sorted(memory.items(), key=lambda item: -item[1]["peak_mb"])[:TIMELINE_SUMMARY_SIZE]:
+        terminalreporter.write_line(
+            f"{stats['peak_mb']:5.0f} MB {stats['average_mb']:5.0f} MB {stats['end_mb'] - stats['start_mb']:+5.0f} MB  "
+            f"{nodeid}" + (f"  (recycle: {stats['recycle']})" if stats["recycle"] else "")
+        )
+
+
+def _report_shared_browser(terminalreporter, browser):
+    """Print memory of the shared browser per concurrently running test"""
+    report = browser.memory_report() if browser else None
+    if not report:
+        return
+
+    terminalreporter.write_sep("=", "shared browser memory")
+    per_test = f"{report['per_test'] / 2 ** 20:.0f} MB" if report["per_test"] is not None else "-"
+    terminalreporter.write_line(
+        f"idle={report['baseline'] / 2 ** 20:.0f} MB peak={report['peak'] / 2 ** 20:.0f} MB "
+        f"with up to {report['peak_tests']} concurrent tests, {per_test} per concurrent test "
+        f"({report['samples']} samples)"
+    )
+
+
+def _report_provisioner_stats(terminalreporter, all_stats):
+    """Print driver pre-provisioning statistics per worker"""
+    if not all_stats:
+        return
+
+    terminalreporter.write_sep("=", "driver pre-provisioning")
+    for stats in all_stats:
+        taken = stats["hits"] + stats["misses"]
+        avg_wait = stats["wait_time"] / taken if taken else 0.0
+        terminalreporter.write_line(
+            f"{stats['worker']}: depth={stats['depth']} launched={stats['launched']} failed={stats['failed']} "
+            f"hits={stats['hits']} misses={stats['misses']} "
+            f"avg_wait={avg_wait:.3f}s max_wait={stats['max_wait']:.3f}s"
+        )
@@ -0,0 +1,91 @@
+"""
+Journey Benchmark Test Cases - run with --benchmark
+"""
+import pytest
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from utils.benchmark import JourneyTimer, summarize_runs, compare
+from utils.driver_pool import DriverPool
+from config.config import USERS, CHECKOUT_INFO, BENCHMARK_USERS
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.benchmark
+class TestJourneyBenchmark:
+    """Journey Benchmark Test Class"""
+
+    @pytest.mark.parametrize("user_key", BENCHMARK_USERS)
+    def test_purchase_journey(self, driver, request, benchmark_settings, user_key):
+        """
+        Test Case: Time the login -> inventory -> cart -> checkout journey
+        Steps:
+            1. Run the journey N times (--benchmark-runs), resetting the browser in between
+            2. Report p50/p90/p99 per step
+            3. Compare against the baseline if one is given (--benchmark-baseline)
+        """
+        logger.info("Starting benchmark: Purchase Journey (%s)", user_key)
+
+        runs = []
+        for run in range(benchmark_settings["runs"]):
+            if run:
+                DriverPool.reset(driver)
+            runs.append(self.run_journey(driver, USERS[user_key]))
+            logger.info("Journey run %s: %s", run + 1, runs[-1])
+
+        stats = summarize_runs(runs)
+        request.node.user_properties.append(("benchmark", {"id": user_key, "steps": stats}))
+
+        baseline = benchmark_settings["baseline"]
+        if baseline and user_key in baseline:
+            regressions = compare(stats, baseline[user_key], benchmark_settings["threshold"])
+            assert not regressions, f"Slower than baseline: {regressions}"
+
+        logger.info("Benchmark finished: Purchase Journey (%s)", user_key)
+
+    @staticmethod
+    def run_journey(driver, user):
+        """
+        Complete one purchase through the UI, timing every step
+
+        Args:
+            driver: WebDriver instance
+            user (dict): USERS entry
+
+        Returns:
+            dict: Step timings in ms
+        """
+        timer = JourneyTimer(driver)
+        login_page = LoginPage(driver)
+        products_page = ProductsPage(driver)
+        cart_page = CartPage(driver)
+        checkout_page = CheckoutPage(driver)
+
+        with timer.step("login"):
+            login_page.login(user["username"], user["password"])
+        with timer.step("inventory_render"):
+            assert products_page.get_page_title() == "Products", "Inventory not rendered"
+        with timer.step("add_to_cart"):
+            products_page.add_product_to_cart_by_index(0)
+            products_page.add_product_to_cart_by_index(1)
+        with timer.step("cart"):
+            products_page.click_cart_icon()
+            assert cart_page.get_cart_items_count() == 2, "Cart does not hold the added items"
+        with timer.step("checkout_info"):
+            cart_page.click_checkout()
+            checkout_page.fill_checkout_information(
+                CHECKOUT_INFO["first_name"],
+                CHECKOUT_INFO["last_name"],
+                CHECKOUT_INFO["postal_code"]
+            )
+        with timer.step("checkout_overview"):
+            checkout_page.click_continue()
+            assert "Checkout: Overview" in checkout_page.get_page_title(), "Not on overview page"
+        with timer.step("checkout_finish"):
+            checkout_page.click_finish()
+            assert checkout_page.is_checkout_complete(), "Order not completed"
+
+        return timer.timings
@@ -2,10 +2,9 @@
 Shopping Cart Test Cases
 """
 import pytest
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
-from config.config import USERS
+from config.config import PRODUCTS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,21 +16,13 @@ class TestCart:
     """Shopping Cart Test Class"""
 
     @pytest.fixture(autouse=True)
-    def login_and_add_products(self, driver):
-        """Auto-login and add products before each test"""
+    def login_and_add_products(self, driver, login_as):
+        """Auto-login and open the cart with two products before each test"""
         # Login
-        login_page = LoginPage(driver)
-        username = USERS["standard"]["username"]
-        password = USERS["standard"]["password"]
-        login_page.login(username, password)
+        login_as("standard")
 
-        # Add products to cart
-        products_page = ProductsPage(driver)
-        products_page.add_product_to_cart_by_index(0)
-        products_page.add_product_to_cart_by_index(1)
-
-        # Navigate to cart
-        products_page.click_cart_icon()
+        # Seed the first two products and open the cart
+        CartPage(driver).seed_cart(list(PRODUCTS)[:2])
         yield
 
     def test_cart_page_loaded(self, driver):
@@ -2,11 +2,10 @@
 Checkout Test Cases
 """
 import pytest
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
-from config.config import USERS, CHECKOUT_INFO
+from config.config import CHECKOUT_INFO, PRODUCTS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,23 +17,16 @@ class TestCheckout:
     """Checkout Test Class"""
 
     @pytest.fixture(autouse=True)
-    def setup_checkout(self, driver):
-        """Setup: Login, add products, navigate to checkout"""
-        # Login
-        login_page = LoginPage(driver)
-        username = USERS["standard"]["username"]
-        password = USERS["standard"]["password"]
-        login_page.login(username, password)
-
-        # Add products
-        products_page = ProductsPage(driver)
-        products_page.add_product_to_cart_by_index(0)
-        products_page.add_product_to_cart_by_index(1)
+    def setup_checkout(self, driver, login_as, browser_checkpoint):
+        """Setup: Login, add products, navigate to checkout (built once per class, then restored)"""
+        def build():
+            # Login
+            login_as("standard")
 
-        # Go to cart and checkout
-        products_page.click_cart_icon()
-        cart_page = CartPage(driver)
-        cart_page.click_checkout()
+            # Seed the first two products and go straight to checkout
+            CartPage(driver).seed_cart(list(PRODUCTS)[:2], start_checkout=True)
+
+        browser_checkpoint("checkout_step_one", build, CheckoutPage)
 
         yield
 
@@ -55,6 +47,7 @@ class TestCheckout:
 
         logger.info("Test passed: Checkout Information Page")
 
+    @pytest.mark.budget(total_ms=20000, step={"checkout_finish": 3000})
     def test_complete_checkout_flow(self, driver):
         """
         Test Case: Verify complete checkout flow
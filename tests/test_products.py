@@ -2,9 +2,8 @@
 Product Test Cases
 """
 import pytest
-from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
-from config.config import USERS, SORT_OPTIONS
+from config.config import SORT_OPTIONS, PRODUCTS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,12 +15,9 @@ class TestProducts:
     """Product Test Class"""
 
     @pytest.fixture(autouse=True)
-    def login(self, driver):
+    def login(self, login_as):
         """Auto-login before each test"""
-        login_page = LoginPage(driver)
-        username = USERS["standard"]["username"]
-        password = USERS["standard"]["password"]
-        login_page.login(username, password)
+        login_as("standard")
         yield
 
     def test_products_display(self, driver):
@@ -189,3 +185,24 @@ class TestProducts:
         assert cart_count == 3, f"Cart should have 3 items, but has {cart_count}"
 
         logger.info("Test passed: Add Multiple Products to Cart")
+
+    def test_seed_cart_from_storage(self, driver):
+        """
+        Test Case: Verify cart contents written to browser storage are picked up
+        Steps:
+            1. Login and navigate to products page
+            2. Seed two products into the cart via storage
+            3. Verify cart badge count
+        """
+        logger.info("Starting test: Seed Cart from Storage")
+
+        products_page = ProductsPage(driver)
+
+        # Seed 2 products
+        products_page.seed_cart(list(PRODUCTS)[:2])
+
+        # Verify cart badge
+        cart_count = products_page.get_cart_badge_count()
+        assert cart_count == 2, f"Cart should have 2 items, but has {cart_count}"
+
+        logger.info("Test passed: Seed Cart from Storage")
@@ -0,0 +1,240 @@
+"""
+Async WebDriver Unit Tests - Connection pool, response decoding and error mapping against a local server
+"""
+import asyncio
+import json
+import pytest
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from utils.async_webdriver import AsyncDriverFactory, AsyncWebDriver, HTTPConnectionPool
+
+pytestmark = pytest.mark.unit
+
+
+def response(status=200, value=None, chunked=False, close=False):
+    """Raw HTTP/1.1 response carrying a W3C value"""
+    body = json.dumps({"value": value}).encode()
+    headers = f"HTTP/1.1 {status} Status\r\nContent-Type: application/json\r\n"
+    if close:
+        headers += "Connection: close\r\n"
+    if chunked:
+        half = len(body) // 2
+        payload = b"".join(f"{len(part):x}\r\n".encode() + part + b"\r\n" for part in (body[:half], body[half:]))
+        return f"{headers}Transfer-Encoding: chunked\r\n\r\n".encode() + payload + b"0\r\n\r\n"
+    return f"{headers}Content-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+class FakeWebDriverServer:
+    """
+    Local HTTP server answering each request with handler(method, path, payload).
+    The handler returns raw response bytes, optionally followed by "close" (drop the
+    connection after writing) or "hang" (never answer).
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.connections = 0
+        self.tasks = set()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.serve, "127.0.0.1", 0)
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def serve(self, reader, writer):
+        self.connections += 1
+        self.tasks.add(asyncio.current_task())
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                method, path, _ = request_line.decode().split()
+                self.requests.append((method, path))
+
+                reply = self.handler(method, path, json.loads(body) if body else None)
+                raw, action = reply if isinstance(reply, tuple) else (reply, None)
+                if action == "hang":
+                    await asyncio.sleep(3600)
+                writer.write(raw)
+                await writer.drain()
+                if action == "close":
+                    break
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def run(scenario):
+    """Run a coroutine against a fresh event loop"""
+    return asyncio.run(scenario())
+
+
+class TestConnectionPool:
+    """Keep-alive reuse, timeouts and retries of HTTPConnectionPool"""
+
+    def test_requests_share_one_connection(self):
+        async def scenario():
+            async with FakeWebDriverServer(lambda *_: response(value="ok")) as server:
+                pool = HTTPConnectionPool(server.url)
+                results = [await pool.request("GET", "/status") for _ in range(5)]
+                await pool.close()
+                return server, pool, results
+
+        server, pool, results = run(scenario)
+        assert results == [(200, '{"value": "ok"}')] * 5
+        assert (server.connections, pool.opened, pool.requests) == (1, 1, 5)
+
+    def test_connection_close_is_not_reused(self):
+        async def scenario():
+            async with FakeWebDriverServer(lambda *_: response(value="ok", close=True)) as server:
+                pool = HTTPConnectionPool(server.url)
+                await pool.request("GET", "/status")
+                await pool.request("GET", "/status")
+                return server, pool
+
+        server, pool = run(scenario)
+        assert server.connections == 2
+        assert pool._idle == []
+
+    def test_chunked_body_is_decoded(self):
+        value = {"title": "Swag Labs", "items": list(range(50))}
+
+        async def scenario():
+            async with FakeWebDriverServer(lambda *_: response(value=value, chunked=True)) as server:
+                pool = HTTPConnectionPool(server.url)
+                first = await pool.request("GET", "/title")
+                # The connection is positioned after the terminating chunk and can be reused
+                second = await pool.request("GET", "/title")
+                await pool.close()
+                return server, first, second
+
+        server, first, second = run(scenario)
+        assert json.loads(first[1]) == json.loads(second[1]) == {"value": value}
+        assert server.connections == 1
+
+    def test_idle_connection_closed_by_server_is_retried(self):
+        async def scenario():
+            # Server drops every connection after answering, without saying so
+            async with FakeWebDriverServer(lambda *_: (response(value="ok"), "close")) as server:
+                pool = HTTPConnectionPool(server.url)
+                await pool.request("GET", "/status")
+                await asyncio.sleep(0.05)
+                result = await pool.request("POST", "/session/1/element/2/click", {})
+                return server, result
+
+        server, result = run(scenario)
+        assert result == (200, '{"value": "ok"}')
+        assert server.requests == [("GET", "/status"), ("POST", "/session/1/element/2/click")]
+        assert server.connections == 2
+
+    def test_partial_response_is_not_retried(self):
+        async def scenario():
+            replies = iter([response(value="ok"), (b"HTTP/1.1 200 OK\r\nContent-Length: 40\r\n\r\n{", "close")])
+            async with FakeWebDriverServer(lambda *_: next(replies)) as server:
+                pool = HTTPConnectionPool(server.url)
+                await pool.request("GET", "/status")
+                with pytest.raises(asyncio.IncompleteReadError):
+                    await pool.request("POST", "/session/1/element/2/click", {})
+                return server, pool
+
+        server, pool = run(scenario)
+        assert server.requests.count(("POST", "/session/1/element/2/click")) == 1
+        assert pool._idle == []
+
+    def test_malformed_status_line_closes_connection(self):
+        async def scenario():
+            async with FakeWebDriverServer(lambda *_: b"garbage\r\n\r\n") as server:
+                pool = HTTPConnectionPool(server.url)
+                with pytest.raises(ConnectionError, match="Malformed HTTP status line"):
+                    await pool.request("GET", "/status")
+                return pool
+
+        pool = run(scenario)
+        assert pool._idle == []
+        assert pool.requests == 0
+
+    def test_hung_response_times_out(self):
+        async def scenario():
+            async with FakeWebDriverServer(lambda *_: (b"", "hang")) as server:
+                pool = HTTPConnectionPool(server.url, timeout=0.2)
+                with pytest.raises(asyncio.TimeoutError):
+                    await pool.request("GET", "/status")
+                return pool
+
+        pool = run(scenario)
+        assert pool._idle == []
+        # The connection slot is released for the next command
+        assert not pool._available.locked()
+
+
+class TestErrorMapping:
+    """W3C error responses raise the same exceptions as Selenium's own client"""
+
+    def test_no_such_element(self):
+        async def scenario():
+            error = {"error": "no such element", "message": "Unable to locate element", "stacktrace": ""}
+            async with FakeWebDriverServer(lambda *_: response(404, error)) as server:
+                driver = AsyncWebDriver(HTTPConnectionPool(server.url), "1")
+                await driver.find_element("css selector", "#missing")
+
+        with pytest.raises(NoSuchElementException, match="Unable to locate element"):
+            run(scenario)
+
+    @pytest.mark.parametrize("raw", [
+        b"HTTP/1.1 500 Internal Server Error\r\nContent-Length: 14\r\n\r\nInternal error",
+        response(500, {"error": "something new", "message": "boom", "stacktrace": ""})
+    ], ids=["plain text", "unknown error code"])
+    def test_other_errors(self, raw):
+        async def scenario():
+            async with FakeWebDriverServer(lambda *_: raw) as server:
+                await AsyncWebDriver(HTTPConnectionPool(server.url), "1").title()
+
+        with pytest.raises(WebDriverException):
+            run(scenario)
+
+    def test_element_references_are_unwrapped(self):
+        element = {"element-6066-11e4-a52e-4f735466cecf": "element-1"}
+
+        async def scenario():
+            async with FakeWebDriverServer(lambda *_: response(value=[element, element])) as server:
+                driver = AsyncWebDriver(HTTPConnectionPool(server.url), "1")
+                return await driver.find_elements("css selector", ".item")
+
+        elements = run(scenario)
+        assert [item.id for item in elements] == ["element-1", "element-1"]
+
+
+class TestNewSession:
+    """Session setup through AsyncDriverFactory"""
+
+    def test_session_is_quit_when_setup_fails(self):
+        def handler(method, path, payload):
+            if path == "/session":
+                return response(value={"sessionId": "abc", "capabilities": {}})
+            if path.endswith("/timeouts"):
+                return response(400, {"error": "invalid argument", "message": "bad timeouts", "stacktrace": ""})
+            return response(value=None)
+
+        async def scenario():
+            async with FakeWebDriverServer(handler) as server:
+                factory = AsyncDriverFactory()
+                factory.pool = HTTPConnectionPool(server.url)
+                with pytest.raises(WebDriverException, match="bad timeouts"):
+                    await factory.new_session()
+                return server
+
+        server = run(scenario)
+        assert ("DELETE", "/session/abc") in server.requests
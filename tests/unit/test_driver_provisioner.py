@@ -0,0 +1,51 @@
+"""
+Driver Provisioner Unit Tests - Background launches with a fake DriverFactory
+"""
+import time
+from types import SimpleNamespace
+import pytest
+from utils import driver_pool
+from utils.driver_pool import DriverProvisioner
+
+pytestmark = pytest.mark.unit
+
+
+class FakeDriver(SimpleNamespace):
+    """Driver that only records navigation and quit"""
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestDriverProvisioner:
+    """Ready drivers, give-up after repeated launch failures and stats"""
+
+    def test_take_returns_launched_driver(self, monkeypatch):
+        monkeypatch.setattr(driver_pool.DriverFactory, "get_driver", lambda **_: FakeDriver())
+        provisioner = DriverProvisioner()
+        driver = provisioner.take()
+        provisioner.close()
+
+        assert driver.url == driver_pool.BASE_URL
+        assert provisioner.stats["launched"] >= 1
+        assert provisioner.stats["hits"] + provisioner.stats["misses"] == 1
+
+    def test_repeated_failures_are_raised_without_waiting(self, monkeypatch):
+        def broken(**_):
+            raise FileNotFoundError("chromedriver not found")
+
+        monkeypatch.setattr(driver_pool, "DRIVER_PREPROVISION_MAX_FAILURES", 2)
+        monkeypatch.setattr(driver_pool.DriverFactory, "get_driver", broken)
+        provisioner = DriverProvisioner()
+        start = time.perf_counter()
+        for _ in range(3):
+            with pytest.raises(FileNotFoundError, match="chromedriver not found"):
+                provisioner.take()
+        provisioner.close()
+
+        # One backoff second between the two launches, not DRIVER_PREPROVISION_TIMEOUT per take
+        assert time.perf_counter() - start < 5
+        assert provisioner.stats["failed"] == 2
@@ -0,0 +1,61 @@
+"""
+Import Profiler Unit Tests - Self and cumulative import times with threads and failing imports
+"""
+import importlib.abc
+import importlib.machinery
+import sys
+import threading
+import time
+import pytest
+from utils.import_profiler import ImportProfiler
+
+pytestmark = pytest.mark.unit
+
+IMPORT_SECONDS = 0.1
+
+
+class SlowModules(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Provides slow_* modules that take IMPORT_SECONDS to execute"""
+
+    def find_spec(self, name, path, target=None):
+        return importlib.machinery.ModuleSpec(name, self) if name.startswith("slow_") else None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        time.sleep(IMPORT_SECONDS)
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setattr(sys, "meta_path", [SlowModules(), *sys.meta_path])
+    profiler = ImportProfiler()
+    profiler.install()
+    yield profiler
+    profiler.uninstall()
+    for name in [name for name in sys.modules if name.startswith("slow_")]:
+        del sys.modules[name]
+
+
+class TestImportProfiler:
+    """Module timings recorded by the builtins.__import__ wrapper"""
+
+    def test_concurrent_imports_keep_their_own_self_time(self, profiler):
+        thread = threading.Thread(target=__import__, args=("slow_background",))
+        thread.start()
+        __import__("slow_main")
+        thread.join()
+
+        for name in ("slow_background", "slow_main"):
+            assert profiler.modules[name]["self"] == pytest.approx(IMPORT_SECONDS, abs=0.05)
+
+    def test_failed_import_is_not_recorded(self, profiler):
+        with pytest.raises(ImportError):
+            __import__("missing_optional_dependency")
+        assert "missing_optional_dependency" not in profiler.modules
+
+    def test_uninstall_restores_import(self, profiler):
+        profiler.uninstall()
+        __import__("slow_after")
+        assert "slow_after" not in profiler.modules
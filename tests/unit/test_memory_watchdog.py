@@ -0,0 +1,64 @@
+"""
+Memory Watchdog Unit Tests - Growth heuristic and recycling decisions
+"""
+from types import SimpleNamespace
+import pytest
+from utils.memory_watchdog import MemoryWatchdog, growth_per_test
+
+pytestmark = pytest.mark.unit
+
+
+class TestGrowthPerTest:
+    """Least-squares growth of browser memory over consecutive tests"""
+
+    def test_flat_memory_has_no_growth(self):
+        assert growth_per_test([400, 400, 400, 400]) == 0
+
+    def test_linear_growth(self):
+        assert growth_per_test([100, 130, 160, 190, 220]) == pytest.approx(30)
+
+    def test_single_spike_is_averaged_out(self):
+        # One heavy page in the middle of the window is not a steady leak
+        assert growth_per_test([400, 400, 700, 400, 400]) == pytest.approx(0)
+
+    def test_shrinking_memory_is_negative(self):
+        assert growth_per_test([500, 450, 400]) == pytest.approx(-50)
+
+
+class TestRecycleReason:
+    """Decision whether a browser is replaced before its next test"""
+
+    @pytest.fixture
+    def driver(self):
+        return SimpleNamespace(session_id="session-1")
+
+    def watchdog(self, driver, history, **kwargs):
+        watchdog = MemoryWatchdog(**dict({"limit_mb": 1000, "leak_window": 3, "leak_mb_per_test": 25}, **kwargs))
+        watchdog.history[driver.session_id] = history
+        return watchdog
+
+    def test_unknown_browser_is_kept(self, driver):
+        assert MemoryWatchdog().recycle_reason(driver) is None
+
+    def test_browser_within_limits_is_kept(self, driver):
+        assert self.watchdog(driver, [500, 510, 505]).recycle_reason(driver) is None
+
+    def test_browser_over_limit_is_recycled(self, driver):
+        reason = self.watchdog(driver, [900, 1200]).recycle_reason(driver)
+        assert reason == "uses 1200 MB (limit 1000 MB)"
+
+    def test_no_limit(self, driver):
+        assert self.watchdog(driver, [5000], limit_mb=0).recycle_reason(driver) is None
+
+    def test_leaking_browser_is_recycled(self, driver):
+        reason = self.watchdog(driver, [300, 350, 400]).recycle_reason(driver)
+        assert reason == "grew 50 MB per test over the last 3 tests"
+
+    def test_growth_needs_a_full_window(self, driver):
+        assert self.watchdog(driver, [300, 400]).recycle_reason(driver) is None
+
+    def test_forgotten_browser_is_kept(self, driver):
+        watchdog = self.watchdog(driver, [900, 1200])
+        watchdog.forget(driver)
+        assert watchdog.recycle_reason(driver) is None
+        assert watchdog.history == {}
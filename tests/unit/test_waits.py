@@ -0,0 +1,46 @@
+"""
+Wait Engine Unit Tests - ObserverWait retries against a scripted driver
+"""
+import pytest
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from utils.waits import ObserverWait, RETRY_INTERVAL
+
+pytestmark = pytest.mark.unit
+
+LOCATOR = ("css selector", ".inventory_list")
+
+
+class ScriptedDriver:
+    """Answers execute_async_script with the given outcomes (exceptions are raised)"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def execute_async_script(self, *args):
+        self.calls += 1
+        outcome = self.outcomes[min(self.calls, len(self.outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class TestObserverWait:
+    """Retries after unload / script timeouts and the overall deadline"""
+
+    def test_found_after_navigation(self):
+        driver = ScriptedDriver(JavascriptException("document unloaded"), {"found": True, "result": True})
+        assert ObserverWait(driver, 5).until(LOCATOR, "shown") is True
+        assert driver.calls == 2
+
+    def test_unload_retries_are_paced(self):
+        driver = ScriptedDriver(JavascriptException("document unloaded"))
+        with pytest.raises(TimeoutException):
+            ObserverWait(driver, 0.5).until(LOCATOR, "shown")
+        assert driver.calls <= 0.5 / RETRY_INTERVAL + 2
+
+    def test_other_script_errors_are_raised(self):
+        driver = ScriptedDriver(JavascriptException("SyntaxError"))
+        with pytest.raises(JavascriptException):
+            ObserverWait(driver, 5).until(LOCATOR, "shown")
+        assert driver.calls == 1
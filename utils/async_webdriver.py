@@ -0,0 +1,394 @@
+"""
+Async WebDriver - asyncio W3C WebDriver client with a keep-alive connection pool
+
+One chromedriver process serves many sessions; their commands share a pool of persistent
+HTTP/1.1 connections instead of blocking one thread per call. Used by the async page
+objects (pages/async_*.py) to drive dozens of browsers from one process:
+
+    factory = AsyncDriverFactory(headless=True)
+    factory.start()
+    drivers = await asyncio.gather(*(factory.new_session() for _ in range(10)))
+    ...
+    await asyncio.gather(*(driver.quit() for driver in drivers))
+    await factory.close()
+"""
+import asyncio
+import json
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from config.config import ASYNC_POOL_SIZE, ASYNC_COMMAND_TIMEOUT, PAGE_LOAD_TIMEOUT
+from utils.driver_factory import DriverFactory
+from utils.driver_resolver import resolver
+import logging
+
+logger = logging.getLogger(__name__)
+
+# W3C key of element references in requests and responses
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class ServerClosedError(ConnectionResetError):
+    """The server closed the connection before sending any part of the response"""
+
+
+class HTTPConnectionPool:
+    """Persistent HTTP/1.1 connections to one host, shared by all sessions of a driver process"""
+
+    def __init__(self, url, size=ASYNC_POOL_SIZE, timeout=ASYNC_COMMAND_TIMEOUT):
+        """
+        Initialize pool (connections are opened on demand)
+
+        Args:
+            url (str): Server URL, e.g. http://localhost:9515
+            size (int): Maximum number of open connections
+            timeout (float): Seconds to wait for a connection or a whole response
+        """
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port
+        self.size = size
+        self.timeout = timeout
+        self.opened = 0
+        self.requests = 0
+        self._idle = []
+        self._available = asyncio.Semaphore(size)
+
+    async def request(self, method, path, payload=None):
+        """
+        Send a request over an idle (or new) connection
+
+        Args:
+            method (str): HTTP method
+            path (str): Request path
+            payload (dict): JSON body
+
+        Returns:
+            tuple: (HTTP status, response body as text)
+
+        Raises:
+            asyncio.TimeoutError: If the server does not answer within the timeout
+            ConnectionError: If the connection fails or the response is malformed
+            asyncio.IncompleteReadError: If the server closes the connection mid-body
+        """
+        body = json.dumps(payload).encode() if payload is not None else b""
+        async with self._available:
+            while True:
+                reused = bool(self._idle)
+                if reused:
+                    reader, writer = self._idle.pop()
+                else:
+                    reader, writer = await asyncio.wait_for(self._open(), self.timeout)
+                keep_alive = False
+                try:
+                    status, text, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, method, path, body), self.timeout
+                    )
+                except ServerClosedError:
+                    # An idle connection the server has closed, nothing was processed: retry on a new one.
+                    # Once response bytes arrived the command may have run, so it is never sent twice
+                    if reused:
+                        continue
+                    raise
+                finally:
+                    # Failed, timed out or cancelled connections are never reused
+                    if not keep_alive:
+                        writer.close()
+                break
+
+        self.requests += 1
+        if keep_alive:
+            self._idle.append((reader, writer))
+        return status, text
+
+    async def close(self):
+        """Close all idle connections"""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+            await writer.wait_closed()
+
+    async def _open(self):
+        """Open a new connection"""
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def _exchange(self, reader, writer, method, path, body):
+        """Write one request and read its response"""
+        try:
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}:{self.port}\r\n"
+                "Connection: keep-alive\r\n"
+                "Content-Type: application/json;charset=UTF-8\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+            status_line = await reader.readline()
+        except ConnectionError as e:
+            raise ServerClosedError(f"Connection closed by server: {e}") from e
+        if not status_line:
+            raise ServerClosedError("Connection closed by server")
+
+        parts = status_line.split()
+        if len(parts) < 2 or not parts[1].isdigit():
+            raise ConnectionError(f"Malformed HTTP status line: {status_line!r}")
+        status = int(parts[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionResetError("Connection closed in the middle of the response")
+            if line in (b"\r\n", b"\n"):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                try:
+                    length = int(size_line.split(b";")[0], 16)
+                except ValueError:
+                    raise ConnectionError(f"Malformed chunk size: {size_line!r}") from None
+                chunk = await reader.readexactly(length + 2)
+                if not length:
+                    break
+                chunks.append(chunk[:-2])
+            content = b"".join(chunks)
+        else:
+            content = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return status, content.decode("utf-8"), keep_alive
+
+
+class AsyncWebDriver:
+    """One W3C WebDriver session"""
+
+    _error_handler = ErrorHandler()
+
+    def __init__(self, pool, session_id):
+        """
+        Initialize driver for an existing session (use AsyncDriverFactory.new_session)
+
+        Args:
+            pool (HTTPConnectionPool): Connections to the driver process
+            session_id (str): WebDriver session id
+        """
+        self.pool = pool
+        self.session_id = session_id
+
+    @classmethod
+    async def create(cls, pool, capabilities):
+        """
+        Start a new session
+
+        Args:
+            pool (HTTPConnectionPool): Connections to the driver process
+            capabilities (dict): Capabilities to always match
+
+        Returns:
+            AsyncWebDriver: Driver of the new session
+        """
+        value = await cls._send(pool, "POST", "/session", {"capabilities": {"alwaysMatch": capabilities}})
+        return cls(pool, value["sessionId"])
+
+    @classmethod
+    async def _send(cls, pool, method, path, payload=None):
+        """Send a command and return its value, raising the matching Selenium exception on errors"""
+        status, text = await pool.request(method, path, payload)
+        if status >= 400:
+            # Same shape as Selenium's RemoteConnection, so errors map to the same exceptions
+            cls._error_handler.check_response({"status": status, "value": text})
+            raise WebDriverException(f"HTTP {status}: {text}")
+        return json.loads(text)["value"]
+
+    async def execute(self, method, path, payload=None):
+        """
+        Send a command of this session
+
+        Args:
+            method (str): HTTP method
+            path (str): Path below /session/{id}
+            payload (dict): Command parameters
+
+        Returns:
+            Command value (element references are returned as AsyncWebElement)
+        """
+        value = await self._send(self.pool, method, f"/session/{self.session_id}{path}",
+                                 {} if payload is None and method == "POST" else payload)
+        return self._unwrap(value)
+
+    def _wrap(self, value):
+        """Turn AsyncWebElement arguments into W3C element references"""
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value):
+        """Turn W3C element references in results into AsyncWebElement"""
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    async def set_timeouts(self, implicit=0, page_load=PAGE_LOAD_TIMEOUT):
+        """
+        Set session timeouts
+
+        Args:
+            implicit (float): Implicit wait in seconds
+            page_load (float): Page load timeout in seconds
+        """
+        await self.execute("POST", "/timeouts", {"implicit": int(implicit * 1000), "pageLoad": int(page_load * 1000)})
+
+    async def get(self, url):
+        """Navigate to a URL"""
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self):
+        """Get the current URL"""
+        return await self.execute("GET", "/url")
+
+    async def title(self):
+        """Get the document title"""
+        return await self.execute("GET", "/title")
+
+    async def find_element(self, by, value):
+        """
+        Find the first element matching a locator (no waiting)
+
+        Returns:
+            AsyncWebElement: Element
+
+        Raises:
+            NoSuchElementException: If nothing matches
+        """
+        return await self.execute("POST", "/element", {"using": by, "value": value})
+
+    async def find_elements(self, by, value):
+        """Find all elements matching a locator (no waiting)"""
+        return await self.execute("POST", "/elements", {"using": by, "value": value})
+
+    async def execute_script(self, script, *args):
+        """Run JavaScript in the page and return its result"""
+        return await self.execute("POST", "/execute/sync", {"script": script, "args": self._wrap(list(args))})
+
+    async def add_cookie(self, cookie):
+        """Add a cookie for the current domain"""
+        await self.execute("POST", "/cookie", {"cookie": cookie})
+
+    async def get_cookies(self):
+        """Get all cookies visible to the current page"""
+        return await self.execute("GET", "/cookie")
+
+    async def delete_all_cookies(self):
+        """Delete all cookies"""
+        await self.execute("DELETE", "/cookie")
+
+    async def quit(self):
+        """End the session and close its browser"""
+        await self._send(self.pool, "DELETE", f"/session/{self.session_id}")
+
+
+class AsyncWebElement:
+    """Element reference of an AsyncWebDriver session"""
+
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+
+    async def click(self):
+        """Click the element"""
+        await self.driver.execute("POST", f"/element/{self.id}/click")
+
+    async def clear(self):
+        """Clear an input"""
+        await self.driver.execute("POST", f"/element/{self.id}/clear")
+
+    async def send_keys(self, text):
+        """Type text into the element"""
+        await self.driver.execute("POST", f"/element/{self.id}/value", {"text": str(text)})
+
+    async def text(self):
+        """Get the rendered text"""
+        return await self.driver.execute("GET", f"/element/{self.id}/text")
+
+    async def get_attribute(self, name):
+        """Get an attribute value"""
+        return await self.driver.execute("GET", f"/element/{self.id}/attribute/{name}")
+
+    async def is_displayed(self):
+        """Check if the element is visible"""
+        return await self.driver.execute("GET", f"/element/{self.id}/displayed")
+
+    async def is_enabled(self):
+        """Check if the element is enabled"""
+        return await self.driver.execute("GET", f"/element/{self.id}/enabled")
+
+
+class AsyncDriverFactory:
+    """Starts one chromedriver process and opens async sessions on it"""
+
+    def __init__(self, headless=True, lean=False, pool_size=ASYNC_POOL_SIZE):
+        """
+        Initialize factory
+
+        Args:
+            headless (bool): Run browsers in headless mode
+            lean (bool): Lean page load options (resource blocking through DevTools is not available)
+            pool_size (int): Maximum HTTP connections to chromedriver
+        """
+        self.headless = headless
+        self.lean = lean
+        self.pool_size = pool_size
+        self.service = None
+        self.pool = None
+
+    def start(self):
+        """Start chromedriver (call from the event loop's thread before opening sessions)"""
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        self.service = ChromeService(resolver.resolve("chrome"))
+        self.service.start()
+        self.pool = HTTPConnectionPool(self.service.service_url, self.pool_size)
+        logger.info("Async chromedriver listening on %s", self.service.service_url)
+
+    async def new_session(self):
+        """
+        Launch a browser session
+
+        Returns:
+            AsyncWebDriver: Driver with implicit wait 0, waits are explicit in AsyncBasePage
+        """
+        capabilities = DriverFactory.chrome_options(self.headless, self.lean).to_capabilities()
+        driver = await AsyncWebDriver.create(self.pool, capabilities)
+        try:
+            await driver.set_timeouts(implicit=0)
+        except BaseException:
+            # Don't leave the browser running
+            try:
+                await driver.quit()
+            except Exception as e:
+                logger.warning("Could not quit session %s: %s", driver.session_id, e)
+            raise
+        logger.info("Async session %s started", driver.session_id)
+        return driver
+
+    async def close(self):
+        """Close pooled connections and stop chromedriver"""
+        if self.pool:
+            await self.pool.close()
+            logger.info("Async connection pool closed (%s requests over %s connections)",
+                        self.pool.requests, self.pool.opened)
+        if self.service:
+            self.service.stop()
@@ -0,0 +1,254 @@
+"""
+Journey Benchmark - Pytest plugin timing user journeys over repeated runs (--benchmark)
+
+Tests marked @pytest.mark.benchmark are skipped unless --benchmark is given. Each test
+reports p50/p90/p99 per step as the "benchmark" user property; the controller prints them
+and saves them to BENCHMARK_DIR, where a later run can use them as a baseline.
+"""
+import json
+import math
+import time
+from contextlib import contextmanager
+import pytest
+from config.config import BENCHMARK_DIR, BENCHMARK_RUNS, BENCHMARK_THRESHOLD_PCT
+import logging
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 90, 99)
+
+# Navigation Timing of the current document, in ms since navigation start
+NAVIGATION_TIMING_SCRIPT = """
+var entry = performance.getEntriesByType('navigation')[0];
+if (!entry) { return null; }
+return {
+    document: performance.timeOrigin,
+    ttfb: entry.responseStart - entry.startTime,
+    dom_content_loaded: entry.domContentLoadedEventEnd - entry.startTime,
+    load: entry.loadEventEnd - entry.startTime
+};
+"""
+
+
+def pytest_addoption(parser):
+    """Add benchmark command line options"""
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run tests marked benchmark (skipped otherwise)"
+    )
+    parser.addoption(
+        "--benchmark-runs",
+        action="store",
+        type=int,
+        default=BENCHMARK_RUNS,
+        help="Journey repetitions per benchmark test"
+    )
+    parser.addoption(
+        "--benchmark-save",
+        action="store",
+        default=None,
+        metavar="NAME",
+        help=f"Also save results as NAME.json in {BENCHMARK_DIR} (always saved as latest.json)"
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        action="store",
+        default=None,
+        metavar="NAME",
+        help="Fail benchmark tests whose step p50 regressed against saved results NAME"
+    )
+    parser.addoption(
+        "--benchmark-threshold",
+        action="store",
+        type=float,
+        default=BENCHMARK_THRESHOLD_PCT,
+        help="Allowed p50 regression against the baseline in percent"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests unless --benchmark is given"""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def benchmark_settings(request):
+    """
+    Benchmark settings from the command line
+
+    Args:
+        request: Pytest request object
+
+    Returns:
+        dict: runs, baseline (saved results or None) and threshold
+    """
+    baseline = request.config.getoption("--benchmark-baseline")
+    return {
+        "runs": request.config.getoption("--benchmark-runs"),
+        "baseline": load_results(baseline) if baseline else None,
+        "threshold": request.config.getoption("--benchmark-threshold")
+    }
+
+
+class JourneyTimer:
+    """Times named steps of one journey run, plus Navigation Timing of documents loaded by them"""
+
+    def __init__(self, driver):
+        """
+        Initialize timer
+
+        Args:
+            driver: WebDriver instance
+        """
+        self.driver = driver
+        self.timings = {}
+        self._document = None
+
+    @contextmanager
+    def step(self, name):
+        """
+        Time a step; if it loaded a new document, also record <name>.ttfb / .dom_content_loaded / .load
+
+        Args:
+            name (str): Step name
+        """
+        start = time.perf_counter()
+        yield
+        self.timings[name] = (time.perf_counter() - start) * 1000
+
+        navigation = self.driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+        if navigation and navigation["document"] != self._document:
+            self._document = navigation.pop("document")
+            for metric, value in navigation.items():
+                # 0 = event not reached yet (e.g. load still running)
+                if value > 0:
+                    self.timings[f"{name}.{metric}"] = value
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile
+
+    Args:
+        values (list): Measurements
+        pct (float): Percentile (0-100)
+
+    Returns:
+        float: Value at that percentile
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_runs(runs):
+    """
+    Percentiles per step over repeated runs
+
+    Args:
+        runs (list): Timings dict (step -> ms) per run
+
+    Returns:
+        dict: {step: {"p50": ms, "p90": ms, "p99": ms, "runs": count}}
+    """
+    steps = {}
+    for timings in runs:
+        for step, value in timings.items():
+            steps.setdefault(step, []).append(value)
+    return {
+        step: dict({f"p{pct}": percentile(values, pct) for pct in PERCENTILES}, runs=len(values))
+        for step, values in steps.items()
+    }
+
+
+def compare(stats, baseline, threshold):
+    """
+    Find steps whose p50 got slower than the baseline by more than the threshold
+
+    Args:
+        stats (dict): summarize_runs result
+        baseline (dict): summarize_runs result of an earlier run
+        threshold (float): Allowed regression in percent
+
+    Returns:
+        list: Descriptions of regressed steps
+    """
+    regressions = []
+    for step, current in stats.items():
+        previous = baseline.get(step)
+        if not previous or previous["p50"] <= 0:
+            continue
+        change = (current["p50"] - previous["p50"]) / previous["p50"] * 100
+        if change > threshold:
+            regressions.append(f"{step}: p50 {previous['p50']:.0f}ms -> {current['p50']:.0f}ms (+{change:.0f}%)")
+    return regressions
+
+
+def load_results(name):
+    """
+    Load saved benchmark results
+
+    Args:
+        name (str): Results name (file BENCHMARK_DIR/<name>.json)
+
+    Returns:
+        dict: {test id: summarize_runs result}
+    """
+    path = BENCHMARK_DIR / f"{name}.json"
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except OSError as e:
+        raise pytest.UsageError(f"Cannot read benchmark baseline {path}: {e}")
+
+
+def save_results(results, name):
+    """
+    Save benchmark results
+
+    Args:
+        results (dict): {test id: summarize_runs result}
+        name (str): Results name
+
+    Returns:
+        Path: Written file
+    """
+    BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    path = BENCHMARK_DIR / f"{name}.json"
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print and save benchmark percentiles (collected from all xdist workers)"""
+    results = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) == "teardown":
+                for key, value in report.user_properties:
+                    if key == "benchmark":
+                        results[value["id"]] = value["steps"]
+    if not results:
+        return
+
+    terminalreporter.write_sep("=", "benchmark")
+    for test_id, stats in results.items():
+        terminalreporter.write_line(f"{test_id}")
+        terminalreporter.write_line(f"  {'p50':>9} {'p90':>9} {'p99':>9} {'runs':>5}  step")
+        for step, row in stats.items():
+            terminalreporter.write_line(
+                f"  {row['p50']:7.0f}ms {row['p90']:7.0f}ms {row['p99']:7.0f}ms {row['runs']:5d}  {step}"
+            )
+
+    paths = [save_results(results, "latest")]
+    if config.getoption("--benchmark-save"):
+        paths.append(save_results(results, config.getoption("--benchmark-save")))
+    terminalreporter.write_line(f"results saved to {', '.join(str(path) for path in paths)}")
@@ -0,0 +1,198 @@
+"""
+Browser Metrics - Captures the browser's own timing data at page transitions (--browser-metrics)
+
+Page object methods that navigate are decorated with @page_transition("name"). While a
+test collects metrics, each transition records Navigation, Paint and Resource timings of
+the page it led to, plus Chrome performance counters (JS heap, layouts, style recalcs).
+"""
+import functools
+import time
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from config.config import BROWSER_METRICS_WAIT
+from utils.dom import LOCATOR_FUNCTIONS
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Chrome performance counters kept from Performance.getMetrics
+CHROME_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "Documents", "LayoutCount", "RecalcStyleCount",
+                  "LayoutDuration", "RecalcStyleDuration", "ScriptDuration", "TaskDuration")
+
+# Slowest resources listed per transition
+SLOWEST_RESOURCES = 5
+
+# arguments: none -> where the page is now (compared after the transition)
+MARK_SCRIPT = """
+return {href: location.href, document: performance.timeOrigin, now: performance.now()};
+"""
+
+# arguments: href before the transition, by and value of the page's error message (or null)
+# -> "navigated" once a new page has loaded, "error" while the error message is shown, else null
+TRANSITION_STATE_SCRIPT = LOCATOR_FUNCTIONS + """
+var href = arguments[0], errorBy = arguments[1], errorValue = arguments[2];
+if (document.readyState === 'complete' && location.href !== href) { return 'navigated'; }
+if (errorBy && findElements(errorBy, errorValue).some(isVisible)) { return 'error'; }
+return null;
+"""
+
+# arguments: since (performance.now() before the transition, or 0 for a new document)
+TIMINGS_SCRIPT = """
+var since = arguments[0], limit = arguments[1];
+var navigation = performance.getEntriesByType('navigation')[0];
+var resources = performance.getEntriesByType('resource').filter(function (entry) {
+    return entry.startTime >= since;
+});
+var paint = {};
+performance.getEntriesByType('paint').forEach(function (entry) { paint[entry.name] = entry.startTime; });
+return {
+    navigation: navigation ? {
+        type: navigation.type,
+        redirect: navigation.redirectEnd - navigation.redirectStart,
+        dns: navigation.domainLookupEnd - navigation.domainLookupStart,
+        connect: navigation.connectEnd - navigation.connectStart,
+        ttfb: navigation.responseStart - navigation.startTime,
+        response: navigation.responseEnd - navigation.responseStart,
+        dom_interactive: navigation.domInteractive - navigation.startTime,
+        dom_content_loaded: navigation.domContentLoadedEventEnd - navigation.startTime,
+        load: navigation.loadEventEnd - navigation.startTime,
+        transfer_size: navigation.transferSize
+    } : null,
+    paint: paint,
+    resources: {
+        count: resources.length,
+        transfer_size: resources.reduce(function (total, entry) { return total + (entry.transferSize || 0); }, 0),
+        slowest: resources.sort(function (a, b) { return b.duration - a.duration; })
+            .slice(0, limit)
+            .map(function (entry) { return {name: entry.name, type: entry.initiatorType, duration: entry.duration}; })
+    }
+};
+"""
+
+
+class BrowserMetrics:
+    """Browser metrics of the page transitions of one test"""
+
+    # Collector of the running test (None when --browser-metrics is off or outside tests)
+    current = None
+
+    def __init__(self):
+        self.transitions = []
+
+    @classmethod
+    def start(cls):
+        """
+        Start collecting for a new test
+
+        Returns:
+            BrowserMetrics: The new current collector
+        """
+        cls.current = cls()
+        return cls.current
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop collecting
+
+        Returns:
+            list: Captured transitions (empty if none was collecting)
+        """
+        collector, cls.current = cls.current, None
+        return collector.transitions if collector else []
+
+    @staticmethod
+    def mark(driver):
+        """Where the page is before a transition"""
+        return driver.execute_script(MARK_SCRIPT)
+
+    def capture(self, driver, name, before, started, error_locator=None):
+        """
+        Wait for the transition to land and record its metrics (nothing is recorded if
+        the page shows its error message or does not navigate)
+
+        Args:
+            driver: WebDriver instance
+            name (str): Transition name
+            before (dict): mark() taken before the transition
+            started (float): perf_counter() before the transition
+            error_locator: Tuple of (By, value) of the page's error message, e.g. a rejected login
+        """
+        error_by, error_value = error_locator or (None, None)
+        try:
+            # Scripts can fail while the old document unloads, keep polling then
+            state = WebDriverWait(driver, BROWSER_METRICS_WAIT, poll_frequency=0.05,
+                                  ignored_exceptions=(JavascriptException,)).until(
+                lambda d: d.execute_script(TRANSITION_STATE_SCRIPT, before["href"], error_by, error_value)
+            )
+        except TimeoutException:
+            state = None
+        if state != "navigated":
+            logger.debug("Transition '%s' did not navigate (%s), not recorded", name, state or "timeout")
+            return
+        duration = (time.perf_counter() - started) * 1000
+
+        after = self.mark(driver)
+        new_document = after["document"] != before["document"]
+        timings = driver.execute_script(TIMINGS_SCRIPT, 0 if new_document else before["now"], SLOWEST_RESOURCES)
+        if not new_document:
+            # Same document (client-side routing), its navigation and paint entries are from the first load
+            timings["navigation"] = None
+            timings["paint"] = {}
+
+        self.transitions.append({
+            "name": name,
+            "url": after["href"],
+            "new_document": new_document,
+            "duration_ms": duration,
+            "navigation": timings["navigation"],
+            "paint": timings["paint"],
+            "resources": timings["resources"],
+            "chrome": self._chrome_metrics(driver)
+        })
+        logger.debug("Captured browser metrics for transition '%s' (%.0fms)", name, duration)
+
+    @staticmethod
+    def _chrome_metrics(driver):
+        """Chrome performance counters through DevTools (None on other browsers)"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return None
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        except WebDriverException as e:
+            logger.debug("Chrome performance metrics not available: %s", e)
+            return None
+        return {metric["name"]: metric["value"] for metric in metrics if metric["name"] in CHROME_METRICS}
+
+
+def page_transition(name):
+    """
+    Decorator marking a page object method that navigates to another page
+
+    Args:
+        name (str): Transition name (also usable as a budget step, e.g. "checkout_finish")
+
+    Returns:
+        callable: Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            collector = BrowserMetrics.current
+            if collector is None:
+                return func(self, *args, **kwargs)
+
+            before = collector.mark(self.driver)
+            started = time.perf_counter()
+            result = func(self, *args, **kwargs)
+            try:
+                collector.capture(self.driver, name, before, started, getattr(self, "ERROR_MESSAGE", None))
+            except WebDriverException as e:
+                logger.warning("Could not capture browser metrics for '%s': %s", name, e)
+            return result
+
+        wrapper.transition = name
+        return wrapper
+
+    return decorator
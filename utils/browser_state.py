@@ -0,0 +1,107 @@
+"""
+Browser State - Snapshot and restore of cookies, local/session storage and current page
+
+Used by the browser_checkpoint fixture: expensive preconditions (login, cart, checkout step)
+are built through the app once per test class and worker, then restored in the clean
+browser of every following test.
+"""
+from urllib.parse import urlsplit
+import logging
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_STORAGE_SCRIPT = """
+function read(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+return {local: read(window.localStorage), session: read(window.sessionStorage)};
+"""
+
+# arguments: local items, session items
+RESTORE_STORAGE_SCRIPT = """
+var local = arguments[0], session = arguments[1];
+window.localStorage.clear();
+window.sessionStorage.clear();
+Object.keys(local).forEach(function (key) { window.localStorage.setItem(key, local[key]); });
+Object.keys(session).forEach(function (key) { window.sessionStorage.setItem(key, session[key]); });
+"""
+
+
+class BrowserSnapshot:
+    """Cookies, storage and URL of one browser tab"""
+
+    def __init__(self, url, cookies, local_storage, session_storage):
+        """
+        Initialize snapshot
+
+        Args:
+            url (str): Page the browser was on
+            cookies (list): Cookies as returned by driver.get_cookies()
+            local_storage (dict): localStorage items
+            session_storage (dict): sessionStorage items
+        """
+        self.url = url
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+
+    @classmethod
+    def capture(cls, driver):
+        """
+        Take a snapshot of the current page's origin
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            BrowserSnapshot: Snapshot of the browser state
+        """
+        storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        snapshot = cls(driver.current_url, driver.get_cookies(), storage["local"], storage["session"])
+        logger.info("Captured browser state at %s (%s cookies, %s localStorage items)",
+                    snapshot.url, len(snapshot.cookies), len(snapshot.local_storage))
+        return snapshot
+
+    @property
+    def origin(self):
+        """Scheme and host of the captured page"""
+        parts = urlsplit(self.url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def restore(self, driver):
+        """
+        Replace the browser's cookies and storage with the snapshot and open the captured page
+
+        Args:
+            driver: WebDriver instance (clean, e.g. fresh or reset by the driver pool)
+        """
+        # Cookies and storage can only be written for the origin currently loaded
+        if not driver.current_url.startswith(self.origin):
+            driver.get(self.origin)
+
+        driver.delete_all_cookies()
+        for cookie in self.cookies:
+            # Set for the current host, an explicit domain is rejected for e.g. localhost
+            driver.add_cookie({key: value for key, value in cookie.items() if key != "domain"})
+        driver.execute_script(RESTORE_STORAGE_SCRIPT, self.local_storage, self.session_storage)
+
+        driver.get(self.url)
+        logger.info("Restored browser state at %s", self.url)
+
+    def matches(self, driver, page_class):
+        """
+        Check the browser shows the captured page
+
+        Args:
+            driver: WebDriver instance
+            page_class: Page object class with is_page_loaded() the state is expected on
+
+        Returns:
+            bool: True if the URL matches and the page object reports the page as loaded
+        """
+        return driver.current_url == self.url and page_class(driver).is_page_loaded()
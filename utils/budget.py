@@ -0,0 +1,127 @@
+"""
+Performance Budgets - Pytest plugin enforcing @pytest.mark.budget latency budgets
+
+    @pytest.mark.budget(total_ms=8000, step={"checkout_finish": 1500})
+
+total_ms covers setup and call of the test. Step names are page transitions
+(see utils/browser_metrics.py, measured until the next page has loaded) or timeline
+steps such as "CheckoutPage.fill_checkout_information" (summed over all calls). Tests with
+step budgets capture page transitions even without --browser-metrics.
+"""
+import pytest
+from config.config import BUDGET_MODE
+from utils.browser_metrics import BrowserMetrics
+from utils.timeline import Timeline
+from utils.helpers import attach_json
+import logging
+
+logger = logging.getLogger(__name__)
+
+setup_duration_key = pytest.StashKey[float]()
+budget_result_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    """Add budget command line option"""
+    parser.addoption(
+        "--budget-mode",
+        action="store",
+        choices=["fail", "warn", "off"],
+        default=None,
+        help=f"What exceeding a budget marker does (default: marker's mode, else {BUDGET_MODE})"
+    )
+
+
+def measured_steps():
+    """
+    Durations of the running test's page transitions and timeline steps
+
+    Returns:
+        dict: Milliseconds by step name
+    """
+    durations = {}
+    if BrowserMetrics.current:
+        for transition in BrowserMetrics.current.transitions:
+            durations[transition["name"]] = durations.get(transition["name"], 0.0) + transition["duration_ms"]
+    if Timeline.current:
+        for step in Timeline.current.steps:
+            durations[step["name"]] = durations.get(step["name"], 0.0) + step["duration"] * 1000
+    return durations
+
+
+def check_budget(marker, total_ms, steps):
+    """
+    Compare measurements with a budget marker
+
+    Args:
+        marker: budget marker (total_ms=..., step={name: ms})
+        total_ms (float): Measured test duration
+        steps (dict): Measured milliseconds by step name
+
+    Returns:
+        dict: budget, measured and over (descriptions of exceeded budgets)
+    """
+    total_budget = marker.kwargs.get("total_ms")
+    step_budgets = marker.kwargs.get("step", {})
+    over = []
+
+    if total_budget is not None and total_ms > total_budget:
+        over.append(f"total: {total_ms:.0f}ms > {total_budget}ms")
+    for name, budget in step_budgets.items():
+        if name not in steps:
+            over.append(f"{name}: not measured (budget {budget}ms)")
+        elif steps[name] > budget:
+            over.append(f"{name}: {steps[name]:.0f}ms > {budget}ms")
+
+    return {
+        "budget": {"total_ms": total_budget, "step": step_budgets},
+        "measured": {"total_ms": total_ms, "step": {name: steps.get(name) for name in step_budgets}},
+        "over": over
+    }
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Check the budget when the test body finished and fail / warn if it was exceeded"""
+    outcome = yield
+    report = outcome.get_result()
+    marker = item.get_closest_marker("budget")
+    if not marker:
+        return
+
+    if report.when == "setup":
+        item.stash[setup_duration_key] = report.duration
+        return
+    if report.when != "call":
+        return
+
+    total_ms = (item.stash.get(setup_duration_key, 0.0) + report.duration) * 1000
+    result = check_budget(marker, total_ms, measured_steps())
+    mode = item.config.getoption("--budget-mode") or marker.kwargs.get("mode", BUDGET_MODE)
+    result["mode"] = mode
+    item.stash[budget_result_key] = result
+    if not result["over"] or mode == "off":
+        return
+
+    message = f"Over budget: {'; '.join(result['over'])}"
+    logger.warning("%s: %s", item.nodeid, message)
+    if mode == "fail" and report.passed:
+        report.outcome = "failed"
+        report.longrepr = message
+    elif mode == "warn":
+        item.warn(pytest.PytestWarning(message))
+
+
+@pytest.fixture(scope="function", autouse=True)
+def budget_report(request):
+    """
+    Attach the budget check of tests marked budget to the HTML and Allure reports
+
+    Args:
+        request: Pytest request object
+    """
+    yield
+    result = request.node.stash.get(budget_result_key, None)
+    if result:
+        request.node.user_properties.append(("budget", result))
+        attach_json("budget", result)
@@ -0,0 +1,202 @@
+"""
+Command Profiler - Pytest plugin counting the WebDriver commands each test sends (--profile-commands)
+
+The command executor of every driver handed out by the driver fixture is wrapped, so each
+HTTP round trip is counted with its latency by command, locator, page object method and
+test. Page object calls that send the same command to many elements one by one (e.g. one
+getElementText per product) are flagged as per-element loops.
+"""
+import functools
+import time
+import pytest
+from config.config import COMMAND_PROFILE_SIZE, COMMAND_LOOP_THRESHOLD
+from utils.timeline import Timeline
+import logging
+
+logger = logging.getLogger(__name__)
+
+command_profile_key = pytest.StashKey[list]()
+
+# W3C key of element references in responses
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+FIND_COMMANDS = ("findElement", "findElements", "findChildElement", "findChildElements")
+
+
+def pytest_addoption(parser):
+    """Add command profiling command line option"""
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        default=False,
+        help="Count WebDriver commands and their latency per test, command, locator and page method"
+    )
+
+
+def pytest_configure(config):
+    """Start profiling WebDriver commands"""
+    config.stash[command_profile_key] = []
+    if config.getoption("--profile-commands"):
+        config.pluginmanager.register(CommandProfiler(config), "command_profiler")
+
+
+def _add(table, key, elapsed):
+    """Add one command to a {key: {"count", "time"}} table"""
+    row = table.setdefault(key, {"count": 0, "time": 0.0})
+    row["count"] += 1
+    row["time"] += elapsed
+
+
+class CommandProfiler:
+    """Counts the WebDriver commands of one process and reports them at the end of the session"""
+
+    def __init__(self, config):
+        self.config = config
+        self.nodeid = None
+        self.tests = {}
+        self.commands = {}
+        self.locators = {}
+        self.methods = {}
+        self.loops = []
+        # Locator each element of the running test was found with, and elements per
+        # (page object call, command, locator)
+        self._elements = {}
+        self._targets = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        """Wrap the command executor of drivers handed to tests"""
+        outcome = yield
+        if fixturedef.argname == "driver" and outcome.excinfo is None:
+            self.install(outcome.get_result())
+
+    def install(self, driver):
+        """
+        Wrap a driver's command executor (once, pooled drivers keep their wrapper)
+
+        Args:
+            driver: WebDriver instance
+        """
+        executor = driver.command_executor
+        if getattr(executor, "profiled", False):
+            return
+        execute = executor.execute
+
+        @functools.wraps(execute)
+        def profiled(command, params):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = execute(command, params)
+                return response
+            finally:
+                self.record(command, params or {}, response, time.perf_counter() - start)
+
+        executor.execute = profiled
+        executor.profiled = True
+
+    def record(self, command, params, response, elapsed):
+        """
+        Count one command
+
+        Args:
+            command (str): Command name, e.g. findElements or getElementText
+            params (dict): Command parameters
+            response (dict): Raw response (None if the request failed)
+            elapsed (float): Round trip in seconds
+        """
+        element = params.get("id")
+        if "using" in params:
+            locator = f"{params['using']}={params['value']}"
+        else:
+            locator = self._elements.get(element)
+
+        if command in FIND_COMMANDS and response:
+            found = response.get("value")
+            for reference in found if isinstance(found, list) else [found]:
+                if isinstance(reference, dict) and ELEMENT_KEY in reference:
+                    self._elements[reference[ELEMENT_KEY]] = locator
+
+        call = Timeline.outer_step_call()
+        method = call[0] if call else "(test)"
+        _add(self.tests, self.nodeid, elapsed)
+        _add(self.commands, command, elapsed)
+        _add(self.methods, method, elapsed)
+        if locator:
+            _add(self.locators, locator, elapsed)
+        if element and locator:
+            self._targets.setdefault((call, command, locator), set()).add(element)
+
+    def pytest_runtest_logstart(self, nodeid):
+        """Attribute the following commands to this test"""
+        self.nodeid = nodeid
+
+    def pytest_runtest_logfinish(self, nodeid):
+        """Flag per-element command loops of the finished test's page object calls"""
+        for (call, command, locator), elements in self._targets.items():
+            if len(elements) >= COMMAND_LOOP_THRESHOLD:
+                # Commands sent by the test body itself are grouped per test
+                method = call[0] if call else "(test)"
+                self.loops.append({"test": nodeid, "method": method, "command": command,
+                                   "locator": locator, "elements": len(elements)})
+                logger.warning("%s: %s sent %s to %s elements of %s one by one",
+                               nodeid, method, command, len(elements), locator)
+        self._elements.clear()
+        self._targets.clear()
+
+    def pytest_sessionfinish(self):
+        """Hand the counts to the xdist controller"""
+        profile = {
+            "tests": self.tests,
+            "commands": self.commands,
+            "locators": self.locators,
+            "methods": self.methods,
+            "loops": self.loops
+        }
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput["command_profile"] = profile
+        else:
+            self.config.stash[command_profile_key].append(profile)
+
+    def pytest_testnodedown(self, node):
+        """Collect counts sent by an xdist worker"""
+        profile = getattr(node, "workeroutput", {}).get("command_profile")
+        if profile:
+            self.config.stash[command_profile_key].append(profile)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print commands per test, command, locator and page method, and flagged loops"""
+        tests, commands, locators, methods, loops = {}, {}, {}, {}, []
+        for profile in self.config.stash[command_profile_key]:
+            for merged, table in ((tests, profile["tests"]), (commands, profile["commands"]),
+                                  (locators, profile["locators"]), (methods, profile["methods"])):
+                for key, row in table.items():
+                    total = merged.setdefault(key, {"count": 0, "time": 0.0})
+                    total["count"] += row["count"]
+                    total["time"] += row["time"]
+            loops.extend(profile["loops"])
+        if not tests:
+            return
+
+        terminalreporter.write_sep("=", "webdriver commands")
+        count = sum(row["count"] for row in tests.values())
+        rpc_time = sum(row["time"] for row in tests.values())
+        terminalreporter.write_line(f"{count} commands, {rpc_time:.2f}s total RPC time")
+
+        terminalreporter.write_line(f"{'commands':>9} {'RPC time':>9} {'avg':>8}  test")
+        for nodeid, row in sorted(tests.items(), key=lambda item: -item[1]["count"]):
+            terminalreporter.write_line(f"{row['count']:9d} {row['time']:8.2f}s "
+                                        f"{row['time'] / row['count'] * 1000:6.1f}ms  {nodeid}")
+
+        for title, table in (("command", commands), ("locator", locators), ("page method", methods)):
+            terminalreporter.write_line(f"{'commands':>9} {'RPC time':>9} {'avg':>8}  {title}")
+            for key, row in sorted(table.items(), key=lambda item: -item[1]["time"])[:COMMAND_PROFILE_SIZE]:
+                terminalreporter.write_line(f"{row['count']:9d} {row['time']:8.2f}s "
+                                            f"{row['time'] / row['count'] * 1000:6.1f}ms  {key}")
+
+        if loops:
+            terminalreporter.write_line(f"per-element command loops (same command on >= {COMMAND_LOOP_THRESHOLD} "
+                                        f"elements in one page method, BasePage.read_all does it in one call):")
+            for loop in sorted(loops, key=lambda loop: -loop["elements"])[:COMMAND_PROFILE_SIZE]:
+                terminalreporter.write_line(f"  {loop['elements']:4d}x {loop['command']} on {loop['locator']} "
+                                            f"in {loop['method']}  ({loop['test']})")
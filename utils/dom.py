@@ -0,0 +1,115 @@
+"""
+DOM Scripts - JavaScript helpers that resolve Selenium locators inside the page
+
+Scripts run as a single execute_script call, so they are not affected by the driver's implicit wait.
+"""
+
+# findElements(by, value) and isVisible(element), usable by any script that includes them
+LOCATOR_FUNCTIONS = """
+function findElements(by, value) {
+    switch (by) {
+        case 'id': return Array.from(document.querySelectorAll('#' + CSS.escape(value)));
+        case 'class name': return Array.from(document.querySelectorAll('.' + CSS.escape(value)));
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'xpath':
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+        case 'link text':
+            return Array.from(document.querySelectorAll('a')).filter(function (a) {
+                return a.innerText.trim() === value;
+            });
+        case 'partial link text':
+            return Array.from(document.querySelectorAll('a')).filter(function (a) {
+                return a.innerText.indexOf(value) !== -1;
+            });
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+
+function isVisible(element) {
+    if (!element.isConnected) { return false; }
+    var style = window.getComputedStyle(element);
+    if (style.visibility === 'hidden' || style.display === 'none' || parseFloat(style.opacity) === 0) {
+        return false;
+    }
+    var rect = element.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+# arguments: by, value, visible_only -> number of matching elements
+COUNT_SCRIPT = LOCATOR_FUNCTIONS + """
+var elements = findElements(arguments[0], arguments[1]);
+return arguments[2] ? elements.filter(isVisible).length : elements.length;
+"""
+
+# arguments: by, value, condition, timeout_ms, callback -> {found, result}
+# Resolves as soon as a DOM mutation (or the in-page fallback poll) satisfies the condition
+WAIT_SCRIPT = LOCATOR_FUNCTIONS + """
+var by = arguments[0], value = arguments[1], condition = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function check() {
+    var elements = findElements(by, value);
+    var first = elements[0];
+    switch (condition) {
+        case 'present_all': return elements.length ? elements : null;
+        case 'visible': return first && isVisible(first) ? first : null;
+        case 'clickable': return first && isVisible(first) && !first.disabled ? first : null;
+        case 'shown': return elements.some(isVisible) ? true : null;
+        case 'absent': return elements.some(isVisible) ? null : true;
+    }
+    throw new Error('Unsupported wait condition: ' + condition);
+}
+
+var observer, timer, poll, finished = false;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    clearInterval(poll);
+    done(result === null ? {found: false} : {found: true, result: result});
+}
+function onChange() {
+    var result = check();
+    if (result !== null) { finish(result); }
+}
+
+var initial = check();
+if (initial !== null) {
+    finish(initial);
+} else {
+    observer = new MutationObserver(onChange);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    // Catches changes without DOM mutations (e.g. CSS transitions finishing)
+    poll = setInterval(onChange, 100);
+    timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+"""
+
+# arguments: fields ([by, value, text] per field) -> {missing: [field index], values: [value after fill]}
+# Fills nothing unless every field exists. Values go through the native value setter and
+# input/change events are dispatched, so React controlled inputs update their state.
+FILL_SCRIPT = LOCATOR_FUNCTIONS + """
+var fields = arguments[0];
+var elements = fields.map(function (field) { return findElements(field[0], field[1])[0]; });
+var missing = [];
+elements.forEach(function (element, index) { if (!element) { missing.push(index); } });
+if (missing.length) { return {missing: missing, values: []}; }
+
+elements.forEach(function (element, index) {
+    var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    var setter = Object.getOwnPropertyDescriptor(prototype, 'value').set;
+    element.focus();
+    setter.call(element, fields[index][2]);
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.blur();
+});
+return {missing: [], values: elements.map(function (element) { return element.value; })};
+"""
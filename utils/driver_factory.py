@@ -1,16 +1,15 @@
 """
 WebDriver Factory - Manages browser driver creation and configuration
+
+Browser specific Selenium modules are imported when a driver of that type is created.
 """
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService, Service
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-
-from config.browser_config import *
-from config.config import IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT, PROJECT_ROOT
+from config.browser_config import DEFAULT_BROWSER, SUPPORTED_BROWSERS, LEAN_PROFILE, FIREFOX_OPTIONS, EDGE_OPTIONS
+from config.config import IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT
+from utils.driver_resolver import resolver
+from utils.lean_profile import LeanProfile
+from utils.process_memory import process_tree_rss
+import time
 import logging
-import os
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +17,22 @@ logger = logging.getLogger(__name__)
 class DriverFactory:
     """Factory class to create WebDriver instances"""
 
+    # (browser, seconds) of every launch, drained by the timing database (utils/timing_db.py)
+    launches = []
+
     @staticmethod
-    def get_driver(browser=DEFAULT_BROWSER, headless=False):
+    def get_driver(browser=DEFAULT_BROWSER, headless=False, lean=False, implicit_wait=IMPLICIT_WAIT,
+                   debugging_port=None, debugger_address=None):
         """
         Create and return a WebDriver instance
         
         Args:
             browser (str): Browser name (chrome, firefox, edge)
             headless (bool): Run browser in headless mode
+            lean (bool): Apply the lean page load profile (Chrome only)
+            implicit_wait (int): Implicit wait in seconds (0 = explicit waits only)
+            debugging_port (int): Open Chrome's remote debugging port so other sessions can attach
+            debugger_address (str): Attach to an already running Chrome at "host:port" instead of launching one
             
         Returns:
             WebDriver: Configured WebDriver instance
@@ -34,39 +41,104 @@ class DriverFactory:
 
         if browser not in SUPPORTED_BROWSERS:
             raise ValueError(f"Browser '{browser}' not supported. Choose from {SUPPORTED_BROWSERS}")
+        if (debugging_port or debugger_address) and browser != "chrome":
+            raise ValueError("Sharing a browser between sessions is only supported for chrome")
 
-        logger.info(f"Initializing {browser} driver (headless: {headless})")
+        logger.info("Initializing %s driver (headless: %s)", browser, headless)
+        start = time.perf_counter()
 
         if browser == "chrome":
-            driver = DriverFactory._get_chrome_driver(headless)
+            driver = DriverFactory._get_chrome_driver(headless, lean, debugging_port, debugger_address)
         elif browser == "firefox":
             driver = DriverFactory._get_firefox_driver(headless)
         elif browser == "edge":
             driver = DriverFactory._get_edge_driver(headless)
 
         # Set timeouts
-        driver.implicitly_wait(IMPLICIT_WAIT)
+        driver.implicitly_wait(implicit_wait)
         driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
 
-        # Maximize window (if not headless)
-        if not headless:
+        # Maximize window (if not headless, and not in a browser shared with other sessions)
+        if not headless and not debugger_address:
             driver.maximize_window()
 
-        logger.info(f"{browser.capitalize()} driver initialized successfully")
+        DriverFactory.launches.append((browser, time.perf_counter() - start))
+        logger.info("%s driver initialized successfully", browser.capitalize())
         return driver
 
     @staticmethod
-    def _get_chrome_driver(headless: bool = False) -> webdriver.Chrome:
+    def get_memory(driver):
+        """
+        Resident memory of the driver process and the browser processes it launched
+
+        Args:
+            driver: WebDriver instance created by get_driver
+
+        Returns:
+            int: Bytes, or None if unknown (not Linux, or no local driver process)
+        """
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None:
+            return None
+        return process_tree_rss(process.pid)
+
+    @staticmethod
+    def _get_chrome_driver(headless: bool = False, lean: bool = False, debugging_port: int = None,
+                           debugger_address: str = None):
         """
-        Initialize Chrome WebDriver with ChromeDriverManager
+        Initialize Chrome WebDriver (driver binary resolved through the on-disk cache)
 
         Args:
             headless: Whether to run in headless mode
+            lean: Block images, fonts, media and analytics (see LEAN_PROFILE)
+            debugging_port: Remote debugging port to open
+            debugger_address: "host:port" of a running Chrome to attach to (launch options are ignored)
 
         Returns:
             Chrome WebDriver instance
         """
-        options = webdriver.ChromeOptions()
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from selenium.webdriver.chrome.webdriver import WebDriver as Chrome
+
+        if debugger_address:
+            options = ChromeOptions()
+            options.debugger_address = debugger_address
+            driver = Chrome(service=ChromeService(resolver.resolve("chrome")), options=options)
+            logger.info("Attached to Chrome at %s", debugger_address)
+            return driver
+
+        options = DriverFactory.chrome_options(headless, lean, debugging_port)
+
+        try:
+            service = ChromeService(resolver.resolve("chrome"))
+            driver = Chrome(service=service, options=options)
+            if lean:
+                # Block before the first page load; tests can opt out per session
+                LeanProfile.block(driver, LEAN_PROFILE["blocked_url_patterns"])
+            logger.info("Chrome driver initialized successfully")
+            return driver
+
+        except Exception as e:
+            logger.error("Failed to initialize Chrome driver: %s", e)
+            raise
+
+    @staticmethod
+    def chrome_options(headless: bool = False, lean: bool = False, debugging_port: int = None):
+        """
+        Chrome options of every launched browser (also used by the async client, utils/async_webdriver.py)
+
+        Args:
+            headless: Whether to run in headless mode
+            lean: Block images, fonts, media and analytics (see LEAN_PROFILE)
+            debugging_port: Remote debugging port to open
+
+        Returns:
+            ChromeOptions: Options
+        """
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+        options = ChromeOptions()
 
         # Performance options
         options.add_argument("--no-sandbox")
@@ -78,13 +150,19 @@ class DriverFactory:
         options.add_argument("--incognito")
 
         # Disable ALL password/credential features
-        options.add_experimental_option("prefs", {
+        prefs = {
             "credentials_enable_service": False,
             "profile.password_manager_enabled": False,
             "profile.default_content_setting_values.notifications": 2,
             "profile.default_content_settings.popups": 0,
             "autofill.profile_enabled": False
-        })
+        }
+
+        if lean:
+            LeanProfile.apply_options(options)
+            prefs.update(LEAN_PROFILE["prefs"])
+
+        options.add_experimental_option("prefs", prefs)
 
         # Disable automation flags
         options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
@@ -97,61 +175,38 @@ class DriverFactory:
             options.add_argument("--headless")
             options.add_argument("--disable-extensions")
 
-        try:
-            # First try local driver
-            local_driver_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                'drivers',
-                'chromedriver.exe'
-            )
-
-            if os.path.exists(local_driver_path):
-                logger.info(f"Using local ChromeDriver: {local_driver_path}")
-                service = Service(local_driver_path)
-            else:
-                logger.warning(f"Local ChromeDriver not found at {local_driver_path}, using webdriver-manager")
-
-                # Get chromedriver path from manager
-                driver_path = ChromeDriverManager().install()
-
-                # Fix: WebDriver Manager may return wrong file
-                driver_dir = os.path.dirname(driver_path)
-                if not driver_path.endswith('chromedriver.exe'):
-                    actual_driver = os.path.join(driver_dir, 'chromedriver.exe')
-                    if os.path.exists(actual_driver):
-                        driver_path = actual_driver
-                        logger.info(f"Fixed driver path to: {driver_path}")
-
-                service = Service(driver_path)
-
-            driver = webdriver.Chrome(service=service, options=options)
-            logger.info("Chrome driver initialized successfully")
-            return driver
+        if debugging_port:
+            options.add_argument(f"--remote-debugging-port={debugging_port}")
 
-        except Exception as e:
-            logger.error(f"Failed to initialize Chrome driver: {str(e)}")
-            raise
+        return options
 
     @staticmethod
     def _get_firefox_driver(headless):
         """Create Firefox driver"""
-        options = webdriver.FirefoxOptions()
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        from selenium.webdriver.firefox.webdriver import WebDriver as Firefox
+
+        options = FirefoxOptions()
 
         if headless or FIREFOX_OPTIONS["headless"]:
             options.add_argument("--headless")
             options.add_argument("--width=1920")
             options.add_argument("--height=1080")
 
-        from webdriver_manager.firefox import GeckoDriverManager
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=options)
+        service = FirefoxService(resolver.resolve("firefox"))
+        driver = Firefox(service=service, options=options)
 
         return driver
 
     @staticmethod
     def _get_edge_driver(headless):
         """Create Edge driver"""
-        options = webdriver.EdgeOptions()
+        from selenium.webdriver.edge.options import Options as EdgeOptions
+        from selenium.webdriver.edge.service import Service as EdgeService
+        from selenium.webdriver.edge.webdriver import WebDriver as Edge
+
+        options = EdgeOptions()
 
         if headless or EDGE_OPTIONS["headless"]:
             options.add_argument("--headless")
@@ -160,8 +215,7 @@ class DriverFactory:
         if EDGE_OPTIONS["disable_notifications"]:
             options.add_argument("--disable-notifications")
 
-        from webdriver_manager.microsoft import EdgeChromiumDriverManager
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        driver = webdriver.Edge(service=service, options=options)
+        service = EdgeService(resolver.resolve("edge"))
+        driver = Edge(service=service, options=options)
 
         return driver
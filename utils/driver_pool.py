@@ -0,0 +1,303 @@
+"""
+Driver Pool - Keeps WebDriver instances alive between tests and resets their state
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from utils.driver_factory import DriverFactory
+from config.config import (BASE_URL, DRIVER_POOL_MAX_USES, DRIVER_PREPROVISION_DEPTH,
+                           DRIVER_PREPROVISION_TIMEOUT, DRIVER_PREPROVISION_MAX_FAILURES, PAGE_LOAD_TIMEOUT)
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """Pool of reusable WebDriver instances (one pool per pytest worker process)"""
+
+    def __init__(self, driver_options=None, max_uses=DRIVER_POOL_MAX_USES, provisioner=None, watchdog=None):
+        """
+        Initialize driver pool
+
+        Args:
+            driver_options (dict): Keyword arguments for DriverFactory.get_driver
+            max_uses (int): Recycle a driver after it served this many tests (0 = never)
+            provisioner (DriverProvisioner): Source of new drivers (None = launch inline)
+            watchdog (MemoryWatchdog): Recycles drivers whose browser uses or leaks too much memory
+        """
+        self.driver_options = driver_options or {}
+        self.max_uses = max_uses
+        self.provisioner = provisioner
+        self.watchdog = watchdog
+        self._idle = []
+        self._uses = {}
+        self.created = 0
+        self.recycled = 0
+        self.replaced = 0
+
+    def acquire(self):
+        """
+        Get a clean driver from the pool, creating one if none is idle
+
+        Returns:
+            WebDriver: Driver positioned on BASE_URL with no cookies or storage
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            if not self._is_alive(driver):
+                logger.warning("Pooled driver session is dead, replacing it")
+                self.replaced += 1
+                self._discard(driver)
+                continue
+            try:
+                self.reset(driver)
+                return driver
+            except WebDriverException as e:
+                logger.warning("Failed to reset pooled driver, replacing it: %s", e)
+                self.replaced += 1
+                self._discard(driver)
+
+        return self._create()
+
+    def release(self, driver):
+        """
+        Return a driver to the pool after a test
+
+        Args:
+            driver: WebDriver instance obtained from acquire()
+        """
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+        memory_issue = self.watchdog.recycle_reason(driver) if self.watchdog else None
+
+        if self.max_uses and self._uses[id(driver)] >= self.max_uses:
+            logger.info("Recycling driver after %s tests", self._uses[id(driver)])
+            self.recycled += 1
+            self._discard(driver)
+        elif memory_issue:
+            logger.info("Recycling driver, browser %s", memory_issue)
+            self.recycled += 1
+            self._discard(driver)
+        elif not self._is_alive(driver):
+            logger.warning("Driver session died during test, discarding it")
+            self.replaced += 1
+            self._discard(driver)
+        else:
+            self._idle.append(driver)
+
+    def discard(self, driver):
+        """
+        Quit a driver instead of returning it to the pool (e.g. after a broken test)
+
+        Args:
+            driver: WebDriver instance obtained from acquire()
+        """
+        self.replaced += 1
+        self._discard(driver)
+
+    def close(self):
+        """Quit all idle drivers"""
+        while self._idle:
+            self._discard(self._idle.pop())
+        logger.info("Driver pool closed (created: %s, recycled: %s, replaced: %s)",
+                    self.created, self.recycled, self.replaced)
+
+    @staticmethod
+    def reset(driver):
+        """
+        Reset browser state so the next test starts like on a fresh browser
+
+        Args:
+            driver: WebDriver instance
+        """
+        # Close any extra windows a test may have opened, the test may have ended on one of them
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per origin, so clear it on the app
+        if not driver.current_url.startswith(BASE_URL):
+            driver.get(BASE_URL)
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.delete_all_cookies()
+
+        driver.get(BASE_URL)
+        logger.debug("Driver state reset, navigated to: %s", BASE_URL)
+
+    @staticmethod
+    def _is_alive(driver):
+        """
+        Check whether the browser session still responds
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the session is usable
+        """
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _create(self):
+        """
+        Launch a new driver and navigate it to BASE_URL
+
+        Returns:
+            WebDriver: New driver instance
+        """
+        if self.provisioner:
+            driver = self.provisioner.take()
+        else:
+            driver = DriverFactory.get_driver(**self.driver_options)
+            driver.get(BASE_URL)
+        self.created += 1
+        logger.info("Driver pool created driver #%s", self.created)
+        return driver
+
+    def _discard(self, driver):
+        """Quit driver, ignoring errors from already dead sessions"""
+        self._uses.pop(id(driver), None)
+        if self.watchdog:
+            self.watchdog.forget(driver)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.debug("Ignoring error while quitting driver: %s", e)
+
+
+class DriverProvisioner:
+    """Launches drivers on a background thread so a ready browser is waiting when a test starts"""
+
+    def __init__(self, driver_options=None, depth=DRIVER_PREPROVISION_DEPTH):
+        """
+        Initialize provisioner and start the background launcher thread
+
+        Args:
+            driver_options (dict): Keyword arguments for DriverFactory.get_driver
+            depth (int): Number of ready drivers to keep queued
+        """
+        self.driver_options = driver_options or {}
+        self.depth = depth
+        # Updated from the launcher and the test thread, only under _stats_lock
+        self.stats = {"depth": depth, "launched": 0, "failed": 0, "hits": 0, "misses": 0,
+                      "wait_time": 0.0, "max_wait": 0.0}
+        self._stats_lock = threading.Lock()
+        # Drivers ready to take; None once the launcher has given up (see _run)
+        self._ready = queue.Queue()
+        self._error = None
+        self._demand = threading.Event()
+        self._stopped = threading.Event()
+        # Quits used drivers off the test thread, close() waits for the pending ones
+        self._retirer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="driver-retire")
+        self._thread = threading.Thread(target=self._run, name="driver-provisioner", daemon=True)
+        self._demand.set()
+        self._thread.start()
+
+    def take(self):
+        """
+        Take a ready driver, waiting for the launcher (or launching inline) if none is queued
+
+        Returns:
+            WebDriver: Driver already navigated to BASE_URL
+
+        Raises:
+            Exception: The last launch error, once the launcher has given up
+        """
+        start = time.perf_counter()
+        try:
+            driver = self._ready.get_nowait()
+            hit = True
+        except queue.Empty:
+            hit = False
+            self._demand.set()
+            try:
+                driver = self._ready.get(timeout=DRIVER_PREPROVISION_TIMEOUT)
+            except queue.Empty:
+                logger.warning("No pre-provisioned driver became ready in time, launching inline")
+                driver = self._launch()
+        if driver is None:
+            # Leave the marker for the next caller, launching would fail the same way
+            self._ready.put(None)
+            raise self._error
+        self._demand.set()
+
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self.stats["hits" if hit else "misses"] += 1
+            self.stats["wait_time"] += waited
+            self.stats["max_wait"] = max(self.stats["max_wait"], waited)
+        logger.debug("Took pre-provisioned driver after %.3fs", waited)
+        return driver
+
+    def retire(self, driver):
+        """
+        Quit a used driver without blocking the caller
+
+        Args:
+            driver: WebDriver instance
+        """
+        self._retirer.submit(self._quit, driver)
+
+    def close(self):
+        """Stop the launcher thread, quit drivers still waiting in the queue and wait for retired drivers"""
+        self._stopped.set()
+        self._demand.set()
+        # A launch still running after the timeout quits its driver itself (see _run)
+        self._thread.join(timeout=PAGE_LOAD_TIMEOUT)
+        while not self._ready.empty():
+            driver = self._ready.get_nowait()
+            if driver:
+                self._quit(driver)
+        self._retirer.shutdown(wait=True)
+        logger.info("Driver provisioner closed: %s", self.stats)
+
+    def _run(self):
+        """Background loop - refill the queue whenever it drops below depth"""
+        failures = 0
+        while not self._stopped.is_set():
+            self._demand.wait()
+            self._demand.clear()
+            while not self._stopped.is_set() and self._ready.qsize() < self.depth:
+                try:
+                    driver = self._launch()
+                except Exception as e:
+                    failures += 1
+                    with self._stats_lock:
+                        self.stats["failed"] += 1
+                    if failures >= DRIVER_PREPROVISION_MAX_FAILURES:
+                        # A broken setup (driver path, missing browser) won't recover, fail take() right away
+                        logger.error("Background driver launch failed %s times in a row, giving up: %s", failures, e)
+                        self._error = e
+                        self._ready.put(None)
+                        return
+                    logger.error("Background driver launch failed: %s", e)
+                    self._stopped.wait(failures)
+                    continue
+                failures = 0
+                if self._stopped.is_set():
+                    # Closed while launching, nobody will take this driver
+                    self._quit(driver)
+                else:
+                    self._ready.put(driver)
+
+    def _launch(self):
+        """Create a driver and navigate it to BASE_URL"""
+        driver = DriverFactory.get_driver(**self.driver_options)
+        driver.get(BASE_URL)
+        with self._stats_lock:
+            self.stats["launched"] += 1
+        return driver
+
+    @staticmethod
+    def _quit(driver):
+        """Quit driver, ignoring errors from already dead sessions"""
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            logger.debug("Ignoring error while quitting driver: %s", e)
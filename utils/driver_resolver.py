@@ -0,0 +1,287 @@
+"""
+Driver Resolver - Finds the driver binary matching the installed browser and caches it on disk
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from config.config import PROJECT_ROOT, DRIVER_CACHE_DIR
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Driver executable name per browser (".exe" is added on Windows)
+DRIVER_NAMES = {
+    "chrome": "chromedriver",
+    "firefox": "geckodriver",
+    "edge": "msedgedriver"
+}
+
+# Browser executables to probe for the installed version
+BROWSER_BINARIES = {
+    "chrome": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+               "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"],
+    "firefox": ["firefox", "/Applications/Firefox.app/Contents/MacOS/firefox"],
+    "edge": ["microsoft-edge", "microsoft-edge-stable",
+             "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge"]
+}
+
+# Windows keeps the installed version in the registry instead
+WINDOWS_VERSION_KEYS = {
+    "chrome": r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon",
+    "firefox": r"HKEY_LOCAL_MACHINE\SOFTWARE\Mozilla\Mozilla Firefox",
+    "edge": r"HKEY_CURRENT_USER\Software\Microsoft\Edge\BLBeacon"
+}
+
+VERSION_PATTERN = re.compile(r"(\d+)\.[\d.]+")
+
+
+class _FileLock:
+    """Exclusive lock on a file, shared by all processes (e.g. xdist workers)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "a+")
+        if sys.platform == "win32":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10s, keep waiting for slow downloads
+                    continue
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if sys.platform == "win32":
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+
+
+class DriverResolver:
+    """Resolve driver binaries once and reuse them across runs and worker processes"""
+
+    def __init__(self, cache_dir=DRIVER_CACHE_DIR):
+        """
+        Initialize resolver
+
+        Args:
+            cache_dir: Directory holding downloaded drivers and the manifest
+        """
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, "manifest.json")
+        self.lock_path = os.path.join(cache_dir, ".lock")
+        self._resolved = {}
+        # Registry versions read by this process (Windows binaries have no mtime entry in the manifest)
+        self._windows_versions = {}
+
+    def resolve(self, browser):
+        """
+        Get the driver binary path for a browser, downloading it only if no valid cached copy exists
+
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+
+        Returns:
+            str: Path to the driver executable
+        """
+        if browser in self._resolved:
+            return self._resolved[browser]
+
+        local_path = self._local_driver_path(browser)
+        if os.path.exists(local_path):
+            logger.info("Using local %s: %s", DRIVER_NAMES[browser], local_path)
+            self._resolved[browser] = local_path
+            return local_path
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with _FileLock(self.lock_path):
+            manifest = self._load_manifest()
+            version = self._browser_version(browser, manifest)
+            # Without a version a cached driver could not be told apart from one for an older browser
+            key = f"{browser}-{version.split('.')[0]}" if version else None
+
+            driver_path = manifest["drivers"].get(key) if key else None
+            if driver_path and self._is_executable(driver_path):
+                logger.info("Using cached %s for %s: %s", DRIVER_NAMES[browser], key, driver_path)
+            else:
+                driver_path = self._download(browser, version)
+                if key:
+                    manifest["drivers"][key] = driver_path
+            self._save_manifest(manifest)
+
+        self._resolved[browser] = driver_path
+        return driver_path
+
+    def browser_version(self, browser):
+        """
+        Get the installed browser version (cached in the manifest per browser binary, per process on Windows)
+
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+
+        Returns:
+            str: Full version (e.g. "120.0.6099.109"), or None if it can't be detected
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with _FileLock(self.lock_path):
+            manifest = self._load_manifest()
+            version = self._browser_version(browser, manifest)
+            self._save_manifest(manifest)
+        return version
+
+    def find_browser_binary(self, browser):
+        """
+        Find the browser executable on this machine
+
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+
+        Returns:
+            str: Path to the browser executable, or None if not found
+        """
+        for candidate in BROWSER_BINARIES[browser]:
+            path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+            if path and os.path.exists(path):
+                return path
+        return None
+
+    def _browser_version(self, browser, manifest):
+        """Detect browser version, reusing the manifest entry while the binary is unchanged"""
+        if sys.platform == "win32":
+            if not self._windows_versions.get(browser):
+                self._windows_versions[browser] = self._windows_browser_version(browser)
+            return self._windows_versions[browser]
+
+        binary = self.find_browser_binary(browser)
+        if not binary:
+            logger.warning("Could not find %s executable to detect its version", browser)
+            return None
+
+        mtime = os.path.getmtime(binary)
+        cached = manifest["browsers"].get(binary)
+        if cached and cached["mtime"] == mtime:
+            return cached["version"]
+
+        try:
+            output = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("Failed to read %s version: %s", browser, e)
+            return None
+
+        match = VERSION_PATTERN.search(output)
+        version = match.group(0) if match else None
+        manifest["browsers"][binary] = {"mtime": mtime, "version": version}
+        logger.info("Detected %s version: %s", browser, version)
+        return version
+
+    @staticmethod
+    def _windows_browser_version(browser):
+        """Read browser version from the Windows registry"""
+        key = WINDOWS_VERSION_KEYS[browser]
+        value = "CurrentVersion" if browser == "firefox" else "version"
+        try:
+            output = subprocess.run(["reg", "query", key, "/v", value],
+                                    capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("Failed to read %s version from registry: %s", browser, e)
+            return None
+        match = VERSION_PATTERN.search(output)
+        return match.group(0) if match else None
+
+    def _download(self, browser, version):
+        """
+        Download driver through webdriver-manager into the cache directory
+
+        Args:
+            browser (str): Browser name
+            version (str): Installed browser version (None if it could not be detected)
+
+        Returns:
+            str: Path to the driver executable
+        """
+        from webdriver_manager.core.driver_cache import DriverCacheManager
+        cache_manager = DriverCacheManager(root_dir=self.cache_dir)
+
+        logger.info("Downloading %s for %s %s", DRIVER_NAMES[browser], browser, version)
+        start = time.perf_counter()
+        if browser == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            from webdriver_manager.core.os_manager import ChromeType
+            binary = self.find_browser_binary(browser) or ""
+            chrome_type = ChromeType.CHROMIUM if "chromium" in os.path.basename(binary).lower() else ChromeType.GOOGLE
+            # No exact driver_version: distro and patch builds often have no driver of the same build,
+            # webdriver-manager detects the browser itself and picks the latest driver of its build
+            driver_path = ChromeDriverManager(chrome_type=chrome_type, cache_manager=cache_manager).install()
+        elif browser == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            driver_path = GeckoDriverManager(cache_manager=cache_manager).install()
+        else:
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
+            driver_path = EdgeChromiumDriverManager(version=version, cache_manager=cache_manager).install()
+
+        # webdriver-manager may return another file from the archive (e.g. THIRD_PARTY_NOTICES)
+        executable = self._executable_name(browser)
+        if os.path.basename(driver_path) != executable:
+            for root, _, files in os.walk(os.path.dirname(driver_path)):
+                if executable in files:
+                    driver_path = os.path.join(root, executable)
+                    logger.info("Fixed driver path to: %s", driver_path)
+                    break
+
+        if sys.platform != "win32":
+            os.chmod(driver_path, 0o755)
+        logger.info("Driver ready in %.1fs: %s", time.perf_counter() - start, driver_path)
+        return driver_path
+
+    @staticmethod
+    def _executable_name(browser):
+        """Driver file name for the current platform"""
+        name = DRIVER_NAMES[browser]
+        return f"{name}.exe" if sys.platform == "win32" else name
+
+    def _local_driver_path(self, browser):
+        """Path of a manually placed driver in the project's drivers/ folder"""
+        return os.path.join(PROJECT_ROOT, "drivers", self._executable_name(browser))
+
+    @staticmethod
+    def _is_executable(path):
+        """Check that a cached driver still exists and can be run"""
+        return os.path.isfile(path) and (sys.platform == "win32" or os.access(path, os.X_OK))
+
+    def _load_manifest(self):
+        """Load manifest, starting fresh if it is missing or unreadable"""
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault("drivers", {})
+        manifest.setdefault("browsers", {})
+        return manifest
+
+    def _save_manifest(self, manifest):
+        """Write manifest atomically so a crashed worker can't leave it half written"""
+        tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+
+# Shared resolver (remembers resolved paths for the lifetime of the process)
+resolver = DriverResolver()
@@ -0,0 +1,220 @@
+"""
+Duration Scheduler - Pytest plugin that distributes tests by their recorded durations
+
+Durations from previous runs are kept in the pytest cache (.pytest_cache).
+With pytest-xdist, --schedule-by-duration hands tests out longest-first to whichever
+worker becomes free; --shard=i/n splits the suite into n shards of similar total duration.
+"""
+import statistics
+import pytest
+import logging
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist not installed
+    LoadScheduling = object
+
+logger = logging.getLogger(__name__)
+
+DURATIONS_CACHE_KEY = "saucedemo/durations"
+DEFAULT_DURATION = 1.0  # Seconds assumed for tests that never ran and no history at all
+SMOOTHING = 0.5  # Weight of the latest run when updating a stored duration
+
+durations_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    """Add scheduling command line options"""
+    parser.addoption(
+        "--schedule-by-duration",
+        action="store_true",
+        default=False,
+        help="With -n, hand out tests longest-first based on durations from previous runs"
+    )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        metavar="i/n",
+        help="Only run shard i of n (1-based), shards balanced by recorded test durations"
+    )
+
+
+def pytest_configure(config):
+    """Load recorded durations and start recording this run's durations"""
+    cache = getattr(config, "cache", None)  # None with -p no:cacheprovider
+    config.stash[durations_key] = cache.get(DURATIONS_CACHE_KEY, {}) if cache else {}
+    config.pluginmanager.register(DurationRecorder(config), "duration_recorder")
+
+
+class DurationRecorder:
+    """Accumulates setup + call + teardown time of every test and stores it at session end"""
+
+    def __init__(self, config):
+        self.config = config
+        self.measured = {}
+
+    def pytest_runtest_logreport(self, report):
+        """Add phase duration to the test's total"""
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self):
+        """Store measured durations for the next run (controller / single process only)"""
+        if hasattr(self.config, "workerinput") or not getattr(self.config, "cache", None):
+            return
+
+        durations = dict(self.config.stash[durations_key])
+        for nodeid, duration in self.measured.items():
+            previous = durations.get(nodeid)
+            durations[nodeid] = duration if previous is None else \
+                SMOOTHING * duration + (1 - SMOOTHING) * previous
+        self.config.cache.set(DURATIONS_CACHE_KEY, durations)
+
+
+def estimate_durations(nodeids, durations):
+    """
+    Get expected duration of each test, using the median of known tests for new ones
+
+    Args:
+        nodeids (list): Test node ids
+        durations (dict): Recorded durations by node id
+
+    Returns:
+        dict: Expected seconds by node id
+    """
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {nodeid: durations.get(nodeid, fallback) for nodeid in nodeids}
+
+
+def longest_first(nodeids, durations):
+    """
+    Order tests by expected duration, longest first (ties keep collection order)
+
+    Args:
+        nodeids (list): Test node ids
+        durations (dict): Recorded durations by node id
+
+    Returns:
+        list: Node ids in scheduling order
+    """
+    expected = estimate_durations(nodeids, durations)
+    return sorted(nodeids, key=lambda nodeid: -expected[nodeid])
+
+
+def split_shards(nodeids, durations, count):
+    """
+    Split tests into shards of similar total duration (longest processing time first)
+
+    Args:
+        nodeids (list): Test node ids
+        durations (dict): Recorded durations by node id
+        count (int): Number of shards
+
+    Returns:
+        list: One set of node ids per shard
+    """
+    expected = estimate_durations(nodeids, durations)
+    shards = [set() for _ in range(count)]
+    loads = [0.0] * count
+    for nodeid in longest_first(nodeids, durations):
+        index = loads.index(min(loads))
+        shards[index].add(nodeid)
+        loads[index] += expected[nodeid]
+    return shards
+
+
+def parse_shard(value):
+    """
+    Parse a --shard value
+
+    Args:
+        value (str): "i/n" with 1 <= i <= n
+
+    Returns:
+        tuple: (index, count) with a 0-based index
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects i/n, got '{value}'")
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard index must be between 1 and {count}, got {index}")
+    return index - 1, count
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests that belong to other shards"""
+    shard = config.getoption("--shard")
+    if not shard:
+        return
+
+    index, count = parse_shard(shard)
+    shards = split_shards([item.nodeid for item in items], config.stash[durations_key], count)
+    selected = [item for item in items if item.nodeid in shards[index]]
+    deselected = [item for item in items if item.nodeid not in shards[index]]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Use duration-based scheduling when requested"""
+    if config.getoption("--schedule-by-duration"):
+        return DurationScheduling(config, log)
+    return None
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    xdist scheduler handing out tests longest-first.
+
+    Each worker is kept at two pending tests (a worker needs to know its next test to
+    start the current one), so the next-longest test always goes to the first worker
+    that frees up. This keeps per-worker totals balanced even when estimates are off.
+    """
+
+    def schedule(self):
+        """Order the collection by expected duration, then start every worker"""
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+
+        durations = self.config.stash[durations_key]
+        position = {nodeid: index for index, nodeid in enumerate(self.collection)}
+        self.pending[:] = [position[nodeid] for nodeid in longest_first(self.collection, durations)]
+
+        # Deal the longest tests round-robin so they start on different workers
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        """Top the worker up to two pending tests, or shut it down when nothing is left"""
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            node_pending = self.node2pending[node]
+            if len(node_pending) < 2:
+                self._send_tests(node, 2 - len(node_pending))
+        else:
+            node.shutdown()
+
+        self.log("num items waiting for node:", len(self.pending))
@@ -1,11 +1,11 @@
 """
 Helper utility functions for tests
 """
-import os
-from datetime import datetime
+import json
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from config.config import SCREENSHOTS_DIR, EXPLICIT_WAIT
+from config.config import EXPLICIT_WAIT
+from utils.screenshots import screenshot_writer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,26 +13,31 @@ logger = logging.getLogger(__name__)
 
 def take_screenshot(driver, test_name):
     """
-    Take screenshot and save with timestamp
+    Take screenshot in memory and queue it for the background writer
     
     Args:
         driver: WebDriver instance
         test_name (str): Name of the test
         
     Returns:
-        str: Screenshot file path
+        str: Screenshot file path (written asynchronously, flushed at session end)
     """
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"{test_name}_{timestamp}.png"
-    filepath = os.path.join(SCREENSHOTS_DIR, filename)
+    return screenshot_writer.capture(driver, test_name)
 
+
+def attach_json(name, data):
+    """
+    Attach data to the Allure report as JSON (no-op if allure-pytest is not installed)
+    
+    Args:
+        name (str): Attachment name
+        data: JSON serializable data
+    """
     try:
-        driver.save_screenshot(filepath)
-        logger.info(f"Screenshot saved: {filepath}")
-        return filepath
-    except Exception as e:
-        logger.error(f"Failed to take screenshot: {str(e)}")
-        return None
+        import allure
+    except ImportError:
+        return
+    allure.attach(json.dumps(data, indent=2), name=name, attachment_type=allure.attachment_type.JSON)
 
 
 def wait_for_element(driver, locator, timeout=EXPLICIT_WAIT):
@@ -53,7 +58,7 @@ def wait_for_element(driver, locator, timeout=EXPLICIT_WAIT):
         )
         return element
     except Exception as e:
-        logger.error(f"Element not found: {locator}, Error: {str(e)}")
+        logger.error("Element not found: %s, Error: %s", locator, e)
         raise
 
 
@@ -75,7 +80,7 @@ def wait_for_element_clickable(driver, locator, timeout=EXPLICIT_WAIT):
         )
         return element
     except Exception as e:
-        logger.error(f"Element not clickable: {locator}, Error: {str(e)}")
+        logger.error("Element not clickable: %s, Error: %s", locator, e)
         raise
 
 
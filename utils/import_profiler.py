@@ -0,0 +1,79 @@
+"""
+Import Profiler - Times module imports of the current process (used by --startup-profile)
+
+Kept separate from the startup_profile plugin so conftest.py can start it before pytest
+loads (and assertion-rewrites) the plugin.
+"""
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+# Set by the controller so xdist workers profile their imports too
+STARTUP_PROFILE_ENV = "SAUCEDEMO_STARTUP_PROFILE"
+
+
+class ImportProfiler:
+    """Times first imports of modules by wrapping builtins.__import__ (like python -X importtime)"""
+
+    # Profiler started for this process (None if profiling is off)
+    active = None
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.modules = {}
+        # Stack of time spent in nested imports, per thread (background threads import too)
+        self._local = threading.local()
+        self._original = None
+
+    @classmethod
+    def start_if_requested(cls):
+        """
+        Start profiling imports if --startup-profile is on the command line or set by the controller
+
+        Returns:
+            ImportProfiler: Running profiler, or None if profiling is off
+        """
+        if cls.active is None and ("--startup-profile" in sys.argv or os.environ.get(STARTUP_PROFILE_ENV)):
+            cls.active = cls()
+            cls.active.install()
+        return cls.active
+
+    def install(self):
+        """Start timing imports"""
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if builtins.__import__ == self._import:
+            builtins.__import__ = self._original
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement recording cumulative and self time of newly imported modules"""
+        module_name = name
+        if level:
+            try:
+                module_name = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+            except (ImportError, ValueError):
+                pass
+        if module_name in sys.modules:
+            return self._original(name, globals, locals, fromlist, level)
+
+        stack = self._local.__dict__.setdefault("children", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            module = self._original(name, globals, locals, fromlist, level)
+        except BaseException:
+            # Failed (e.g. optional) imports are not modules, their time stays with the importer
+            stack.pop()
+            raise
+        elapsed = time.perf_counter() - start
+        children = stack.pop()
+        self.modules[module_name] = {"cumulative": elapsed, "self": elapsed - children}
+        if stack:
+            stack[-1] += elapsed
+        return module
@@ -0,0 +1,112 @@
+"""
+Lean Page Load - Blocks images, fonts, media and analytics in Chrome and measures what was saved
+
+Bytes saved are estimated from the transfer sizes of the blocked resources, as seen in loads
+where blocking was off (tests marked full_page_load). Nothing is fetched to size the others,
+they are counted as unknown sizes.
+"""
+import json
+import weakref
+from selenium.common.exceptions import WebDriverException
+from config.browser_config import LEAN_PROFILE
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class LeanProfile:
+    """Applies the lean page load profile to Chrome sessions and reports savings per test"""
+
+    def __init__(self):
+        # Transfer size by URL from unblocked loads, used to estimate bytes saved
+        self.known_sizes = {}
+        self._blocking = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def apply_options(options):
+        """
+        Add lean launch arguments, preferences and the performance log to Chrome options
+
+        Args:
+            options: ChromeOptions instance (before "prefs" is set by the caller)
+        """
+        for argument in LEAN_PROFILE["arguments"]:
+            options.add_argument(argument)
+        # DevTools network events are read back from the performance log
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    @staticmethod
+    def block(driver, patterns):
+        """
+        Set the URL patterns Chrome refuses to load
+
+        Args:
+            driver: Chrome WebDriver instance
+            patterns (list): URL patterns with "*" wildcards (empty list = block nothing)
+        """
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+    def set_blocking(self, driver, enabled):
+        """
+        Turn URL blocking on or off for a test (reloads the page if the state changed).
+        Drivers start with blocking on, DriverFactory enables it before the first page load.
+
+        Args:
+            driver: Chrome WebDriver instance
+            enabled (bool): Block resources matching LEAN_PROFILE patterns
+        """
+        if self._blocking.get(driver, True) == enabled:
+            return
+
+        self.block(driver, LEAN_PROFILE["blocked_url_patterns"] if enabled else [])
+        self._blocking[driver] = enabled
+        logger.info("Lean page load blocking %s", "enabled" if enabled else "disabled")
+        driver.refresh()
+
+    def collect(self, driver):
+        """
+        Read network events since the last call and summarize blocked resources
+
+        Args:
+            driver: Chrome WebDriver instance
+
+        Returns:
+            dict: blocked_requests, bytes_saved (estimated), unknown_sizes, loaded_requests, loaded_bytes
+        """
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException as e:
+            logger.debug("Performance log not available: %s", e)
+            return None
+
+        urls = {}
+        blocked = []
+        stats = {"blocked_requests": 0, "bytes_saved": 0, "unknown_sizes": 0,
+                 "loaded_requests": 0, "loaded_bytes": 0}
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            params = message.get("params", {})
+
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength", 0))
+                stats["loaded_requests"] += 1
+                stats["loaded_bytes"] += size
+                url = urls.get(params["requestId"])
+                if url:
+                    self.known_sizes[url] = size
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked.append(urls.get(params["requestId"]))
+
+        for url in blocked:
+            stats["blocked_requests"] += 1
+            size = self.known_sizes.get(url)
+            if size is None:
+                stats["unknown_sizes"] += 1
+            else:
+                stats["bytes_saved"] += size
+
+        return stats
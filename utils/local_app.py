@@ -0,0 +1,534 @@
+"""
+Local App - Offline stand-in for SauceDemo with configurable per-route latency
+
+Serves the same pages, DOM ids and classes the page objects use, and reproduces
+the behaviour of the users in config.USERS (locked out, problem, performance glitch).
+
+Run standalone:
+    python -m utils.local_app --port 8008 --latency "/inventory.html=200,*=20"
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from config.config import (USERS, PRODUCTS, SESSION_COOKIE_NAME, CART_STORAGE_KEY, ERROR_MESSAGES,
+                           LOCAL_APP_HOST, LOCAL_APP_PORT, LOCAL_APP_LATENCY_MS, LOCAL_APP_GLITCH_DELAY_MS)
+import logging
+
+logger = logging.getLogger(__name__)
+
+PASSWORD = "secret_sauce"
+
+# Catalogue keyed by product name (ids come from config.PRODUCTS)
+CATALOGUE = {
+    "Sauce Labs Backpack": (29.99, "carry.allTheThings() with the sleek, streamlined Sly Pack that melds "
+                                   "uncompromising style with unequaled laptop and tablet protection."),
+    "Sauce Labs Bike Light": (9.99, "A red light isn't the desired state in testing but it sure helps when riding "
+                                    "your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."),
+    "Sauce Labs Bolt T-Shirt": (15.99, "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American "
+                                       "Apparel, 100% ringspun combed cotton, heather gray with red bolt."),
+    "Sauce Labs Fleece Jacket": (49.99, "It's not every day that you come across a midweight quarter-zip fleece jacket "
+                                        "capable of handling everything from a relaxing day outdoors to a busy day at "
+                                        "the office."),
+    "Sauce Labs Onesie": (7.99, "Rib snap infant onesie for the junior automation engineer in development. Reinforced "
+                                "3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."),
+    "Test.allTheThings() T-Shirt (Red)": (15.99, "This classic Sauce Labs t-shirt is perfect to wear when cozying up "
+                                                 "to your keyboard to automate a few tests. Super-soft and comfy "
+                                                 "ringspun combed cotton.")
+}
+
+PAGES = {
+    "/": "login",
+    "/index.html": "login",
+    "/inventory.html": "inventory",
+    "/cart.html": "cart",
+    "/checkout-step-one.html": "checkout-step-one",
+    "/checkout-step-two.html": "checkout-step-two",
+    "/checkout-complete.html": "checkout-complete"
+}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Swag Labs</title>
+<link rel="stylesheet" href="/static/app.css">
+<script>window.APP_CONFIG = {config};</script>
+<script src="/static/app.js" defer></script>
+</head>
+<body><div id="root" data-page="{page}"></div></body>
+</html>
+"""
+
+APP_CSS = """
+body { font-family: sans-serif; margin: 0; }
+#root { padding: 16px; }
+.primary_header { display: flex; justify-content: space-between; align-items: center; }
+.shopping_cart_link { display: inline-block; min-width: 40px; min-height: 40px; position: relative; }
+.shopping_cart_badge { display: inline-block; background: #e2231a; color: #fff; padding: 2px 6px; }
+.bm-menu-wrap { display: none; }
+.bm-menu-wrap.open { display: block; }
+.bm-item { display: block; padding: 4px 0; }
+.inventory_item, .cart_item { display: flex; gap: 16px; margin: 12px 0; }
+.inventory_item_img { width: 120px; height: 120px; }
+.error-message-container { min-height: 24px; }
+.error-message-container h3 { color: #e2231a; }
+input, button, select { display: block; margin: 6px 0; padding: 6px; }
+"""
+
+APP_JS = """
+(function () {
+    'use strict';
+    var config = window.APP_CONFIG;
+    var root = document.getElementById('root');
+    var page = root.getAttribute('data-page');
+
+    function getCookie(name) {
+        var match = document.cookie.match(new RegExp('(?:^|; )' + name.replace(/[-.]/g, '\\\\$&') + '=([^;]*)'));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+    function currentUser() { return getCookie(config.sessionCookie); }
+    function getCart() {
+        try { return JSON.parse(localStorage.getItem(config.cartKey)) || []; } catch (e) { return []; }
+    }
+    function saveCart(ids) {
+        if (ids.length) { localStorage.setItem(config.cartKey, JSON.stringify(ids)); }
+        else { localStorage.removeItem(config.cartKey); }
+    }
+    function isProblemUser() { return currentUser() === config.problemUser; }
+    function slug(name) { return name.toLowerCase().replace(/ /g, '-'); }
+    function money(value) { return '$' + value.toFixed(2); }
+    function productById(id) {
+        for (var i = 0; i < config.products.length; i++) {
+            if (config.products[i].id === id) { return config.products[i]; }
+        }
+        return null;
+    }
+    function go(path) { window.location.href = path; }
+
+    function h(tag, attrs, children) {
+        var element = document.createElement(tag);
+        Object.keys(attrs || {}).forEach(function (key) {
+            if (key.indexOf('on') === 0) { element.addEventListener(key.slice(2), attrs[key]); }
+            else { element.setAttribute(key, attrs[key]); }
+        });
+        (children || []).forEach(function (child) {
+            if (child === null || child === undefined) { return; }
+            element.appendChild(typeof child === 'string' ? document.createTextNode(child) : child);
+        });
+        return element;
+    }
+    function mount(children) {
+        root.innerHTML = '';
+        children.forEach(function (child) { root.appendChild(child); });
+    }
+    function errorBox(message) {
+        var container = h('div', {'class': 'error-message-container' + (message ? ' error' : '')});
+        if (message) {
+            container.appendChild(h('h3', {'data-test': 'error'}, [
+                h('button', {'class': 'error-button', 'data-test': 'error-button',
+                             onclick: function () { container.innerHTML = ''; }}, ['x']),
+                message
+            ]));
+        }
+        return container;
+    }
+
+    function header(title, extra) {
+        var count = getCart().length;
+        var menu = h('div', {'class': 'bm-menu-wrap'}, [
+            h('nav', {'class': 'bm-item-list'}, [
+                h('a', {id: 'inventory_sidebar_link', 'class': 'bm-item menu-item', href: '/inventory.html'},
+                  ['All Items']),
+                h('a', {id: 'logout_sidebar_link', 'class': 'bm-item menu-item', href: '#', onclick: function (e) {
+                    e.preventDefault();
+                    document.cookie = config.sessionCookie + '=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT';
+                    go('/');
+                }}, ['Logout']),
+                h('a', {id: 'reset_sidebar_link', 'class': 'bm-item menu-item', href: '#', onclick: function (e) {
+                    e.preventDefault();
+                    saveCart([]);
+                    render();
+                }}, ['Reset App State'])
+            ])
+        ]);
+        return h('div', {id: 'header_container', 'class': 'header_container'}, [
+            h('div', {'class': 'primary_header'}, [
+                h('div', {id: 'menu_button_container'}, [
+                    h('button', {id: 'react-burger-menu-btn', type: 'button',
+                                 onclick: function () { menu.classList.add('open'); }}, ['Open Menu']),
+                    menu
+                ]),
+                h('div', {'class': 'app_logo'}, ['Swag Labs']),
+                h('div', {id: 'shopping_cart_container', 'class': 'shopping_cart_container'}, [
+                    h('a', {'class': 'shopping_cart_link', href: '/cart.html', 'data-test': 'shopping-cart-link'},
+                      [count ? h('span', {'class': 'shopping_cart_badge'}, [String(count)]) : null])
+                ])
+            ]),
+            h('div', {'class': 'header_secondary_container'}, [h('span', {'class': 'title'}, [title])].concat(extra || []))
+        ]);
+    }
+
+    function itemDetails(product, button) {
+        return h('div', {'class': 'inventory_item_description'}, [
+            h('div', {'class': 'inventory_item_label'}, [
+                h('a', {id: 'item_' + product.id + '_title_link', href: '#'}, [
+                    h('div', {'class': 'inventory_item_name'}, [product.name])
+                ]),
+                h('div', {'class': 'inventory_item_desc'}, [product.description])
+            ]),
+            h('div', {'class': 'pricebar'}, [h('div', {'class': 'inventory_item_price'}, [money(product.price)]), button])
+        ]);
+    }
+
+    function cartButton(product, onChange) {
+        var inCart = getCart().indexOf(product.id) !== -1;
+        var prefix = inCart ? 'remove-' : 'add-to-cart-';
+        return h('button', {id: prefix + slug(product.name), 'class': 'btn btn_inventory', onclick: function () {
+            var cart = getCart();
+            if (inCart) { cart.splice(cart.indexOf(product.id), 1); }
+            else { cart.push(product.id); }
+            saveCart(cart);
+            onChange();
+        }}, [inCart ? 'Remove' : 'Add to cart']);
+    }
+
+    var sortOrder = 'az';
+    var sorters = {
+        az: function (a, b) { return a.name < b.name ? -1 : 1; },
+        za: function (a, b) { return a.name < b.name ? 1 : -1; },
+        lohi: function (a, b) { return a.price - b.price; },
+        hilo: function (a, b) { return b.price - a.price; }
+    };
+
+    var pages = {
+        'login': function () {
+            var message = sessionStorage.getItem('login-error');
+            sessionStorage.removeItem('login-error');
+            var username = h('input', {id: 'user-name', 'class': 'input_error form_input', type: 'text',
+                                       placeholder: 'Username', 'data-test': 'username'});
+            var password = h('input', {id: 'password', 'class': 'input_error form_input', type: 'password',
+                                       placeholder: 'Password', 'data-test': 'password'});
+            var errors = errorBox(message);
+            var form = h('form', {onsubmit: function (e) {
+                e.preventDefault();
+                var error = null;
+                if (!username.value) { error = config.errors.empty_username; }
+                else if (!password.value) { error = config.errors.empty_password; }
+                else if (username.value === config.lockedUser && password.value === config.password) {
+                    error = config.errors.locked_user;
+                }
+                else if (config.users.indexOf(username.value) === -1 || password.value !== config.password) {
+                    error = config.errors.invalid_credentials;
+                }
+                if (error) {
+                    errors.replaceWith(errors = errorBox(error));
+                    return;
+                }
+                document.cookie = config.sessionCookie + '=' + encodeURIComponent(username.value) + '; path=/';
+                var delay = username.value === config.performanceUser ? config.glitchDelayMs : 0;
+                setTimeout(function () { go('/inventory.html'); }, delay);
+            }}, [username, password, errors,
+                 h('input', {id: 'login-button', 'class': 'submit-button btn_action', type: 'submit',
+                             value: 'Login', 'data-test': 'login-button'})]);
+            mount([h('div', {'class': 'login_logo'}, ['Swag Labs']), h('div', {'class': 'login_wrapper'}, [form])]);
+        },
+
+        'inventory': function () {
+            var select = h('select', {'class': 'product_sort_container', 'data-test': 'product-sort-container',
+                                      onchange: function () {
+                                          if (!isProblemUser()) { sortOrder = select.value; }
+                                          render();
+                                      }},
+                           config.sortOptions.map(function (option) {
+                               return h('option', {value: option[0]}, [option[1]]);
+                           }));
+            select.value = sortOrder;
+            var products = config.products.slice().sort(sorters[sortOrder]);
+            mount([
+                header('Products', [h('span', {'class': 'select_container'}, [select])]),
+                h('div', {'class': 'inventory_list'}, products.map(function (product) {
+                    var image = isProblemUser() ? '/static/media/sl-404.svg' : product.image;
+                    return h('div', {'class': 'inventory_item'}, [
+                        h('div', {'class': 'inventory_item_img'}, [
+                            h('img', {alt: product.name, 'class': 'inventory_item_img', src: image})
+                        ]),
+                        itemDetails(product, cartButton(product, render))
+                    ]);
+                }))
+            ]);
+        },
+
+        'cart': function () {
+            mount([
+                header('Your Cart'),
+                h('div', {'class': 'cart_list'}, getCart().map(productById).filter(Boolean).map(function (product) {
+                    return h('div', {'class': 'cart_item'}, [
+                        h('div', {'class': 'cart_quantity'}, ['1']),
+                        itemDetails(product, cartButton(product, render))
+                    ]);
+                })),
+                h('button', {id: 'continue-shopping', 'class': 'btn btn_secondary',
+                             onclick: function () { go('/inventory.html'); }}, ['Continue Shopping']),
+                h('button', {id: 'checkout', 'class': 'btn btn_action',
+                             onclick: function () { go('/checkout-step-one.html'); }}, ['Checkout'])
+            ]);
+        },
+
+        'checkout-step-one': function () {
+            var firstName = h('input', {id: 'first-name', type: 'text', placeholder: 'First Name'});
+            var lastName = h('input', {id: 'last-name', type: 'text', placeholder: 'Last Name'});
+            var postalCode = h('input', {id: 'postal-code', type: 'text', placeholder: 'Zip/Postal Code'});
+            if (isProblemUser()) {
+                // Typing a last name overwrites the first name field instead
+                lastName.addEventListener('input', function () {
+                    firstName.value = lastName.value.slice(-1);
+                    lastName.value = '';
+                });
+            }
+            var errors = errorBox(null);
+            var form = h('form', {onsubmit: function (e) {
+                e.preventDefault();
+                var error = !firstName.value ? 'Error: First Name is required' :
+                            !lastName.value ? 'Error: Last Name is required' :
+                            !postalCode.value ? 'Error: Postal Code is required' : null;
+                if (error) {
+                    errors.replaceWith(errors = errorBox(error));
+                    return;
+                }
+                go('/checkout-step-two.html');
+            }}, [firstName, lastName, postalCode, errors,
+                 h('button', {id: 'cancel', type: 'button', 'class': 'btn btn_secondary',
+                              onclick: function () { go('/cart.html'); }}, ['Cancel']),
+                 h('input', {id: 'continue', type: 'submit', 'class': 'submit-button btn btn_primary',
+                             value: 'Continue'})]);
+            mount([header('Checkout: Your Information'), h('div', {'class': 'checkout_info_wrapper'}, [form])]);
+        },
+
+        'checkout-step-two': function () {
+            var items = getCart().map(productById).filter(Boolean);
+            var subtotal = items.reduce(function (sum, product) { return sum + product.price; }, 0);
+            var tax = Math.round(subtotal * config.taxRate * 100) / 100;
+            mount([
+                header('Checkout: Overview'),
+                h('div', {'class': 'cart_list'}, items.map(function (product) {
+                    return h('div', {'class': 'cart_item'}, [
+                        h('div', {'class': 'cart_quantity'}, ['1']),
+                        itemDetails(product, null)
+                    ]);
+                })),
+                h('div', {'class': 'summary_info'}, [
+                    h('div', {'class': 'summary_subtotal_label'}, ['Item total: ' + money(subtotal)]),
+                    h('div', {'class': 'summary_tax_label'}, ['Tax: ' + money(tax)]),
+                    h('div', {'class': 'summary_total_label'}, ['Total: ' + money(subtotal + tax)])
+                ]),
+                h('button', {id: 'cancel', 'class': 'btn btn_secondary',
+                             onclick: function () { go('/inventory.html'); }}, ['Cancel']),
+                h('button', {id: 'finish', 'class': 'btn btn_action', onclick: function () {
+                    saveCart([]);
+                    go('/checkout-complete.html');
+                }}, ['Finish'])
+            ]);
+        },
+
+        'checkout-complete': function () {
+            mount([
+                header('Checkout: Complete!'),
+                h('div', {id: 'checkout_complete_container', 'class': 'checkout_complete_container'}, [
+                    h('h2', {'class': 'complete-header'}, ['Thank you for your order!']),
+                    h('div', {'class': 'complete-text'}, ['Your order has been dispatched, and will arrive just ' +
+                                                          'as fast as the pony can get there!']),
+                    h('button', {id: 'back-to-products', 'class': 'btn btn_primary',
+                                 onclick: function () { go('/inventory.html'); }}, ['Back Home'])
+                ])
+            ]);
+        }
+    };
+
+    function render() {
+        if (page !== 'login' && !currentUser()) {
+            sessionStorage.setItem('login-error', "Epic sadface: You can only access '" + location.pathname +
+                                                  "' when you are logged in.");
+            go('/');
+            return;
+        }
+        pages[page]();
+    }
+
+    render();
+})();
+"""
+
+IMAGE_TEMPLATE = """<svg xmlns="http://www.w3.org/2000/svg" width="240" height="240" viewBox="0 0 240 240">
+<rect width="240" height="240" fill="{color}"/>
+<text x="120" y="125" font-size="14" text-anchor="middle" fill="#fff">{label}</text>
+</svg>
+"""
+
+
+def slugify(name):
+    """Button/image slug used by SauceDemo (lower case, spaces to dashes)"""
+    return name.lower().replace(" ", "-")
+
+
+def parse_latency(value):
+    """
+    Parse a per-route latency spec
+
+    Args:
+        value (str): Comma separated "route=milliseconds" pairs, "*" matches every route
+
+    Returns:
+        dict: Milliseconds by route
+    """
+    latency = {}
+    for pair in filter(None, (part.strip() for part in (value or "").split(","))):
+        route, _, milliseconds = pair.partition("=")
+        latency[route.strip()] = float(milliseconds)
+    return latency
+
+
+def app_config():
+    """Settings handed to the page script (users, products, messages)"""
+    return {
+        "users": [user["username"] for user in USERS.values()],
+        "password": PASSWORD,
+        "lockedUser": USERS["locked"]["username"],
+        "problemUser": USERS["problem"]["username"],
+        "performanceUser": USERS["performance"]["username"],
+        "glitchDelayMs": LOCAL_APP_GLITCH_DELAY_MS,
+        "sessionCookie": SESSION_COOKIE_NAME,
+        "cartKey": CART_STORAGE_KEY,
+        "errors": ERROR_MESSAGES,
+        "taxRate": 0.08,
+        "sortOptions": [["az", "Name (A to Z)"], ["za", "Name (Z to A)"],
+                        ["lohi", "Price (low to high)"], ["hilo", "Price (high to low)"]],
+        "products": [
+            {"id": product_id, "name": name, "price": CATALOGUE[name][0], "description": CATALOGUE[name][1],
+             "image": f"/static/media/{slugify(name)}.svg"}
+            for name, product_id in PRODUCTS.items()
+        ]
+    }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Serves pages and static assets, delaying responses by the configured route latency"""
+
+    server_version = "SauceDemoLocal/1.0"
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        self.server.app.delay(path)
+
+        if path in PAGES:
+            config = json.dumps(self.server.app.config).replace("</", "<\\/")
+            self._send(200, "text/html; charset=utf-8", PAGE_TEMPLATE.format(config=config, page=PAGES[path]))
+        elif path == "/static/app.js":
+            self._send(200, "application/javascript; charset=utf-8", APP_JS)
+        elif path == "/static/app.css":
+            self._send(200, "text/css; charset=utf-8", APP_CSS)
+        elif path.startswith("/static/media/") and path.endswith(".svg"):
+            label = path[len("/static/media/"):-len(".svg")]
+            color = "#a00" if label == "sl-404" else "#132322"
+            self._send(200, "image/svg+xml", IMAGE_TEMPLATE.format(color=color, label=label))
+        else:
+            self._send(404, "text/plain; charset=utf-8", "Not Found")
+
+    def _send(self, status, content_type, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug("%s " + format, self.address_string(), *args)
+
+
+class LocalApp:
+    """Local SauceDemo server running on a background thread"""
+
+    def __init__(self, host=LOCAL_APP_HOST, port=LOCAL_APP_PORT, latency=None):
+        """
+        Initialize local app
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free port)
+            latency (dict): Milliseconds to delay each response, by route ("*" = every route)
+        """
+        self.host = host
+        self.port = port
+        self.latency = dict(LOCAL_APP_LATENCY_MS)
+        self.latency.update(parse_latency(os.getenv("SAUCEDEMO_LATENCY")))
+        self.latency.update(latency or {})
+        self.config = app_config()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL of the running app"""
+        return f"http://{self.host}:{self.port}"
+
+    def delay(self, path):
+        """
+        Sleep for the latency configured for a route
+
+        Args:
+            path (str): Request path
+        """
+        milliseconds = self.latency.get(path, self.latency.get("*", 0))
+        if milliseconds:
+            time.sleep(milliseconds / 1000)
+
+    def start(self):
+        """
+        Start serving on a background thread
+
+        Returns:
+            str: Base URL of the app
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.app = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-app", daemon=True)
+        self._thread.start()
+        logger.info("Local app running at %s (latency: %s)", self.url, self.latency or "none")
+        return self.url
+
+    def stop(self):
+        """Stop the server"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            logger.info("Local app stopped")
+
+
+def main():
+    """Run the local app in the foreground"""
+    parser = argparse.ArgumentParser(description="Offline SauceDemo stand-in")
+    parser.add_argument("--host", default=LOCAL_APP_HOST)
+    parser.add_argument("--port", type=int, default=LOCAL_APP_PORT)
+    parser.add_argument("--latency", default="", help='Per-route latency, e.g. "/inventory.html=200,*=20"')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    app = LocalApp(args.host, args.port, parse_latency(args.latency))
+    app.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        app.stop()
+
+
+if __name__ == "__main__":
+    main()
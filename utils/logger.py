@@ -1,51 +1,156 @@
 """
 Logger configuration for test execution
+
+Records are handed to a queue on the test thread; a QueueListener thread formats them
+and does the file I/O. Each xdist worker writes its own file, merged at session end.
 """
+import copy
+import glob
+import heapq
 import logging
+import logging.handlers
 import os
-from datetime import datetime
-from config.config import REPORTS_DIR
+import queue
+import re
+from config.config import LOG_FORMAT, LOG_DATE_FORMAT, LOG_FILE_LEVEL
+
+# Start of a record in a log file written with LOG_FORMAT (continuation lines are tracebacks etc.)
+RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}[.,]\d{3} ")
+
+_listener = None
+_queue_handler = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
 
+    def prepare(self, record):
+        # The listener runs in this process, so msg and args can be formatted there.
+        # Only exception info is rendered here, as the traceback objects don't outlive the call.
+        if record.exc_info:
+            # Copy so handlers running after this one still see the exception
+            record = copy.copy(record)
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
-def setup_logger(name=__name__, log_file=None):
+
+def _formatter():
+    """Formatter shared by all handlers (millisecond timestamps allow merging worker files)"""
+    return logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+
+
+def start_queue_logging(log_file, level=LOG_FILE_LEVEL):
     """
-    Setup logger with console and file handlers
-    
+    Route all records of the root logger through a queue to a file written by a background thread
+
     Args:
-        name (str): Logger name
         log_file (str): Log file path
-        
+        level: Lowest level written to the file
+
     Returns:
-        Logger: Configured logger instance
+        QueueListener: Running listener (calling again returns the running one)
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    global _listener, _queue_handler
+    if _listener:
+        return _listener
+    if isinstance(level, str):
+        level = logging.getLevelName(level)
+
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    file_handler = logging.FileHandler(log_file, mode="w", delay=True)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(_formatter())
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = _DeferredQueueHandler(log_queue)
+    _queue_handler.setLevel(level)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    # Level gate at the logger, so disabled levels are dropped before a record is created
+    root.setLevel(min(root.level, level))
+    return _listener
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
 
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+def stop_queue_logging():
+    """Write pending records and stop the listener thread"""
+    global _listener, _queue_handler
+    if not _listener:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue_handler = None
 
-    # File handler
-    if log_file is None:
-        log_file = os.path.join(REPORTS_DIR, f"test_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
 
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
+def worker_log_file(log_file, worker):
+    """
+    Per-worker log file path
 
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    Args:
+        log_file (str): Merged log file path
+        worker (str): xdist worker id ("main" for the controller / single process)
 
-    return logger
+    Returns:
+        str: e.g. reports/test_execution.gw0.log
+    """
+    base, ext = os.path.splitext(log_file)
+    return f"{base}.{worker}{ext}"
+
+
+def remove_worker_logs(log_file):
+    """
+    Remove per-worker log files left over from an aborted run
+
+    Args:
+        log_file (str): Merged log file path
+    """
+    for path in glob.glob(worker_log_file(log_file, "*")):
+        os.remove(path)
+
+
+def _read_records(path, worker):
+    """Yield (timestamp, lines) per record of a log file, tagging lines with the worker id"""
+    lines = []
+    with open(path) as f:
+        for line in f:
+            if RECORD_START.match(line) and lines:
+                yield lines[0][:23], lines
+                lines = []
+            lines.append(line if lines else f"{line[:24]}[{worker}] {line[24:]}")
+    if lines:
+        yield lines[0][:23], lines
+
+
+def merge_worker_logs(log_file):
+    """
+    Merge per-worker log files into one file ordered by time, then remove them
+
+    Args:
+        log_file (str): Merged log file path
+
+    Returns:
+        int: Number of merged worker files
+    """
+    parts = sorted(glob.glob(worker_log_file(log_file, "*")))
+    if not parts:
+        return 0
+    if len(parts) == 1 and parts[0].endswith(".main" + os.path.splitext(log_file)[1]):
+        os.replace(parts[0], log_file)
+        return 1
 
+    workers = [os.path.basename(path).split(".")[-2] for path in parts]
+    streams = [_read_records(path, worker) for path, worker in zip(parts, workers)]
+    with open(log_file, "w") as merged:
+        for _, lines in heapq.merge(*streams, key=lambda record: record[0]):
+            merged.writelines(lines)
+    for path in parts:
+        os.remove(path)
+    return len(parts)
 
-# Create default logger
-logger = setup_logger(__name__)
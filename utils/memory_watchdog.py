@@ -0,0 +1,155 @@
+"""
+Memory Watchdog - Samples the memory of each test's browser and decides when to recycle it
+
+The resident memory of the chromedriver + browser process tree (DriverFactory.get_memory)
+is sampled in the background while a test runs. Pooled browsers are recycled between
+tests once they exceed a memory limit or keep growing from test to test (leak heuristic).
+"""
+import threading
+from config.config import MEMORY_SAMPLE_INTERVAL, MEMORY_LIMIT_MB, MEMORY_LEAK_WINDOW, MEMORY_LEAK_MB_PER_TEST
+from utils.driver_factory import DriverFactory
+import logging
+
+logger = logging.getLogger(__name__)
+
+MB = 2 ** 20
+
+
+def growth_per_test(values):
+    """
+    Least-squares slope of memory over consecutive tests
+
+    Args:
+        values (list): Memory after each test in MB, oldest first
+
+    Returns:
+        float: MB added per test
+    """
+    count = len(values)
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    variance = sum((x - mean_x) ** 2 for x in range(count))
+    return sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values)) / variance
+
+
+class MemoryWatchdog:
+    """Memory samples of the tests of one worker and the history of every browser it saw"""
+
+    def __init__(self, limit_mb=MEMORY_LIMIT_MB, leak_window=MEMORY_LEAK_WINDOW,
+                 leak_mb_per_test=MEMORY_LEAK_MB_PER_TEST, interval=MEMORY_SAMPLE_INTERVAL):
+        """
+        Initialize watchdog
+
+        Args:
+            limit_mb (float): Recycle a browser using more than this after a test (0 = no limit)
+            leak_window (int): Tests the growth heuristic looks at
+            leak_mb_per_test (float): Recycle a browser growing faster than this over the window
+            interval (float): Seconds between samples while a test runs
+        """
+        self.limit_mb = limit_mb
+        self.leak_window = leak_window
+        self.leak_mb_per_test = leak_mb_per_test
+        self.interval = interval
+        # Memory after each of the last tests (MB) by WebDriver session id
+        self.history = {}
+        self._driver = None
+        self._samples = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+
+    def start_test(self, driver):
+        """
+        Start sampling the browser of a test
+
+        Args:
+            driver: WebDriver instance launched by DriverFactory
+        """
+        memory = DriverFactory.get_memory(driver)
+        if memory is None:
+            return
+        with self._lock:
+            self._driver = driver
+            self._samples = [memory]
+        if self._sampler is None:
+            self._sampler = threading.Thread(target=self._sample, name="memory-watchdog", daemon=True)
+            self._sampler.start()
+
+    def stop_test(self):
+        """
+        Stop sampling and summarize the test's memory use
+
+        Returns:
+            dict: peak, average, start and end MB, number of samples and the reason the browser
+                  should be recycled (None if it can be kept), or None if memory is not available
+        """
+        with self._lock:
+            driver, self._driver = self._driver, None
+            samples = self._samples
+        if driver is None:
+            return None
+
+        end = DriverFactory.get_memory(driver)
+        if end:
+            samples.append(end)
+        history = self.history.setdefault(driver.session_id, [])
+        history.append(samples[-1] / MB)
+        del history[:-self.leak_window]
+
+        return {
+            "peak_mb": max(samples) / MB,
+            "average_mb": sum(samples) / len(samples) / MB,
+            "start_mb": samples[0] / MB,
+            "end_mb": samples[-1] / MB,
+            "samples": len(samples),
+            "recycle": self.recycle_reason(driver)
+        }
+
+    def recycle_reason(self, driver):
+        """
+        Check whether a browser should be replaced before its next test
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            str: Why it should be recycled, or None
+        """
+        history = self.history.get(driver.session_id)
+        if not history:
+            return None
+        if self.limit_mb and history[-1] > self.limit_mb:
+            return f"uses {history[-1]:.0f} MB (limit {self.limit_mb} MB)"
+        if len(history) >= self.leak_window > 1:
+            growth = growth_per_test(history)
+            if growth > self.leak_mb_per_test:
+                return f"grew {growth:.0f} MB per test over the last {len(history)} tests"
+        return None
+
+    def forget(self, driver):
+        """
+        Drop the history of a browser that was quit
+
+        Args:
+            driver: WebDriver instance
+        """
+        self.history.pop(driver.session_id, None)
+
+    def close(self):
+        """Stop the sampling thread"""
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+
+    def _sample(self):
+        """Sample the running test's browser until closed"""
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                driver = self._driver
+            if driver is None:
+                continue
+            memory = DriverFactory.get_memory(driver)
+            with self._lock:
+                # The test may have finished while sampling
+                if memory and driver is self._driver:
+                    self._samples.append(memory)
@@ -0,0 +1,87 @@
+"""
+Process Memory - Resident memory of a process and its descendants, read from /proc (Linux)
+"""
+from pathlib import Path
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROC = Path("/proc")
+
+
+def _parent_pids():
+    """
+    Parent of every running process
+
+    Returns:
+        dict: Parent pid by pid
+    """
+    parents = {}
+    for stat in PROC.glob("[0-9]*/stat"):
+        try:
+            content = stat.read_text()
+        except OSError:
+            # Process exited while scanning
+            continue
+        # "pid (comm) state ppid ...", comm may contain spaces and parentheses
+        fields = content[content.rfind(")") + 2:].split()
+        parents[int(stat.parent.name)] = int(fields[1])
+    return parents
+
+
+def process_tree(pid):
+    """
+    A process and all its descendants
+
+    Args:
+        pid (int): Root process id
+
+    Returns:
+        list: Process ids, root first
+    """
+    children = {}
+    for child, parent in _parent_pids().items():
+        children.setdefault(parent, []).append(child)
+
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def rss(pid):
+    """
+    Resident set size of one process
+
+    Args:
+        pid (int): Process id
+
+    Returns:
+        int: Bytes, or 0 if the process is gone
+    """
+    try:
+        with open(PROC / str(pid) / "status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pid):
+    """
+    Resident memory of a process tree, e.g. chromedriver and the browser processes it started
+    (pages shared between processes are counted once per process)
+
+    Args:
+        pid (int): Root process id
+
+    Returns:
+        int: Bytes, or None if /proc is not available (not Linux)
+    """
+    if not PROC.is_dir():
+        return None
+    return sum(rss(process) for process in process_tree(pid))
@@ -0,0 +1,141 @@
+"""
+Screenshot Writer - Captures screenshots in memory and writes them to disk on a background thread
+"""
+import io
+import itertools
+import os
+import queue
+import threading
+from datetime import datetime
+from config.config import (SCREENSHOTS_DIR, SCREENSHOT_FORMAT, SCREENSHOT_MAX_WIDTH, SCREENSHOT_QUALITY,
+                           SCREENSHOT_QUEUE_SIZE)
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow not installed, screenshots are written as captured (PNG)
+    Image = None
+
+
+class ScreenshotWriter:
+    """Bounded queue of captured PNGs, encoded and saved by one writer thread per process"""
+
+    def __init__(self, directory=SCREENSHOTS_DIR, image_format=SCREENSHOT_FORMAT, max_width=SCREENSHOT_MAX_WIDTH,
+                 quality=SCREENSHOT_QUALITY, queue_size=SCREENSHOT_QUEUE_SIZE):
+        """
+        Initialize writer (the thread starts with the first screenshot)
+
+        Args:
+            directory: Directory for screenshot files
+            image_format (str): "png" or "webp" (webp needs Pillow)
+            max_width (int): Downscale wider screenshots to this width (None = keep size, needs Pillow)
+            quality (int): WebP quality (1-100)
+            queue_size (int): Screenshots waiting to be written before capture blocks
+        """
+        self.directory = directory
+        self.image_format = image_format
+        self.max_width = max_width
+        self.quality = quality
+        self.written = 0
+        self.failed = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._counter = itertools.count(1)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def capture(self, driver, name):
+        """
+        Grab a screenshot and queue it for writing
+
+        Args:
+            driver: WebDriver instance
+            name (str): Name prefix (e.g. test name)
+
+        Returns:
+            str: Path the screenshot will be written to, or None if capturing failed
+        """
+        try:
+            png = driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.error("Failed to take screenshot: %s", e)
+            return None
+
+        filepath = os.path.join(self.directory, f"{self._unique_name(name)}.{self._extension()}")
+        self._ensure_thread()
+        # Blocks while the queue is full, so a burst of failures can't use unbounded memory
+        self._queue.put((filepath, png))
+        logger.info("Screenshot queued: %s", filepath)
+        return filepath
+
+    def close(self):
+        """Write the queued screenshots and stop the writer thread"""
+        with self._lock:
+            if not self._thread:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        logger.info("Screenshot writer closed (written: %s, failed: %s)", self.written, self.failed)
+
+    def _unique_name(self, name):
+        """Name unique across xdist workers and within a process: name_worker_time_counter"""
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        return f"{name}_{worker}_{timestamp}_{next(self._counter)}"
+
+    def _extension(self):
+        """File extension for the effective format (PNG when Pillow is missing)"""
+        return self.image_format if Image is not None else "png"
+
+    def _ensure_thread(self):
+        """Start the writer thread if it isn't running"""
+        with self._lock:
+            if self._thread is None:
+                if Image is None and (self.image_format != "png" or self.max_width):
+                    logger.warning("Pillow is not installed, screenshots are saved as full size PNG")
+                self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Writer loop - encode and save queued screenshots until the stop marker arrives"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self._write(*item)
+
+    def _write(self, filepath, png):
+        """Encode (downscale / convert if configured) and save one screenshot"""
+        try:
+            data = self._encode(png)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, "wb") as f:
+                f.write(data)
+            self.written += 1
+            logger.debug("Screenshot saved: %s", filepath)
+        except Exception as e:
+            self.failed += 1
+            logger.error("Failed to save screenshot %s: %s", filepath, e)
+
+    def _encode(self, png):
+        """Convert captured PNG bytes to the configured format and size"""
+        if Image is None or (self.image_format == "png" and not self.max_width):
+            return png
+
+        image = Image.open(io.BytesIO(png))
+        if self.max_width and image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+
+        output = io.BytesIO()
+        if self.image_format == "webp":
+            image.save(output, format="WEBP", quality=self.quality)
+        else:
+            image.save(output, format="PNG", optimize=False)
+        return output.getvalue()
+
+
+# Shared writer (one background thread per process, closed at session end)
+screenshot_writer = ScreenshotWriter()
@@ -0,0 +1,179 @@
+"""
+Shared Browser - One Chrome serving the tests of all xdist workers (--shared-browser)
+
+The controller launches Chrome with remote debugging. Every worker attaches its own
+chromedriver session to it, and every test gets its own window in a separate browser
+context (own cookies and storage), so a worker costs a chromedriver process and a few
+renderer processes instead of a whole browser.
+"""
+import json
+import os
+import socket
+import threading
+import urllib.request
+from selenium.common.exceptions import WebDriverException
+from config.config import BASE_URL, SHARED_BROWSER_PORT, SHARED_BROWSER_SAMPLE_INTERVAL
+from utils.driver_factory import DriverFactory
+from utils.process_memory import process_tree_rss
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Debugger address of the shared browser, inherited by xdist workers
+SHARED_BROWSER_ENV = "SAUCEDEMO_SHARED_BROWSER"
+
+
+def _free_port():
+    """Get a port nothing listens on"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class SharedBrowser:
+    """The shared Chrome, owned by the controller (or the single pytest process)"""
+
+    def __init__(self, driver_options, port=SHARED_BROWSER_PORT):
+        """
+        Initialize shared browser
+
+        Args:
+            driver_options (dict): Keyword arguments for DriverFactory.get_driver
+            port (int): Remote debugging port (0 = any free port)
+        """
+        self.driver_options = driver_options
+        self.port = port or _free_port()
+        self.address = f"127.0.0.1:{self.port}"
+        self.driver = None
+        self.samples = []
+        self._stop = threading.Event()
+        self._sampler = None
+
+    def start(self):
+        """Launch Chrome, publish its address to workers and start sampling its memory"""
+        self.driver = DriverFactory.get_driver(**self.driver_options, debugging_port=self.port)
+        os.environ[SHARED_BROWSER_ENV] = self.address
+        self._sampler = threading.Thread(target=self._sample, name="shared-browser-memory", daemon=True)
+        self._sampler.start()
+        logger.info("Shared browser listening on %s", self.address)
+
+    def stop(self):
+        """Stop sampling and quit the browser"""
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+        os.environ.pop(SHARED_BROWSER_ENV, None)
+
+    def open_pages(self):
+        """
+        Count the browser's tabs and windows
+
+        Returns:
+            int: Number of page targets
+        """
+        with urllib.request.urlopen(f"http://{self.address}/json/list", timeout=5) as response:
+            return sum(1 for target in json.load(response) if target["type"] == "page")
+
+    def _sample(self):
+        """Record (concurrent tests, browser memory) until stopped"""
+        pid = self.driver.service.process.pid
+        while not self._stop.wait(SHARED_BROWSER_SAMPLE_INTERVAL):
+            try:
+                # Every page except the initial tab belongs to a running test
+                tests = self.open_pages() - 1
+            except OSError:
+                continue
+            memory = process_tree_rss(pid)
+            if memory is None:
+                logger.info("Browser memory not available on this platform, stopping samples")
+                return
+            self.samples.append((max(tests, 0), memory))
+
+    def memory_report(self):
+        """
+        Summarize the memory samples
+
+        Returns:
+            dict: baseline and peak bytes, peak concurrent tests and bytes per concurrent test
+                  (memory above the baseline divided by running tests, averaged), or None without samples
+        """
+        if not self.samples:
+            return None
+        idle = [memory for tests, memory in self.samples if tests == 0]
+        baseline = min(idle) if idle else min(memory for _, memory in self.samples)
+        per_test = [(memory - baseline) / tests for tests, memory in self.samples if tests]
+        return {
+            "baseline": baseline,
+            "peak": max(memory for _, memory in self.samples),
+            "peak_tests": max(tests for tests, _ in self.samples),
+            "per_test": sum(per_test) / len(per_test) if per_test else None,
+            "samples": len(self.samples)
+        }
+
+
+class SharedBrowserClient:
+    """One worker's session in the shared browser, handing every test its own window"""
+
+    def __init__(self, address, driver_options):
+        """
+        Attach to the shared browser
+
+        Args:
+            address (str): Debugger address ("host:port")
+            driver_options (dict): Keyword arguments for DriverFactory.get_driver
+        """
+        self.driver = DriverFactory.get_driver(**driver_options, debugger_address=address)
+        self.home = self.driver.current_window_handle
+        self.window = None
+        self._context_id = None
+
+    def open_window(self):
+        """
+        Open a window in a new browser context and route the session's commands to it
+
+        Returns:
+            WebDriver: The worker's driver, switched to the new window on BASE_URL
+
+        Raises:
+            WebDriverException: If the browser cannot create isolated windows
+        """
+        self.driver.switch_to.window(self.home)
+        context = self.driver.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": True})
+        context_id = context["browserContextId"]
+        try:
+            target = self.driver.execute_cdp_cmd("Target.createTarget",
+                                                 {"url": BASE_URL, "browserContextId": context_id})
+            window = target["targetId"]
+            if window not in self.driver.window_handles:
+                raise WebDriverException("window of the new browser context is not visible to chromedriver")
+        except WebDriverException:
+            self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+            raise
+
+        self.window, self._context_id = window, context_id
+        self.driver.switch_to.window(window)
+        logger.debug("Opened window %s in browser context %s", window, context_id)
+        return self.driver
+
+    def close_window(self, driver):
+        """
+        Close the test's browser context, with its window and any windows the test opened
+
+        Args:
+            driver: Driver returned by open_window()
+        """
+        driver.switch_to.window(self.home)
+        context_id, self.window, self._context_id = self._context_id, None, None
+        driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+
+    def quit(self):
+        """Detach from the shared browser (chromedriver leaves an attached browser running)"""
+        if self._context_id:
+            try:
+                self.close_window(self.driver)
+            except WebDriverException as e:
+                logger.warning("Could not close browser context of the last test: %s", e)
+        self.driver.quit()
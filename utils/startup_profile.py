@@ -0,0 +1,152 @@
+"""
+Startup Profile - Pytest plugin reporting module import, collection and fixture setup cost
+
+Enabled with --startup-profile. Imports are timed from the moment conftest.py starts until
+collection ends (see utils/import_profiler.py), xdist workers send their measurements to the
+controller.
+"""
+import os
+import time
+import pytest
+from config.config import STARTUP_PROFILE_SIZE
+from utils.import_profiler import ImportProfiler, STARTUP_PROFILE_ENV
+import logging
+
+logger = logging.getLogger(__name__)
+
+startup_profile_key = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    """Add startup profiling command line option"""
+    parser.addoption(
+        "--startup-profile",
+        action="store_true",
+        default=False,
+        help="Report per-module import, collection and fixture setup cost"
+    )
+
+
+def pytest_configure(config):
+    """Start measuring collection and fixture setup"""
+    config.stash[startup_profile_key] = []
+    if not config.getoption("--startup-profile"):
+        return
+
+    profiler = ImportProfiler.active
+    if profiler is None:
+        # Option given through addopts / PYTEST_ADDOPTS, conftest imports were missed
+        profiler = ImportProfiler.active = ImportProfiler()
+        profiler.install()
+    # Inherited by xdist workers, which are started after configure
+    os.environ[STARTUP_PROFILE_ENV] = "1"
+    config.pluginmanager.register(StartupProfile(config, profiler), "startup_profile")
+
+
+class StartupProfile:
+    """Collects timings of one process and reports them at the end of the session"""
+
+    def __init__(self, config, profiler):
+        self.config = config
+        self.profiler = profiler
+        self.collect_files = {}
+        self.collection = None
+        self.first_test = None
+        self.fixtures = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self):
+        """Time the whole collection, then stop timing imports"""
+        start = time.perf_counter()
+        yield
+        self.collection = time.perf_counter() - start
+        # Startup ends here, imports while tests run are not startup cost
+        self.profiler.uninstall()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        """Time collection of each test file (includes importing it)"""
+        start = time.perf_counter()
+        yield
+        if isinstance(collector, pytest.Module):
+            self.collect_files[collector.nodeid] = time.perf_counter() - start
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        """Time fixture setup (up to the yield of generator fixtures)"""
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        row = self.fixtures.setdefault(fixturedef.argname, {"calls": 0, "total": 0.0, "max": 0.0})
+        row["calls"] += 1
+        row["total"] += elapsed
+        row["max"] = max(row["max"], elapsed)
+
+    def pytest_runtest_protocol(self):
+        """Note when the first test starts"""
+        if self.first_test is None:
+            self.first_test = time.perf_counter() - self.profiler.started
+
+    def pytest_sessionfinish(self):
+        """Hand the measurements to the xdist controller"""
+        profile = {
+            "worker": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            "modules": self.profiler.modules,
+            "collection": self.collection,
+            "collect_files": self.collect_files,
+            "first_test": self.first_test,
+            "fixtures": self.fixtures
+        }
+        if hasattr(self.config, "workeroutput"):
+            self.config.workeroutput["startup_profile"] = profile
+        else:
+            self.config.stash[startup_profile_key].insert(0, profile)
+
+    def pytest_testnodedown(self, node):
+        """Collect measurements sent by an xdist worker"""
+        profile = getattr(node, "workeroutput", {}).get("startup_profile")
+        if profile:
+            self.config.stash[startup_profile_key].append(profile)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print import, collection and fixture setup cost"""
+        profiles = self.config.stash[startup_profile_key]
+        if not profiles:
+            return
+
+        terminalreporter.write_sep("=", "startup profile")
+        for profile in profiles:
+            collection = f"{profile['collection']:.3f}s" if profile["collection"] is not None else "-"
+            first_test = f"{profile['first_test']:.3f}s" if profile["first_test"] is not None else "-"
+            terminalreporter.write_line(
+                f"{profile['worker']}: {len(profile['modules'])} modules imported, "
+                f"collection {collection}, first test started {first_test} after conftest import"
+            )
+
+        # Imports: slowest process per module, fixtures: summed over all workers
+        modules, collect_files, fixtures = {}, {}, {}
+        for profile in profiles:
+            for name, timing in profile["modules"].items():
+                if name not in modules or timing["self"] > modules[name]["self"]:
+                    modules[name] = timing
+            for nodeid, elapsed in profile["collect_files"].items():
+                collect_files[nodeid] = max(elapsed, collect_files.get(nodeid, 0.0))
+            for name, row in profile["fixtures"].items():
+                total = fixtures.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0})
+                total["calls"] += row["calls"]
+                total["total"] += row["total"]
+                total["max"] = max(total["max"], row["max"])
+
+        terminalreporter.write_line(f"{'self':>9} {'cumulative':>11}  module")
+        for name, timing in sorted(modules.items(), key=lambda item: -item[1]["self"])[:STARTUP_PROFILE_SIZE]:
+            terminalreporter.write_line(f"{timing['self']:8.3f}s {timing['cumulative']:10.3f}s  {name}")
+
+        if collect_files:
+            terminalreporter.write_line(f"{'collect':>9}  test file")
+            for nodeid, elapsed in sorted(collect_files.items(), key=lambda item: -item[1])[:STARTUP_PROFILE_SIZE]:
+                terminalreporter.write_line(f"{elapsed:8.3f}s  {nodeid}")
+
+        if fixtures:
+            terminalreporter.write_line(f"{'total':>9} {'max':>9} {'calls':>6}  fixture setup")
+            for name, row in sorted(fixtures.items(), key=lambda item: -item[1]["total"])[:STARTUP_PROFILE_SIZE]:
+                terminalreporter.write_line(f"{row['total']:8.3f}s {row['max']:8.3f}s {row['calls']:6d}  {name}")
@@ -0,0 +1,179 @@
+"""
+Step Timeline - Records duration, wait time and locator of every page object action per test
+"""
+import functools
+import inspect
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Timeline:
+    """Ordered list of timed steps for one test"""
+
+    # Timeline of the running test (None outside tests, recording is then skipped)
+    current = None
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.steps = []
+        self._open = []
+        # Number of page object calls made by the test itself (outermost steps)
+        self._outer_calls = 0
+
+    @classmethod
+    def start(cls):
+        """
+        Start recording a new test
+
+        Returns:
+            Timeline: The new current timeline
+        """
+        cls.current = cls()
+        return cls.current
+
+    @classmethod
+    def stop(cls):
+        """
+        Stop recording
+
+        Returns:
+            list: Recorded steps of the stopped timeline (empty if none was running)
+        """
+        timeline, cls.current = cls.current, None
+        return timeline.steps if timeline else []
+
+    @classmethod
+    def add_wait(cls, seconds):
+        """
+        Attribute time spent waiting to every step that is currently open
+
+        Args:
+            seconds (float): Time spent in a wait
+        """
+        if cls.current:
+            for step in cls.current._open:
+                step["wait"] += seconds
+
+    @classmethod
+    def outer_step_call(cls):
+        """
+        Identify the running call of the outermost open step, i.e. the page object method the
+        test called (repeated calls of one method get different numbers)
+
+        Returns:
+            tuple: (step name, call number within the test), or None if no step is open
+        """
+        if cls.current and cls.current._open:
+            return cls.current._open[0]["name"], cls.current._outer_calls
+        return None
+
+    def open_step(self, name, locator):
+        """Record the start of a step (steps nest when page methods call BasePage actions)"""
+        step = {
+            "name": name,
+            "locator": locator,
+            "depth": len(self._open),
+            "start": time.perf_counter() - self.started,
+            "duration": 0.0,
+            "wait": 0.0,
+            "error": None
+        }
+        if not self._open:
+            self._outer_calls += 1
+        self.steps.append(step)
+        self._open.append(step)
+        return step
+
+    def close_step(self, step, error=None):
+        """Record the end of a step"""
+        step["duration"] = time.perf_counter() - self.started - step["start"]
+        step["error"] = error
+        self._open.remove(step)
+
+
+def _describe_locator(args):
+    """Get 'by=value' if the first call argument is a (By, value) locator"""
+    if args and isinstance(args[0], tuple) and len(args[0]) == 2 and all(isinstance(part, str) for part in args[0]):
+        return f"{args[0][0]}={args[0][1]}"
+    return None
+
+
+def timed_step(func):
+    """
+    Decorator recording a page object method as a timeline step
+
+    Args:
+        func: Method to time (first argument after self may be a locator)
+
+    Returns:
+        callable: Wrapped method
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        timeline = Timeline.current
+        if timeline is None:
+            return func(self, *args, **kwargs)
+
+        step = timeline.open_step(name, _describe_locator(args))
+        try:
+            result = func(self, *args, **kwargs)
+        except Exception as e:
+            timeline.close_step(step, error=type(e).__name__)
+            raise
+        timeline.close_step(step)
+        return result
+
+    wrapper.timed_step = True
+    return wrapper
+
+
+def instrument(cls):
+    """
+    Time every public method defined directly on a page object class
+
+    Args:
+        cls: Page object class
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value) or getattr(value, "timed_step", False):
+            continue
+        setattr(cls, attr, timed_step(value))
+
+
+def summarize(timelines, limit):
+    """
+    Aggregate the slowest steps and locators over many tests
+
+    Args:
+        timelines (dict): Steps by test node id
+        limit (int): Number of rows per table
+
+    Returns:
+        tuple: (steps, locators) as lists of dicts with name, calls, total, max and wait, slowest first
+    """
+    by_step = {}
+    by_locator = {}
+    for steps in timelines.values():
+        # Locators of the enclosing steps, so get_text -> find_element counts the locator once
+        enclosing = []
+        for step in steps:
+            del enclosing[step["depth"]:]
+            locator = step["locator"] if step["locator"] not in enclosing else None
+            enclosing.append(step["locator"])
+            for key, table in ((step["name"], by_step), (locator, by_locator)):
+                if key is None:
+                    continue
+                row = table.setdefault(key, {"name": key, "calls": 0, "total": 0.0, "max": 0.0, "wait": 0.0})
+                row["calls"] += 1
+                row["total"] += step["duration"]
+                row["max"] = max(row["max"], step["duration"])
+                row["wait"] += step["wait"]
+
+    def slowest(table):
+        return sorted(table.values(), key=lambda row: -row["total"])[:limit]
+
+    return slowest(by_step), slowest(by_locator)
@@ -0,0 +1,502 @@
+"""
+Timing Database - Pytest plugin keeping the timings of every run in SQLite, and a CLI to query them
+
+Each run appends test phase durations, fixture setup / teardown times, driver launch
+times and step timings (timeline steps and page transitions) to TIMING_DB. xdist workers
+send fixture and driver timings to the controller, which writes the run once. Only runs
+with browser tests (tests using the driver fixture) are recorded, so unit test runs don't
+show up in the trends.
+
+Usage:
+    python -m utils.timing_db trend [TEST_ID] [--runs 10]
+    python -m utils.timing_db slower [--runs 10] [--threshold 20]
+    python -m utils.timing_db export TABLE [--test TEST_ID] [--since 2026-01-01] [--output file.csv]
+"""
+import argparse
+import csv
+import functools
+import sqlite3
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+import pytest
+from config.config import TIMING_DB, TIMING_DB_RUNS, TIMING_DB_SLOWDOWN_PCT
+import logging
+
+logger = logging.getLogger(__name__)
+
+timing_db_key = pytest.StashKey["TimingRecorder"]()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    duration REAL,
+    tests INTEGER,
+    workers INTEGER,
+    exitstatus INTEGER,
+    args TEXT
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    date TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    outcome TEXT,
+    setup REAL,
+    call REAL,
+    teardown REAL,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS fixtures (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    date TEXT NOT NULL,
+    test_id TEXT,
+    fixture TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS drivers (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    date TEXT NOT NULL,
+    test_id TEXT,
+    browser TEXT,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    date TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    depth INTEGER,
+    duration REAL
+);
+CREATE INDEX IF NOT EXISTS tests_test_id ON tests (test_id, date);
+CREATE INDEX IF NOT EXISTS tests_date ON tests (date);
+CREATE INDEX IF NOT EXISTS fixtures_test_id ON fixtures (test_id, date);
+CREATE INDEX IF NOT EXISTS fixtures_date ON fixtures (date);
+CREATE INDEX IF NOT EXISTS drivers_test_id ON drivers (test_id, date);
+CREATE INDEX IF NOT EXISTS drivers_date ON drivers (date);
+CREATE INDEX IF NOT EXISTS steps_test_id ON steps (test_id, date);
+CREATE INDEX IF NOT EXISTS steps_date ON steps (date);
+"""
+
+# Columns per table, without run_id and date (filled in when a run is added)
+COLUMNS = {
+    "tests": ("test_id", "outcome", "setup", "call", "teardown", "duration"),
+    "fixtures": ("test_id", "fixture", "phase", "duration"),
+    "drivers": ("test_id", "browser", "duration"),
+    "steps": ("test_id", "kind", "name", "depth", "duration"),
+}
+TABLES = ("runs",) + tuple(COLUMNS)
+
+
+class TimingDB:
+    """SQLite store of run timings (all durations in seconds)"""
+
+    def __init__(self, path=TIMING_DB):
+        """
+        Open the database, creating it on first use
+
+        Args:
+            path: Database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Shards of a split run may finish at the same time
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database"""
+        self.connection.close()
+
+    def add_run(self, run, rows):
+        """
+        Append one run
+
+        Args:
+            run (dict): date, duration, workers, exitstatus and args of the run
+            rows (dict): Row tuples per table, in COLUMNS order
+
+        Returns:
+            int: Run id
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (date, duration, tests, workers, exitstatus, args) VALUES (?, ?, ?, ?, ?, ?)",
+                (run["date"], run["duration"], len(rows.get("tests", [])), run["workers"],
+                 run["exitstatus"], run["args"])
+            )
+            run_id = cursor.lastrowid
+            for table, columns in COLUMNS.items():
+                self.connection.executemany(
+                    f"INSERT INTO {table} (run_id, date, {', '.join(columns)}) "
+                    f"VALUES (?, ?, {', '.join('?' * len(columns))})",
+                    [(run_id, run["date"]) + tuple(row) for row in rows.get(table, [])]
+                )
+        return run_id
+
+    def last_runs(self, runs):
+        """
+        Ids of the most recent runs
+
+        Args:
+            runs (int): Number of runs
+
+        Returns:
+            list: Run ids, oldest first
+        """
+        rows = self.connection.execute("SELECT id FROM runs ORDER BY id DESC LIMIT ?", (runs,)).fetchall()
+        return [row["id"] for row in reversed(rows)]
+
+    def trend(self, test_id=None, runs=TIMING_DB_RUNS):
+        """
+        Timings of the last runs, for the whole suite or for matching tests
+
+        Args:
+            test_id (str): Test id, may contain SQL LIKE wildcards (None = whole suite)
+            runs (int): Number of runs
+
+        Returns:
+            list: sqlite3.Row per run (suite) or per run and test
+        """
+        run_ids = self.last_runs(runs)
+        placeholders = ", ".join("?" * len(run_ids))
+        if test_id is None:
+            return self.connection.execute(
+                f"""
+                SELECT runs.id AS run_id, runs.date, runs.tests, runs.workers, runs.duration AS wall,
+                       (SELECT SUM(duration) FROM tests WHERE run_id = runs.id) AS test_time,
+                       (SELECT COUNT(*) FROM drivers WHERE run_id = runs.id) AS launches,
+                       (SELECT AVG(duration) FROM drivers WHERE run_id = runs.id) AS launch_avg
+                FROM runs WHERE runs.id IN ({placeholders}) ORDER BY runs.id
+                """,
+                run_ids
+            ).fetchall()
+        return self.connection.execute(
+            f"""
+            SELECT run_id, date, test_id, outcome, setup, call, teardown, duration FROM tests
+            WHERE test_id LIKE ? AND run_id IN ({placeholders}) ORDER BY test_id, run_id
+            """,
+            [test_id] + run_ids
+        ).fetchall()
+
+    def slower(self, runs=TIMING_DB_RUNS, threshold=TIMING_DB_SLOWDOWN_PCT):
+        """
+        Find tests whose latest passing run was slower than their median over the last runs
+
+        Args:
+            runs (int): Number of runs to look at
+            threshold (float): Allowed slowdown in percent
+
+        Returns:
+            list: dict with test_id, median, latest, change (percent) and runs, slowest change first
+        """
+        run_ids = self.last_runs(runs)
+        rows = self.connection.execute(
+            f"""
+            SELECT test_id, duration FROM tests
+            WHERE outcome = 'passed' AND run_id IN ({', '.join('?' * len(run_ids))}) ORDER BY run_id
+            """,
+            run_ids
+        ).fetchall()
+
+        durations = {}
+        for row in rows:
+            durations.setdefault(row["test_id"], []).append(row["duration"])
+
+        slower = []
+        for test_id, values in durations.items():
+            # Needs at least one earlier run to compare with
+            if len(values) < 2:
+                continue
+            median = statistics.median(values[:-1])
+            if median <= 0:
+                continue
+            change = (values[-1] - median) / median * 100
+            if change > threshold:
+                slower.append({"test_id": test_id, "median": median, "latest": values[-1],
+                               "change": change, "runs": len(values)})
+        return sorted(slower, key=lambda row: -row["change"])
+
+    def export_csv(self, table, output, test_id=None, since=None):
+        """
+        Write a table as CSV
+
+        Args:
+            table (str): One of TABLES
+            output: Writable text file
+            test_id (str): Only rows of matching tests (SQL LIKE pattern)
+            since (str): Only rows from this date on (YYYY-mm-dd)
+
+        Returns:
+            int: Number of rows written
+        """
+        if table not in TABLES:
+            raise ValueError(f"Unknown table '{table}'. Choose from {TABLES}")
+
+        conditions, params = [], []
+        if test_id is not None and table != "runs":
+            conditions.append("test_id LIKE ?")
+            params.append(test_id)
+        if since is not None:
+            conditions.append("date >= ?")
+            params.append(since)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self.connection.execute(f"SELECT * FROM {table}{where} ORDER BY rowid", params)
+
+        writer = csv.writer(output)
+        writer.writerow(column[0] for column in cursor.description)
+        count = 0
+        for row in cursor:
+            writer.writerow(tuple(row))
+            count += 1
+        return count
+
+
+def pytest_addoption(parser):
+    """Add timing database command line options"""
+    parser.addoption(
+        "--timing-db",
+        action="store",
+        default=str(TIMING_DB),
+        metavar="PATH",
+        help="SQLite file the run's timings are appended to"
+    )
+    parser.addoption(
+        "--no-timing-db",
+        action="store_true",
+        default=False,
+        help="Do not record this run in the timing database"
+    )
+
+
+def pytest_configure(config):
+    """Start recording timings"""
+    if config.getoption("--no-timing-db") or config.getoption("--collect-only"):
+        return
+    recorder = TimingRecorder(config)
+    config.stash[timing_db_key] = recorder
+    config.pluginmanager.register(recorder, "timing_recorder")
+
+
+class TimingRecorder:
+    """
+    Collects the timings of one process
+
+    Tests and steps are taken from the final reports (single process or xdist controller),
+    fixtures and driver launches where the tests run (single process or xdist worker).
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.started = time.perf_counter()
+        self.is_worker = hasattr(config, "workerinput")
+        self.nodeid = None
+        self.phases = {}
+        self.rows = {table: [] for table in COLUMNS}
+        self.workers = 0
+        # Any selected test uses a browser (set where the tests are collected)
+        self.browser_tests = False
+        # Time spent in fixtures set up by the fixture being set up, per nesting level
+        self._nested = []
+        self._teardown_started = {}
+
+    def pytest_collection_finish(self, session):
+        """Note whether the selected tests drive a browser"""
+        # Unit tests may have a fake "driver" fixture of their own
+        self.browser_tests = any("driver" in getattr(item, "fixturenames", ()) and not item.get_closest_marker("unit")
+                                 for item in session.items)
+
+    def pytest_runtest_logstart(self, nodeid):
+        """Note the running test (fixture and driver timings are attributed to it)"""
+        self.nodeid = nodeid
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef):
+        """Time fixture setup, excluding fixtures it requested (timed on their own)"""
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += elapsed
+        self.rows["fixtures"].append((self.nodeid, fixturedef.argname, "setup", elapsed - nested))
+        # Finalizers run last-in first-out: this one starts the teardown, pytest_fixture_post_finalizer ends it
+        fixturedef.addfinalizer(functools.partial(self._start_teardown, fixturedef))
+
+    def _start_teardown(self, fixturedef):
+        """Note when a fixture's teardown starts"""
+        self._teardown_started[id(fixturedef)] = time.perf_counter()
+
+    def pytest_fixture_post_finalizer(self, fixturedef):
+        """Time fixture teardown"""
+        start = self._teardown_started.pop(id(fixturedef), None)
+        if start is not None:
+            self.rows["fixtures"].append((self.nodeid, fixturedef.argname, "teardown", time.perf_counter() - start))
+
+    def pytest_runtest_logfinish(self, nodeid):
+        """Take driver launches that finished while the test ran (including background launches)"""
+        # Only loaded once a test created a driver
+        factory = sys.modules.get("utils.driver_factory")
+        if factory is None or not factory.DriverFactory.launches:
+            return
+        launches, factory.DriverFactory.launches[:] = list(factory.DriverFactory.launches), []
+        self.rows["drivers"].extend((nodeid, browser, seconds) for browser, seconds in launches)
+
+    def pytest_runtest_logreport(self, report):
+        """Record test phases and steps from the final reports"""
+        if self.is_worker:
+            return
+        phases = self.phases.setdefault(report.nodeid, {"outcome": "passed"})
+        phases[report.when] = report.duration
+        if report.failed:
+            phases["outcome"] = "failed"
+        elif report.skipped and phases["outcome"] == "passed":
+            phases["outcome"] = "skipped"
+
+        if report.when != "teardown":
+            return
+        self.rows["tests"].append((
+            report.nodeid, phases["outcome"], phases.get("setup"), phases.get("call"), phases.get("teardown"),
+            sum(phases.get(when, 0.0) for when in ("setup", "call", "teardown"))
+        ))
+        del self.phases[report.nodeid]
+
+        for key, value in report.user_properties:
+            if key == "timeline":
+                self.rows["steps"].extend(
+                    (report.nodeid, "step", step["name"], step["depth"], step["duration"]) for step in value
+                )
+            elif key == "browser_metrics":
+                self.rows["steps"].extend(
+                    (report.nodeid, "transition", transition["name"], 0, transition["duration_ms"] / 1000)
+                    for transition in value
+                )
+
+    def pytest_testnodedown(self, node):
+        """Collect fixture and driver timings sent by an xdist worker"""
+        self.workers += 1
+        rows = getattr(node, "workeroutput", {}).get("timing_db")
+        if rows:
+            self.browser_tests |= rows["browser_tests"]
+            self.rows["fixtures"].extend(rows["fixtures"])
+            self.rows["drivers"].extend(rows["drivers"])
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Hand timings to the xdist controller, or write the run"""
+        if self.is_worker:
+            self.config.workeroutput["timing_db"] = {
+                "fixtures": self.rows["fixtures"], "drivers": self.rows["drivers"],
+                "browser_tests": self.browser_tests
+            }
+            return
+        if not self.rows["tests"]:
+            return
+        if not self.browser_tests:
+            # Unit tests only, not comparable with the suite runs in the history
+            logger.debug("No browser tests in this run, not recording it in the timing database")
+            return
+
+        run = {
+            "date": self.date,
+            "duration": time.perf_counter() - self.started,
+            "workers": self.workers or 1,
+            "exitstatus": int(exitstatus),
+            "args": " ".join(self.config.invocation_params.args)
+        }
+        try:
+            db = TimingDB(self.config.getoption("--timing-db"))
+            try:
+                run_id = db.add_run(run, self.rows)
+            finally:
+                db.close()
+        except sqlite3.Error as e:
+            logger.warning("Could not record run in timing database: %s", e)
+            return
+        logger.info("Recorded run %s (%s tests) in %s", run_id, len(self.rows["tests"]), db.path)
+
+
+def print_table(headers, rows):
+    """Print rows as aligned columns"""
+    widths = [max(len(str(value)) for value in column) for column in zip(headers, *rows)]
+    for row in (headers, *rows):
+        print("  ".join(str(value).rjust(width) for value, width in zip(row, widths)))
+
+
+def seconds(value):
+    """Format seconds for tables"""
+    return "-" if value is None else f"{value:.2f}s"
+
+
+def main():
+    """Query the timing database"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=str(TIMING_DB), help="Database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    trend = commands.add_parser("trend", help="Suite (or test) timings over the last runs")
+    trend.add_argument("test_id", nargs="?", help="Test id, %% matches any characters")
+    trend.add_argument("--runs", type=int, default=TIMING_DB_RUNS, help="Number of runs")
+
+    slower = commands.add_parser("slower", help="Tests slower than their median (exit code 1 if any)")
+    slower.add_argument("--runs", type=int, default=TIMING_DB_RUNS, help="Number of runs to compare")
+    slower.add_argument("--threshold", type=float, default=TIMING_DB_SLOWDOWN_PCT, help="Slowdown in percent")
+
+    export = commands.add_parser("export", help="Export a table as CSV")
+    export.add_argument("table", choices=TABLES)
+    export.add_argument("--test", dest="test_id", help="Test id, %% matches any characters")
+    export.add_argument("--since", help="Only rows from this date on (YYYY-mm-dd)")
+    export.add_argument("--output", help="CSV file (default: stdout)")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"No timing database at {args.db}, run the tests first", file=sys.stderr)
+        return 2
+    db = TimingDB(args.db)
+    try:
+        if args.command == "trend" and args.test_id is None:
+            print_table(
+                ("run", "date", "tests", "workers", "wall", "test time", "launches", "avg launch"),
+                [(row["run_id"], row["date"], row["tests"], row["workers"], seconds(row["wall"]),
+                  seconds(row["test_time"]), row["launches"], seconds(row["launch_avg"]))
+                 for row in db.trend(runs=args.runs)]
+            )
+        elif args.command == "trend":
+            print_table(
+                ("run", "date", "outcome", "setup", "call", "teardown", "total", "test"),
+                [(row["run_id"], row["date"], row["outcome"], seconds(row["setup"]), seconds(row["call"]),
+                  seconds(row["teardown"]), seconds(row["duration"]), row["test_id"])
+                 for row in db.trend(args.test_id, args.runs)]
+            )
+        elif args.command == "slower":
+            rows = db.slower(args.runs, args.threshold)
+            if not rows:
+                print(f"No test more than {args.threshold:.0f}% slower than its median over the last {args.runs} runs")
+                return 0
+            print_table(
+                ("median", "latest", "change", "runs", "test"),
+                [(seconds(row["median"]), seconds(row["latest"]), f"+{row['change']:.0f}%", row["runs"],
+                  row["test_id"]) for row in rows]
+            )
+            return 1
+        elif args.output:
+            with open(args.output, "w", newline="") as f:
+                count = db.export_csv(args.table, f, args.test_id, args.since)
+            print(f"Exported {count} rows to {args.output}")
+        else:
+            db.export_csv(args.table, sys.stdout, args.test_id, args.since)
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Wait Engine - Event-driven waits resolved inside the page by a MutationObserver
+"""
+import time
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from utils.dom import WAIT_SCRIPT
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Longest single script call, kept below the driver's default 30s script timeout
+MAX_SCRIPT_WAIT = 25
+# Pause before observing again after the script failed (document unloading or still loading)
+RETRY_INTERVAL = 0.1
+
+
+class ObserverWait:
+    """Waits for a locator condition with one async script call instead of 500ms polling"""
+
+    # Conditions the page script can evaluate
+    CONDITIONS = ("visible", "clickable", "present_all", "shown", "absent")
+
+    def __init__(self, driver, timeout):
+        """
+        Initialize wait
+
+        Args:
+            driver: WebDriver instance
+            timeout: Maximum wait time in seconds
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    def until(self, locator, condition):
+        """
+        Wait for a condition on a locator
+
+        Args:
+            locator: Tuple of (By, value)
+            condition (str): One of CONDITIONS
+
+        Returns:
+            WebElement for visible/clickable, list of WebElements for present_all, True otherwise
+
+        Raises:
+            TimeoutException: If the condition is not met in time
+        """
+        by, value = locator
+        deadline = time.monotonic() + self.timeout
+
+        # Always check at least once, so a zero timeout still sees the current page
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            try:
+                outcome = self.driver.execute_async_script(
+                    WAIT_SCRIPT, by, value, condition, int(min(remaining, MAX_SCRIPT_WAIT) * 1000)
+                )
+            except JavascriptException as e:
+                if "unload" not in str(e.msg):
+                    raise
+                # The page navigated away while the observer was waiting, observe the new document
+                logger.debug("Document unloaded while waiting for %s, retrying", locator)
+                outcome = None
+            except TimeoutException:
+                # Script timeout (e.g. page still loading), retry until our own deadline
+                logger.debug("Observer script timed out for %s, retrying", locator)
+                outcome = None
+
+            if outcome and outcome.get("found"):
+                return outcome["result"]
+            if time.monotonic() >= deadline:
+                break
+            if outcome is None:
+                # The failed call returned at once, don't hammer the driver while the page settles
+                time.sleep(min(RETRY_INTERVAL, max(deadline - time.monotonic(), 0)))
+
+        raise TimeoutException(f"Timed out after {self.timeout}s waiting for {condition}: {locator}")